@@ -1,4 +1,6 @@
 # To get relative imports to work
 import os, sys
 
-sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+_dir_name = os.path.dirname(os.path.realpath(__file__))
+if _dir_name not in sys.path:
+    sys.path.append(_dir_name)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import argparse
+import subprocess
+
+BENCH_DIR = os.path.abspath(os.path.dirname(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+
+#
+# Import time benchmark for the command line scripts
+#
+# Usage: bench/import_time.py [--script <name>] [--budget_ms <ms>]
+#                             [--repeat <n>] [--top <n>]
+#
+# Imports the script (run by default) under python -X importtime in a fresh
+# interpreter and reports the cumulative import time of the script, which
+# covers everything it imports at startup. The median of the repeats is
+# compared against the budget and the exit status is 1 if it's over budget.
+# The slowest imports of the last repeat are printed to help find the
+# culprit.
+#
+
+# Median import time budget of run.py in ms
+BUDGET_MS = 75.0
+
+# Modules that should only be imported once a memory is created or an option
+# that needs them is given (full names or the last part of the name)
+LAZY_MODULES = [
+    "single_port_ram",
+    "dual_port_ram",
+    "single_port_regfile",
+    "dual_port_regfile",
+    "liberty_exporter",
+    "verilog_exporter",
+    "lef_exporter",
+    "generation_server",
+    "pin_layout_cache",
+    "geometry_checker",
+    "concurrent.futures",
+    "traceback",
+    "cProfile",
+    "hashlib",
+]
+
+
+def parse_import_times(stderr):
+    """
+    Returns a list of (name, depth, self_us, cumulative_us) from the -X
+    importtime output
+    """
+
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # The header line
+            continue
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    return records
+
+
+def measure(script="run"):
+    """Imports the script in a fresh interpreter and returns the records"""
+
+    code = f"import sys; sys.path.insert(0, {ROOT_DIR!r}); import {script}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_times(result.stderr)
+
+
+def get_script_time_us(records, script="run"):
+    """Returns the cumulative import time of the script in us"""
+
+    for name, depth, _, cumulative_us in records:
+        if name == script and depth == 0:
+            return cumulative_us
+    raise Exception(f"{script} not found in the import times")
+
+
+def get_eager_lazy_modules(records):
+    """Returns the modules in LAZY_MODULES that were imported"""
+
+    names = {name for name, _, _, _ in records}
+    names |= {name.rpartition(".")[2] for name in names}
+    return [name for name in LAZY_MODULES if name in names]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Script import time benchmark")
+    parser.add_argument("--script", default="run", help="Script module to import")
+    parser.add_argument(
+        "--budget_ms",
+        "--budget-ms",
+        type=float,
+        default=BUDGET_MS,
+        help="Import time budget in ms",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Number of repeats")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to print")
+    args = parser.parse_args()
+
+    times_us = []
+    for _ in range(args.repeat):
+        records = measure(args.script)
+        times_us.append(get_script_time_us(records, args.script))
+    median_ms = sorted(times_us)[len(times_us) // 2] / 1000.0
+    print(f"{args.script}: {median_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+    for name, depth, self_us, cumulative_us in sorted(
+        records, key=lambda record: record[2], reverse=True
+    )[: args.top]:
+        self_ms = self_us / 1000.0
+        cumulative_ms = cumulative_us / 1000.0
+        print(f"  {self_ms:8.2f} ms self {cumulative_ms:8.2f} ms {name}")
+
+    status = 0
+    eager_modules = get_eager_lazy_modules(records)
+    if eager_modules:
+        print(f"Error: imported at startup: {', '.join(eager_modules)}")
+        status = 1
+    if median_ms > args.budget_ms:
+        print("Error: over the import time budget")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
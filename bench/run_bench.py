@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import time
+import fnmatch
+import argparse
+import platform
+import resource
+import tempfile
+import subprocess
+
+BENCH_DIR = os.path.abspath(os.path.dirname(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+TEST_CFG_DIR = os.path.join(ROOT_DIR, "test", "cfg")
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, "utils"))
+from class_process import Process
+from timing_data import TimingData
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from run_utils import RunUtils
+
+#
+# Throughput benchmarks for memory generation
+#
+# Usage: bench/run_bench.py [--baseline <baseline_json>] [--write_baseline]
+#                           [--threshold <fraction>] [--cases <pattern> ...]
+#                           [--list]
+#
+# Each case runs in its own Python process (so the peak RSS is per case) and
+# reports:
+#   ops_per_sec - memories created and written (all views) per second
+#   bytes_per_sec - bytes of output written per second
+#   peak_rss_kb - peak resident set size of the process
+#
+# The results are compared against the baseline (bench/baseline.json by
+# default) and any case that is slower (or uses more memory) by more than the
+# threshold is reported as a regression, in which case the exit status is 1.
+# Use --write_baseline (or --update) to write the results as the new baseline
+# instead. Without a baseline there is nothing to compare against, so the run
+# stops with exit status 2 unless --write_baseline is given.
+#
+# The cases are:
+#   <RAM|RF>_<SP|DP>_<small|medium|huge> - one memory of each type and size
+#   config_1000 - 1000 single port RAMs of assorted sizes
+#   ss_pins_<n> - spreadsheet memories with n data bits
+#
+
+# width, depth, banks and number of repetitions of each matrix size
+MATRIX_SIZES = {
+    "small": (32, 64, 1, 50),
+    "medium": (256, 1024, 2, 10),
+    "huge": (2048, 8192, 4, 2),
+}
+SS_DATA_BITS = [64, 512, 2048]
+
+
+def get_process():
+    """Returns the process used by all cases"""
+    config_file_name = os.path.join(TEST_CFG_DIR, "spsram_example.cfg")
+    return Process(RunUtils.get_config(config_file_name))
+
+
+def write_memories(mem_configs, memory_type, port_config, output_dir):
+    """Creates and writes the memories and returns the number of bytes written"""
+
+    process = get_process()
+    timing_data = TimingData()
+    for mem_config in mem_configs:
+        memory = MemoryFactory.create(
+            mem_config, memory_type, port_config, process, timing_data
+        )
+        RunUtils.write_memory(memory, output_dir)
+    return get_dir_size(output_dir)
+
+
+def get_dir_size(dir_name):
+    """Returns the total size of the files under the directory"""
+
+    total = 0
+    for root, dirs, files in os.walk(dir_name):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total
+
+
+def run_matrix_case(memory_type, port_config, size, repeat, output_dir):
+    """Returns the (ops, bytes) of a matrix case"""
+
+    (width, depth, banks, default_repeat) = MATRIX_SIZES[size]
+    repeat = repeat or default_repeat
+    mem_configs = [
+        MemoryConfig(f"bench_{index}", width, depth, banks, 0)
+        for index in range(repeat)
+    ]
+    num_bytes = write_memories(mem_configs, memory_type, port_config, output_dir)
+    return (len(mem_configs), num_bytes)
+
+
+def run_config_1000_case(repeat, output_dir):
+    """Returns the (ops, bytes) of 1000 assorted single port RAMs"""
+
+    sizes = [
+        (8, 64),
+        (16, 128),
+        (21, 64),
+        (32, 256),
+        (39, 2048),
+        (46, 32),
+        (64, 256),
+        (128, 512),
+        (256, 1024),
+        (512, 4096),
+    ]
+    mem_configs = [
+        MemoryConfig(
+            f"bench_{index}",
+            sizes[index % len(sizes)][0],
+            sizes[index % len(sizes)][1],
+            1 + index % 2,
+            0,
+        )
+        for index in range(repeat or 1000)
+    ]
+    return (len(mem_configs), write_memories(mem_configs, "RAM", "SP", output_dir))
+
+
+def write_ss_inputs(data_bits, output_dir):
+    """
+    Writes a synthetic spreadsheet physical and metrics CSV for a single port
+    RAM with data_bits data bits and 256 words, and returns their file names
+    """
+
+    name = f"ss_bench_{data_bits}"
+    addr_bits = 8
+    pitch = 0.048
+    pins = [f"addr_i[{bit}]" for bit in range(addr_bits)]
+    pins += [f"din_i[{bit}]" for bit in range(data_bits)]
+    pins += [f"dout_o[{bit}]" for bit in range(data_bits)]
+    pins += ["we_i", "clk"]
+    width = 20.0
+    height = round((len(pins) + 4) * pitch * 2, 3)
+    physical_file_name = os.path.join(output_dir, name + "_physical.csv")
+    with open(physical_file_name, "w") as out_fh:
+        out_fh.write("MACRO,SIZE_WIDTH,SIZE_HEIGHT,SOURCE,PIN,USE,LAYER,x1,y1,x2,y2\n")
+        prefix = f"{name},{width},{height}"
+        for index, pin in enumerate(pins):
+            use = "CLOCK" if pin == "clk" else "SIGNAL"
+            y = (index + 1) * pitch * 2
+            out_fh.write(
+                f"{prefix},PIN,{pin},{use},M4,0.000,{y:.3f},0.024,{y + 0.024:.3f}\n"
+            )
+        out_fh.write(f"{prefix},PIN,VDD,POWER,M5,1.0,0.1,19.0,0.2\n")
+        out_fh.write(f"{prefix},PIN,VSS,GROUND,M5,1.0,0.3,19.0,0.4\n")
+        for layer in ["M1", "M2", "M3", "M4"]:
+            out_fh.write(f"{prefix},OBS,,,{layer},0.1,0.1,19.9,{height - 0.1:.3f}\n")
+    metrics_file_name = os.path.join(output_dir, name + "_metrics.csv")
+    with open(metrics_file_name, "w") as out_fh:
+        out_fh.write(
+            "NumWords,NumBits,compiler_name,memory_name,NumBanks,pin cap (pf),"
+            "setup time (ns),hold time (ns),access time (ns),cycle time (ns),"
+            "static power (uW),dynamic power (uW/MHz)\n"
+        )
+        out_fh.write(
+            f"256,{data_bits},fake_compiler,{name},1,0.005,0.053,0.075,0.319,"
+            "0.456,1.639,3.456\n"
+        )
+    return (physical_file_name, metrics_file_name)
+
+
+def run_ss_case(data_bits, repeat, output_dir):
+    """Returns the (ops, bytes) of a spreadsheet case"""
+
+    # Only the spreadsheet cases need spreadsheet_ram (and its csv and
+    # mapping imports)
+    from spreadsheet_ram import SSRAMGenerator
+
+    input_dir = os.path.join(output_dir, "inputs")
+    os.makedirs(input_dir)
+    (physical_file_name, metrics_file_name) = write_ss_inputs(data_bits, input_dir)
+    results_dir = os.path.join(output_dir, "results")
+    generator = SSRAMGenerator(
+        os.path.join(TEST_CFG_DIR, "spsram_example.cfg"),
+        os.path.join(TEST_CFG_DIR, "csv_map.py"),
+        False,
+    )
+    repeat = repeat or 3
+    for index in range(repeat):
+        mem = generator.create_memory(metrics_file_name, physical_file_name)
+        RunUtils.write_memory(mem, results_dir)
+    return (repeat, get_dir_size(results_dir))
+
+
+def get_case_names():
+    """Returns the names of all of the cases"""
+
+    names = [
+        f"{memory_type}_{port_config}_{size}"
+        for memory_type in ["RAM", "RF"]
+        for port_config in ["SP", "DP"]
+        for size in MATRIX_SIZES
+    ]
+    names.append("config_1000")
+    names += [f"ss_pins_{data_bits}" for data_bits in SS_DATA_BITS]
+    return names
+
+
+def run_case(name, repeat):
+    """Runs the case in this process and returns its results"""
+
+    with tempfile.TemporaryDirectory(prefix="fakeram_bench_") as output_dir:
+        start = time.perf_counter()
+        if name == "config_1000":
+            (ops, num_bytes) = run_config_1000_case(repeat, output_dir)
+        elif name.startswith("ss_pins_"):
+            data_bits = int(name[len("ss_pins_") :])
+            (ops, num_bytes) = run_ss_case(data_bits, repeat, output_dir)
+        else:
+            (memory_type, port_config, size) = name.split("_")
+            (ops, num_bytes) = run_matrix_case(
+                memory_type, port_config, size, repeat, output_dir
+            )
+        elapsed = time.perf_counter() - start
+    return {
+        "ops": ops,
+        "bytes": num_bytes,
+        "seconds": elapsed,
+        "ops_per_sec": ops / elapsed,
+        "bytes_per_sec": num_bytes / elapsed,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def run_case_subprocess(name, repeat):
+    """Runs the case in a new Python process and returns its results"""
+
+    cmd = [sys.executable, os.path.abspath(__file__), "--case", name]
+    if repeat:
+        cmd += ["--repeat", str(repeat)]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns the list of regression messages of the results compared to the
+    baseline
+    """
+
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("cases", {}).get(name)
+        if not base:
+            continue
+        for metric in ["ops_per_sec", "bytes_per_sec"]:
+            if base[metric] and result[metric] < base[metric] * (1 - threshold):
+                regressions.append(
+                    "{}: {} {:.1f} < baseline {:.1f}".format(
+                        name, metric, result[metric], base[metric]
+                    )
+                )
+        if result["peak_rss_kb"] > base["peak_rss_kb"] * (1 + threshold):
+            regressions.append(
+                "{}: peak_rss_kb {} > baseline {}".format(
+                    name, result["peak_rss_kb"], base["peak_rss_kb"]
+                )
+            )
+    return regressions
+
+
+def main():
+    """Main driver"""
+
+    parser = argparse.ArgumentParser(description="Memory generation benchmarks")
+    parser.add_argument(
+        "--baseline",
+        default=os.path.join(BENCH_DIR, "baseline.json"),
+        help="Baseline JSON file",
+    )
+    parser.add_argument(
+        "--write_baseline",
+        "--update",
+        action="store_true",
+        help="Write the results as the new baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Fraction a metric may be worse than the baseline (default 0.2)",
+    )
+    parser.add_argument(
+        "--cases", nargs="+", default=["*"], help="Glob patterns of the cases to run"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=0,
+        help="Override the number of memories per case",
+    )
+    parser.add_argument("--list", action="store_true", help="List the cases")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.repeat)))
+        return
+    names = [
+        name
+        for name in get_case_names()
+        if any(fnmatch.fnmatch(name, pattern) for pattern in args.cases)
+    ]
+    if args.list:
+        print("\n".join(names))
+        return
+    if not args.write_baseline and not os.path.exists(args.baseline):
+        print(
+            f"Warning: no baseline {args.baseline}, so there is nothing to "
+            "compare against. Run with --write_baseline to create it",
+            file=sys.stderr,
+        )
+        sys.exit(2)
+
+    results = {}
+    print(f"{'case':<16} {'ops/sec':>10} {'MB/sec':>10} {'peak RSS MB':>12}")
+    for name in names:
+        result = run_case_subprocess(name, args.repeat)
+        results[name] = result
+        print(
+            "{:<16} {:>10.2f} {:>10.2f} {:>12.1f}".format(
+                name,
+                result["ops_per_sec"],
+                result["bytes_per_sec"] / 1e6,
+                result["peak_rss_kb"] / 1024,
+            )
+        )
+
+    if args.write_baseline:
+        baseline = {
+            "version": 1,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cases": results,
+        }
+        with open(args.baseline, "w") as out_fh:
+            json.dump(baseline, out_fh, indent=2, sort_keys=True)
+        print(f"Wrote baseline {args.baseline}")
+        return
+    with open(args.baseline) as in_fh:
+        baseline = json.load(in_fh)
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"Regression: {regression}")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions beyond {args.threshold:.0%} of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
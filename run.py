@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import argparse
 
-from utils.run_utils import RunUtils
-from utils.class_process import Process
-from utils.memory_config import MemoryConfig
-from utils.memory_factory import MemoryFactory
-from utils.timing_data import TimingData
+from utils.batch_runner import BatchRunner
+from utils.config_validator import ConfigValidator
+from utils.shard_planner import ShardPlanner
+
+# Imported without the utils prefix (the utils package adds itself to the
+# path) so that they are the same modules the utils modules use, which share
+# the active profiler and check for SramSweep, and aren't imported twice
+from profiler import Profiler
+from sram_sweep import SramSweep
+from run_utils import RunUtils
+from verilog_options import VerilogOptions
+from manifest import Manifest
 
 
 def get_args() -> argparse.Namespace:
@@ -20,7 +28,11 @@ def get_args() -> argparse.Namespace:
     flows where either an SRAM generator is not available or doesn't
     exist.  """
     )
-    parser.add_argument("config", help="JSON configuration file")
+    parser.add_argument(
+        "config",
+        nargs="?",
+        help="JSON configuration file (optional with --serve, which preloads it)",
+    )
     parser.add_argument(
         "--output_dir",
         action="store",
@@ -28,28 +40,245 @@ def get_args() -> argparse.Namespace:
         required=False,
         default="results",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--check_geometry",
+        action="store_true",
+        help="Check the pin and obstruction shapes of each memory after writing it",
+    )
+    parser.add_argument(
+        "--validate_only",
+        "--validate-only",
+        action="store_true",
+        help="Check the whole config, report every problem and exit",
+    )
+    parser.add_argument(
+        "--verilog_flavor",
+        "--verilog-flavor",
+        choices=VerilogOptions.verilog_flavors,
+        help="Verilog model flavor (overrides verilog_flavor in the config)",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="REPORT",
+        help="Time each stage of each memory and write the report (.json or .csv)",
+    )
+    parser.add_argument(
+        "--cprofile",
+        metavar="FILE",
+        help="Run under cProfile and write the stats to FILE (see pstats)",
+    )
+    parser.add_argument(
+        "--profile_top",
+        "--profile-top",
+        type=int,
+        default=10,
+        help="Number of slowest memories to print with --profile",
+    )
+    parser.add_argument(
+        "--serve",
+        metavar="SOCKET",
+        help="Serve JSON generation requests on the Unix domain socket "
+        "(see utils/generation_server.py)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 4,
+        help="Number of worker threads with --serve",
+    )
+    parser.add_argument(
+        "--keep_going",
+        "--keep-going",
+        action="store_true",
+        help="Keep generating the other srams when one fails, write the failures "
+        "to the error report and exit with an error",
+    )
+    parser.add_argument(
+        "--error_report",
+        "--error-report",
+        metavar="FILE",
+        help="JSON error report written with --keep_going when srams fail "
+        "(default: <output_dir>/errors.json)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of processes that generate the srams (--profile only "
+        "covers the main process with more than one)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        help="Number of threads that generate the srams in a single process, "
+        "sharing the process data (can't be combined with --jobs)",
+    )
+    parser.add_argument(
+        "--writers",
+        type=int,
+        default=2,
+        help="Number of threads that write the files while the next srams are "
+        "rendered, with a single job (0 writes them in the main thread)",
+    )
+    parser.add_argument(
+        "--no_dedup",
+        "--no-dedup",
+        action="store_true",
+        help="Create and render every sram, even the ones that only differ by "
+        "name from another",
+    )
+    parser.add_argument(
+        "--pin_cache_dir",
+        "--pin-cache-dir",
+        metavar="DIR",
+        help="Also keep the computed pin and strap layouts in DIR, so that later "
+        "runs and other processes reuse them",
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="i/N",
+        help="Only generate shard i (0-based) of N, balanced on the pin counts, "
+        "and write a partial manifest to the output directory",
+    )
+    parser.add_argument(
+        "--merge_manifests",
+        "--merge-manifests",
+        action="store_true",
+        help="Merge the partial manifests of all shards in the output directory "
+        "into manifest.json",
+    )
+    args = parser.parse_args()
+    if not args.config and not args.serve and not args.merge_manifests:
+        parser.error(
+            "the config is required unless --serve or --merge_manifests is given"
+        )
+    if args.jobs > 1 and args.threads > 1:
+        parser.error("--jobs and --threads can't be combined")
+    return args
+
+
+def serve(args: argparse.Namespace):
+    # The server (and socket) is only imported with --serve
+    from generation_server import GenerationServer
+
+    server = GenerationServer(args.serve, args.workers)
+    if args.config:
+        server.warm(RunUtils.get_config(args.config))
+    print(f"Serving on {args.serve} with {args.workers} workers")
+    server.serve()
 
 
 def main(args: argparse.Namespace):
-    json_data = RunUtils.get_config(args.config)
-    # Create a process object (shared by all srams)
-    process = Process(json_data)
-    timing_data = TimingData(json_data)
-
-    memory_type = json_data.get("memory_type", "RAM")
-    port_config = json_data.get("port_configuration", "SP")
-
-    # Go through each sram and generate the lib, lef and v files
-    for sram_data in json_data["srams"]:
-        mem_config = MemoryConfig.from_json(sram_data)
-        memory = MemoryFactory.create(
-            mem_config, memory_type, port_config, process, timing_data
+    if args.serve:
+        serve(args)
+        return
+    if args.merge_manifests:
+        print(f"Wrote {Manifest.merge(args.output_dir)}")
+        return
+    if args.profile:
+        Profiler().activate()
+    if args.pin_cache_dir:
+        # Only needed with --pin_cache_dir (imported without the utils prefix
+        # for the same reason as Profiler)
+        from pin_layout_cache import PinLayoutCache
+
+        PinLayoutCache.set_cache_dir(args.pin_cache_dir)
+    with Profiler.active_stage("", "config"):
+        json_data = RunUtils.get_config(args.config)
+        config_hash = RunUtils.get_config_hash(
+            RunUtils.get_config_files(args.config, json_data)
+        )
+    if args.verilog_flavor:
+        json_data["verilog_flavor"] = args.verilog_flavor
+    # The sweep entries are expanded as the srams are read
+    if "srams" in json_data:
+        json_data["srams"] = SramSweep(json_data["srams"])
+
+    # Report the problems of every sram before generating any of them. With
+    # --keep_going the srams that fail are reported again by the runner, unless
+    # the problem is with the config-level keys, which every sram needs
+    with Profiler.active_stage("", "validate"):
+        validator = ConfigValidator(json_data)
+        problems = validator.validate()
+    for problem in problems:
+        print(f"Error: {ConfigValidator.format_problem(problem)}")
+    config_problems = [problem for problem in problems if problem["index"] is None]
+    if problems and (args.validate_only or not args.keep_going or config_problems):
+        sys.exit(f"Error: found {len(problems)} problems in {args.config}")
+    num_srams = validator.get_num_srams()
+    if args.validate_only:
+        print(f"{args.config}: {num_srams} srams, no problems found")
+        return
+
+    # The runner creates the process object (shared by all srams)
+    runner = BatchRunner(
+        json_data,
+        args.output_dir,
+        args.check_geometry,
+        args.keep_going,
+        args.jobs,
+        args.writers,
+        args.threads,
+    )
+
+    # Keep the srams of this shard (the shards are balanced on the pin count).
+    # The srams are a SramSweep (over a list or a SramStream), which is read
+    # again by each pass
+    srams = json_data["srams"]
+    selected = None
+    num_selected = num_srams
+    shard_planner = None
+    if args.shard:
+        shard_planner = ShardPlanner.from_string(args.shard)
+        costs = [runner.get_cost(sram_data) for sram_data in srams]
+        selected = set(shard_planner.select(costs))
+        num_selected = len(selected)
+        print(f"Shard {shard_planner.get_name()}: {num_selected} of {num_srams} srams")
+    manifest = Manifest(args.output_dir, shard_planner, config_hash)
+
+    def get_pairs():
+        """Returns a generator of the (index, srams[] entry) pairs to generate"""
+        return (
+            (index, sram_data)
+            for index, sram_data in enumerate(srams)
+            if selected is None or index in selected
+        )
+
+    # The srams that only differ by name from an earlier one are written by
+    # replacing the name in the files of that one
+    if not args.no_dedup:
+        runner.find_copies(get_pairs())
+        if runner.get_num_copies():
+            print(f"Writing {runner.get_num_copies()} srams as renamed copies")
+
+    # Go through each sram and generate the lib, lef and v files. The timing
+    # data of each sram is scaled as the srams are read (all of them share
+    # the same TimingData if the config doesn't have a timing model)
+    runner.run(runner.iter_items(get_pairs()), manifest)
+    manifest.write()
+    Profiler.finish(args.profile, args.profile_top)
+
+    errors = []
+    failures = runner.get_failures()
+    error_report = args.error_report or os.path.join(args.output_dir, "errors.json")
+    if failures:
+        runner.write_error_report(error_report, num_selected)
+        errors.append(
+            f"{len(failures)} of {num_selected} srams failed (see {error_report})"
         )
-        RunUtils.write_memory(memory, args.output_dir)
+    elif os.path.exists(error_report):
+        # Left by an earlier run
+        os.remove(error_report)
+    num_violations = runner.get_num_violations()
+    if num_violations:
+        errors.append(f"found {num_violations} geometry violations")
+    if errors:
+        sys.exit(f"Error: {'; '.join(errors)}")
 
 
 ### Entry point
 if __name__ == "__main__":
     args = get_args()
-    main(args)
+    Profiler.run(lambda: main(args), args.cprofile)
@@ -14,6 +14,14 @@ from utils.rw_port_group import RWPortGroup
 from utils.ss_port_creator import SSPortCreator
 from utils.ss_port_organizer import SSPortOrganizer
 from utils.single_port_ssram import SinglePortSSRAM
+from utils.mapping_cache import MappingCache
+from utils.shard_planner import ShardPlanner
+from utils.manifest import Manifest
+
+# Imported without the utils prefix (the utils package adds itself to the
+# path) so that it is the same module the utils modules use, which share the
+# active profiler
+from profiler import Profiler
 
 # TODO
 # support reg file
@@ -21,26 +29,52 @@ from utils.single_port_ssram import SinglePortSSRAM
 #
 # Class to generate a single port RAM from customer-specific spreadsheet input
 #
-# Usage: spreadsheet_ram.py --config <fakeram_config> --physical <physical_csv>
+# Usage: spreadsheet_ram.py --config <fakeram_config>
+#                           --physical <physical_csv> [<physical_csv> ...]
 #                           --mem_config <metrics_csv>
 #                           --mapping <custom_mapping> --output_dir <output_dir>
+#                           [--no_mapping_cache] [--merge_obs]
+#                           [--check_geometry] [--shard <i/N>]
+#                           [--profile <report>] [--cprofile <stats_file>]
+#                           [--profile_top <n>]
 #
 # where
 #   fakeram_config - standard FakeRAM2.0 JSON config
 #   physical_csv - CSV file containing physical data such as size, pins (layer
-#                  and rect) and obstructions
+#                  and rect) and obstructions. Give several to generate a
+#                  batch of macros, whose metrics are all in the metrics_csv
 #   metrics_csv - CSV file containing power and timing characteristics
 #   custom_mapping - Python3 file containing two mapping routines that are
 #                    custom-specific (see below)
 #   output_dir - output directory name
 #
+# The maps returned by the custom mapping file are cached beside it (see
+# MappingCache), so that later runs don't have to execute it again. Use
+# --no_mapping_cache to always execute the mapping file.
+#
+# Use --merge_obs to merge the overlapping or abutting obstruction rects on
+# each layer before writing the LEF. Use --check_geometry to check the pin
+# and obstruction shapes after writing the files.
+#
+# The files written are indexed, with their sizes and SHA-256 hashes, in
+# manifest.json in the output directory (see Manifest).
+#
+# Use --shard i/N to only generate shard i (0-based) of N of the batch. The
+# shards are balanced on the pin count of each physical_csv and each one
+# writes a partial manifest to the output directory, which run.py
+# --merge_manifests combines into one manifest.json.
+#
+# Use --profile to write a JSON (or CSV if the name ends in .csv) report with
+# the wall time of each stage and --cprofile to run under cProfile.
+#
 
 
 class SSRAMGenerator:
     """Container class for generating a spreadsheet-based memory"""
 
-    def __init__(self, config_file, util_file):
+    def __init__(self, config_file, util_file, use_mapping_cache=True):
         """Initializer"""
+        self._use_mapping_cache = use_mapping_cache
         self._import_custom_mappings(util_file)
         if config_file:
             # Use config to get voltage
@@ -94,8 +128,19 @@ class SSRAMGenerator:
                     "Static Power (uW)": { "key": "standby_leakage_per_bank_mW", "type": float, "conversion": 1e-3 },
                     "Dynamic Power (uW/MHz)": { "key": "pin_dynamic_power_mW",  "type": float , "conversion": 1e-3},
                 }
+
+        If the mapping cache is enabled and up to date, the maps are loaded
+        from it and the file isn't executed (self._util_module is None)
         """
 
+        mapping_cache = MappingCache(file_name) if self._use_mapping_cache else None
+        if mapping_cache:
+            cached_maps = mapping_cache.load()
+            if cached_maps:
+                self._util_module = None
+                (self._pin_type_map, self._key_map) = cached_maps
+                return
+
         module_name = "spreadsheet_utils"
         spec = importlib.util.spec_from_file_location(module_name, file_name)
         self._util_module = importlib.util.module_from_spec(spec)
@@ -103,32 +148,37 @@ class SSRAMGenerator:
         spec.loader.exec_module(self._util_module)
         self._pin_type_map = self._util_module.get_pin_type_map()
         self._key_map = self._util_module.get_key_map()
+        if mapping_cache:
+            mapping_cache.save(self._pin_type_map, self._key_map)
 
     def create_memory(self, mem_config, physical):
         """Extracts the data from the CSV files and returns the memory object"""
 
         # Get the physical data and organize it
-        phys_data = self.read_physical_file(physical)
-        pin_org = SSPortOrganizer(self._pin_type_map)
-        pin_org.organize_ports(phys_data)
-        num_pins = len(phys_data["pin_data"])
-
-        # Get the metrics data and organize it
-        macro_metrics = self.read_metrics_file(mem_config, phys_data["name"])
-        timing_data = TimingData(macro_metrics)
-        mem_config = MemoryConfig.from_json(macro_metrics)
-
-        mem = SinglePortSSRAM(mem_config, self._process, timing_data, num_pins)
-        self.set_logical_pins(mem, pin_org)
-        port_creator = SSPortCreator(mem, self._pin_type_map)
-        port_creator.create_ports(phys_data["pin_data"])
-        if "obs" in phys_data:
-            port_creator.create_obs(phys_data["obs"])
-        mem.get_physical_data().set_extents(
-            float(phys_data["width"]), float(phys_data["height"])
-        )
-        # snap to grid to sync up the physical data fields
-        mem.get_physical_data().snap_to_grid(1, 1)
+        with Profiler.active_stage("", "read_physical"):
+            phys_data = self.read_physical_file(physical)
+        with Profiler.active_stage(phys_data["name"], "create"):
+            pin_org = SSPortOrganizer(self._pin_type_map)
+            pin_org.organize_ports(phys_data)
+            num_pins = len(phys_data["pin_data"])
+
+            # Get the metrics data and organize it
+            macro_metrics = self.read_metrics_file(mem_config, phys_data["name"])
+            timing_data = TimingData(macro_metrics)
+            mem_config = MemoryConfig.from_json(macro_metrics)
+
+            mem = SinglePortSSRAM(mem_config, self._process, timing_data, num_pins)
+            self.set_logical_pins(mem, pin_org)
+            port_creator = SSPortCreator(mem, self._pin_type_map)
+            with Profiler.active_stage(phys_data["name"], "create_ports"):
+                port_creator.create_ports(phys_data["pin_data"])
+            if "obs" in phys_data:
+                port_creator.create_obs(phys_data["obs"])
+            mem.get_physical_data().set_extents(
+                float(phys_data["width"]), float(phys_data["height"])
+            )
+            # snap to grid to sync up the physical data fields
+            mem.get_physical_data().snap_to_grid(1, 1)
         return mem
 
     def read_physical_file(self, file_name):
@@ -150,8 +200,11 @@ class SSRAMGenerator:
                     is_first = False
                 source = row["SOURCE"]
                 if source == "PIN":
+                    (base_name, bit) = SSPortOrganizer.parse_pin_name(row["PIN"])
                     pin_data = {
                         "name": row["PIN"],
+                        "base_name": base_name,
+                        "bit": bit,
                         "use": row["USE"],
                         "layer": row["LAYER"],
                         "rect": [
@@ -188,6 +241,16 @@ class SSRAMGenerator:
         return macro_data
 
 
+    @staticmethod
+    def count_pins(file_name):
+        """
+        Returns the number of pin shapes in the physical data CSV file (the
+        cost used to balance the shards)
+        """
+
+        with open(file_name, "r", encoding="utf-8-sig") as csv_fh:
+            return sum(1 for row in csv.DictReader(csv_fh) if row["SOURCE"] == "PIN")
+
     def get_size_keys(self):
         """Returns the keys that map to depth and width"""
 
@@ -281,7 +344,8 @@ class SSRAMGenerator:
         )
         parser.add_argument(
             "--physical",
-            help="CSV file containing physical data such as pin locations and layers",
+            nargs="+",
+            help="CSV files containing physical data such as pin locations and layers",
             required=True,
         )
         parser.add_argument(
@@ -294,11 +358,87 @@ class SSRAMGenerator:
             required=False,
             default="results",
         )
+        parser.add_argument(
+            "--no_mapping_cache",
+            "--no-mapping-cache",
+            action="store_true",
+            help="Always execute the mapping file instead of using its cached maps",
+        )
+        parser.add_argument(
+            "--merge_obs",
+            action="store_true",
+            help="Merge overlapping or abutting obstruction rects on each layer",
+        )
+        parser.add_argument(
+            "--check_geometry",
+            action="store_true",
+            help="Check the pin and obstruction shapes after writing the files",
+        )
+        parser.add_argument(
+            "--shard",
+            metavar="i/N",
+            help="Only generate shard i (0-based) of N of the physical files, "
+            "balanced on the pin counts, and write a partial manifest",
+        )
+        parser.add_argument(
+            "--profile",
+            metavar="REPORT",
+            help="Time each stage and write the report (.json or .csv)",
+        )
+        parser.add_argument(
+            "--cprofile",
+            metavar="FILE",
+            help="Run under cProfile and write the stats to FILE (see pstats)",
+        )
+        parser.add_argument(
+            "--profile_top",
+            "--profile-top",
+            type=int,
+            default=10,
+            help="Number of slowest memories to print with --profile",
+        )
 
         args = parser.parse_args()
-        rep = SSRAMGenerator(args.config, args.mapping)
-        mem = rep.create_memory(args.mem_config, args.physical)
-        RunUtils.write_memory(mem, args.output_dir)
+        Profiler.run(lambda: SSRAMGenerator.run(args), args.cprofile)
+
+    @staticmethod
+    def run(args):
+        """Generates the memories for the parsed command line arguments"""
+
+        if args.profile:
+            Profiler().activate()
+        with Profiler.active_stage("", "mapping"):
+            rep = SSRAMGenerator(args.config, args.mapping, not args.no_mapping_cache)
+        physical_files = args.physical
+        indices = list(range(len(physical_files)))
+        shard_planner = None
+        if args.shard:
+            shard_planner = ShardPlanner.from_string(args.shard)
+            costs = [
+                SSRAMGenerator.count_pins(file_name) for file_name in physical_files
+            ]
+            indices = shard_planner.select(costs)
+            print(
+                f"Shard {shard_planner.get_name()}: "
+                f"{len(indices)} of {len(physical_files)} macros"
+            )
+        config_files = [args.config, args.mem_config, args.mapping] + physical_files
+        config_hash = RunUtils.get_config_hash(config_files)
+        manifest = Manifest(args.output_dir, shard_planner, config_hash)
+        num_violations = 0
+        for index in indices:
+            mem = rep.create_memory(args.mem_config, physical_files[index])
+            if args.merge_obs:
+                with Profiler.active_stage(mem.get_name(), "merge_obs"):
+                    (before, after) = mem.merge_obstructions()
+                print(f"Merged {before} obstruction rects into {after}")
+            RunUtils.write_memory(mem, args.output_dir, manifest, index)
+            if args.check_geometry:
+                num_violations += RunUtils.check_geometry(mem)
+        manifest.write()
+        Profiler.finish(args.profile, args.profile_top)
+        if num_violations:
+            sys.exit(f"Error: found {num_violations} geometry violations")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import shutil
+import unittest
+import subprocess
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "bench")))
+from run_bench import compare, get_case_names
+
+
+class BenchTest(unittest.TestCase):
+    """Tests the benchmark suite driver"""
+
+    def setUp(self):
+        """Sets up the results directory"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._exec = os.path.join(self._test_dir, "..", "bench", "run_bench.py")
+        self._results_dir = os.path.join(self._test_dir, "bench_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+        os.makedirs(self._results_dir)
+
+    def test_cases(self):
+        """Tests the case matrix"""
+
+        names = get_case_names()
+        self.assertEqual(len(names), 16)
+        self.assertIn("RF_DP_huge", names)
+        self.assertIn("config_1000", names)
+        self.assertIn("ss_pins_2048", names)
+
+    def test_compare(self):
+        """Tests the regression check"""
+
+        base = {"ops_per_sec": 100.0, "bytes_per_sec": 1000.0, "peak_rss_kb": 1000}
+        baseline = {"cases": {"case": base}}
+        self.assertEqual(compare({"case": dict(base)}, baseline, 0.2), [])
+        slower = dict(base, ops_per_sec=79.0)
+        self.assertEqual(len(compare({"case": slower}, baseline, 0.2)), 1)
+        self.assertEqual(compare({"case": slower}, baseline, 0.25), [])
+        bigger = dict(base, peak_rss_kb=1300)
+        self.assertEqual(len(compare({"case": bigger}, baseline, 0.2)), 1)
+        self.assertEqual(compare({"other": slower}, baseline, 0.2), [])
+
+    def test_run(self):
+        """Tests writing a baseline and flagging a regression against it"""
+
+        baseline_file_name = os.path.join(self._results_dir, "baseline.json")
+        cmd = [sys.executable, self._exec, "--baseline", baseline_file_name]
+        cmd += ["--cases", "RAM_SP_small", "--repeat", "2"]
+        # Without a baseline the run fails instead of quietly writing one
+        out = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(out.returncode, 2, out.stdout)
+        self.assertIn("--write_baseline", out.stderr)
+        self.assertFalse(os.path.exists(baseline_file_name))
+        subprocess.run(cmd + ["--write_baseline"], check=True, capture_output=True)
+        with open(baseline_file_name) as in_fh:
+            baseline = json.load(in_fh)
+        result = baseline["cases"]["RAM_SP_small"]
+        self.assertEqual(result["ops"], 2)
+        self.assertGreater(result["bytes"], 0)
+        self.assertGreater(result["peak_rss_kb"], 0)
+        result["ops_per_sec"] *= 1000
+        with open(baseline_file_name, "w") as out_fh:
+            json.dump(baseline, out_fh)
+        out = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(out.returncode, 1, out.stdout)
+        self.assertIn("Regression: RAM_SP_small: ops_per_sec", out.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import shutil
+import threading
+import unittest
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from class_process import Process
+from timing_data import TimingData
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from single_port_ssram import SinglePortSSRAM
+from run_utils import RunUtils
+from batch_runner import BatchRunner
+from manifest import Manifest
+from sram_sweep import SramSweep
+from test_utils import TestUtils
+
+
+class ConcurrentGenerationTest(unittest.TestCase):
+    """Tests that memories sharing a Process can be generated concurrently"""
+
+    def setUp(self):
+        """Creates a process with corners"""
+
+        process_data = TestUtils.get_base_process_data()
+        process_data["corners"] = [
+            {"name": "ss", "voltage": 0.63, "temperature": 125, "delay_derate": 1.3},
+            {"name": "ff", "voltage": 0.77, "temperature": -40, "delay_derate": 0.8},
+        ]
+        self._process = Process(process_data)
+        self._timing_data = TimingData()
+
+    def _render(self, params):
+        """Creates and renders a memory and returns its contents"""
+
+        (name, width, depth, num_banks) = params
+        mem_config = MemoryConfig(name, width, depth, num_banks, 0)
+        memory = MemoryFactory.create(
+            mem_config, "RAM", "SP", self._process, self._timing_data
+        )
+        return {
+            base_name: [line for line in contents.splitlines() if "date" not in line]
+            for _, base_name, contents in RunUtils.render_views(memory)
+        }
+
+    def test_immutable(self):
+        """Tests that the process and timing data can't be changed"""
+
+        for value_object, name in [
+            (self._process, "voltage"),
+            (self._timing_data, "access_time_ns"),
+        ]:
+            self.assertTrue(value_object.is_frozen())
+            with self.assertRaisesRegex(Exception, "immutable"):
+                setattr(value_object, name, 1.0)
+            with self.assertRaisesRegex(Exception, "immutable"):
+                delattr(value_object, name)
+        derated = self._timing_data.get_derated(2.0, 1.0, 1.0)
+        access_time = self._timing_data.get_access_time()
+        self.assertEqual(derated.get_access_time(), 2 * access_time)
+
+    def test_calc_dimensions(self):
+        """Tests that a spreadsheet memory doesn't change the other memories"""
+
+        before = self._render(("before", 32, 256, 2))
+        mem_config = MemoryConfig("sheet", 32, 256, 1, 0)
+        sheet = SinglePortSSRAM(mem_config, self._process, self._timing_data, 10)
+        self.assertFalse(sheet.calc_dimensions())
+        self.assertEqual(sheet.get_physical_data().get_width(), None)
+        after = self._render(("before", 32, 256, 2))
+        self.assertDictEqual(before, after)
+
+    def test_stress(self):
+        """Tests that rendering on many threads matches a serial render"""
+
+        params = [
+            (f"ram_{index}", width, depth, num_banks)
+            for index, (width, depth, num_banks) in enumerate(
+                (width, depth, num_banks)
+                for width in [8, 16, 32, 64]
+                for depth in [256, 1024, 4096]
+                for num_banks in [1, 2, 4]
+            )
+        ]
+        # The same memory is rendered several times to share more state
+        params = params * 3
+        expected = [self._render(param) for param in params]
+
+        old_interval = sys.getswitchinterval()
+        # Switch threads as often as possible to expose races
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(self._render, params))
+        finally:
+            sys.setswitchinterval(old_interval)
+        self.assertEqual(len(results), len(expected))
+        for result, contents in zip(results, expected):
+            self.assertDictEqual(result, contents)
+
+    def _get_config(self, results_dir):
+        """Returns a config with a sweep of 9 srams"""
+
+        json_data = RunUtils.get_config(
+            os.path.join(os.path.dirname(results_dir), "cfg", "spsram_example.cfg")
+        )
+        json_data["corners"] = [
+            {"name": "ss", "voltage": 0.63, "temperature": 125, "delay_derate": 1.3}
+        ]
+        json_data["srams"] = [
+            {
+                "name": "conc_{depth}x{width}",
+                "width": [16, 32, 64],
+                "depth": {"range": [256, 1024], "scale": "pow2"},
+                "banks": 2,
+            }
+        ]
+        return json_data
+
+    @staticmethod
+    def _get_results_dir():
+        """Returns the empty results directory"""
+
+        test_dir = os.path.abspath(os.path.dirname(__file__))
+        results_dir = os.path.join(test_dir, "concurrent_generation_results")
+        if os.path.isdir(results_dir):
+            shutil.rmtree(results_dir)
+        os.makedirs(results_dir)
+        return results_dir
+
+    def test_threads(self):
+        """Tests that the runner renders the srams on its threads"""
+
+        results_dir = self._get_results_dir()
+        json_data = self._get_config(results_dir)
+        runner = BatchRunner(json_data, results_dir, num_threads=4)
+        thread_names = []
+        render_item = runner.render_item
+
+        def record_render_item(*item):
+            thread_names.append(threading.current_thread().name)
+            return render_item(*item)
+
+        runner.render_item = record_render_item
+        manifest = Manifest(results_dir)
+        srams = enumerate(SramSweep(json_data["srams"]))
+        runner.run(runner.iter_items(srams), manifest)
+        self.assertEqual(len(thread_names), 9)
+        for thread_name in thread_names:
+            self.assertTrue(thread_name.startswith("generator"), thread_name)
+        self.assertListEqual(
+            [memory["index"] for memory in manifest.get_memories()], list(range(9))
+        )
+
+    def test_run(self):
+        """Tests that run.py writes the same files with several threads"""
+
+        results_dir = self._get_results_dir()
+        json_data = self._get_config(results_dir)
+        test_dir = os.path.dirname(results_dir)
+        cfg_file_name = os.path.join(results_dir, "concurrent.cfg")
+        with open(cfg_file_name, "w") as out_fh:
+            json.dump(json_data, out_fh)
+        cmd = [sys.executable, os.path.join(test_dir, "..", "run.py"), cfg_file_name]
+        manifests = []
+        for options in [["--writers", "0"], ["--threads", "4"]]:
+            output_dir = os.path.join(results_dir, options[0].strip("-"))
+            result = subprocess.run(
+                cmd + ["--output_dir", output_dir] + options,
+                capture_output=True,
+                text=True,
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+            with open(os.path.join(output_dir, "manifest.json")) as in_fh:
+                manifests.append(json.load(in_fh)["memories"])
+        (serial, threaded) = manifests
+        self.assertEqual(len(serial), 9)
+        for serial_memory, threaded_memory in zip(serial, threaded):
+            self.assertEqual(serial_memory["name"], threaded_memory["name"])
+            self.assertDictEqual(serial_memory["params"], threaded_memory["params"])
+            # The Liberty files have the date, so only the others are compared
+            for serial_file, threaded_file in zip(
+                serial_memory["files"], threaded_memory["files"]
+            ):
+                if not serial_file["view"].startswith("liberty"):
+                    self.assertEqual(serial_file["sha256"], threaded_file["sha256"])
+
+        result = subprocess.run(
+            cmd + ["--jobs", "2", "--threads", "2"], capture_output=True, text=True
+        )
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("can't be combined", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
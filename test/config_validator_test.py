@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from config_validator import ConfigValidator
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from class_process import Process
+from timing_data import TimingData
+
+
+class ConfigValidatorTest(unittest.TestCase):
+    """Unit test for ConfigValidator class"""
+
+    def setUp(self):
+        """Sets up base_data with example config data"""
+
+        self._base_data = {
+            "tech_nm": 7,
+            "voltage": 0.7,
+            "metal_prefix": "M",
+            "metal_layer": "M4",
+            "pin_width_nm": 24,
+            "pin_pitch_nm": 48,
+            "metal_track_pitch_nm": 48,
+            "contacted_poly_pitch_nm": 54,
+            "column_mux_factor": 1,
+            "fin_pitch_nm": 27,
+            "manufacturing_grid_nm": 1,
+            "snap_width_nm": 190,
+            "snap_height_nm": 1400,
+            "srams": [
+                {"name": "a", "width": 32, "depth": 256, "banks": 2},
+                {"name": "b", "width": 32, "depth": 256, "banks": 3},
+                {"name": "a", "width": 16, "depth": 64, "banks": 1},
+                {"name": "c", "width": 16, "depth": 64},
+                {"name": "d", "width": 256, "depth": 16, "banks": 1},
+                {"name": "e", "width": "x", "depth": 16, "banks": 1},
+            ],
+        }
+
+    def _get_messages(self, json_data):
+        """Returns the formatted problems of the config"""
+
+        problems = ConfigValidator(json_data).validate()
+        return [ConfigValidator.format_problem(problem) for problem in problems]
+
+    def test_srams(self):
+        """Tests that every problem in srams[] is reported at once"""
+
+        messages = self._get_messages(self._base_data)
+        self.assertEqual(len(messages), 5)
+        self.assertEqual(messages[0], "srams[1] b: Unsupported number of banks: 3")
+        self.assertEqual(messages[1], "srams[2] a: duplicate name (also srams[0])")
+        self.assertEqual(messages[2], "srams[3] c: missing banks")
+        self.assertTrue(messages[3].startswith("srams[4] d: not enough tracks"))
+        self.assertTrue(messages[4].startswith("srams[5] e: invalid value"))
+
+    def test_tracks(self):
+        """Tests that the track check agrees with Memory"""
+
+        process = Process(self._base_data)
+        for sram_data in [self._base_data["srams"][0], self._base_data["srams"][4]]:
+            json_data = dict(self._base_data, srams=[sram_data])
+            messages = self._get_messages(json_data)
+            mem_config = MemoryConfig.from_json(sram_data)
+            try:
+                MemoryFactory.create(mem_config, "RAM", "SP", process, TimingData())
+                memory_message = None
+            except Exception as ex:
+                memory_message = str(ex)
+            if messages:
+                self.assertIn("not enough tracks", memory_message)
+            else:
+                self.assertIsNone(memory_message)
+        self.assertEqual(len(self._get_messages(json_data)), 1)
+        json_data["srams"][0] = dict(sram_data, additional_height=20)
+        self.assertListEqual(self._get_messages(json_data), [])
+
+    def test_process(self):
+        """Tests the config-level problems"""
+
+        json_data = dict(self._base_data, srams=[self._base_data["srams"][0]])
+        del json_data["fin_pitch_nm"]
+        del json_data["voltage"]
+        json_data["port_configuration"] = "QP"
+        messages = self._get_messages(json_data)
+        self.assertListEqual(
+            messages,
+            [
+                "config: missing voltage",
+                "config: unsupported memory_type RAM and port_configuration QP",
+            ],
+        )
+        json_data["voltage"] = 0.7
+        json_data["port_configuration"] = "SP"
+        messages = self._get_messages(json_data)
+        self.assertEqual(len(messages), 1)
+        self.assertIn("fin_pitch_nm", messages[0])
+        json_data["bitcell_width_um"] = 0.1
+        json_data["bitcell_height_um"] = 0.2
+        self.assertListEqual(self._get_messages(json_data), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
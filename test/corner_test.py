@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import shutil
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from class_process import Process
+from timing_data import TimingData
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from run_utils import RunUtils
+from test_utils import TestUtils
+
+
+class CornerTest(unittest.TestCase):
+    """Tests the multi-corner Liberty generation"""
+
+    def setUp(self):
+        """Sets up the results directory and the process with corners"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._results_dir = os.path.join(self._test_dir, "corner_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+        self._process_data = TestUtils.get_base_process_data()
+        self._process_data["corners"] = [
+            {
+                "name": "ss_0.63_125",
+                "voltage": 0.63,
+                "temperature": 125,
+                "delay_derate": 2.0,
+                "leakage_derate": 4.0,
+            },
+            {"name": "ff_0.77_m40", "voltage": 0.77, "temperature": -40},
+        ]
+
+    def test_derate(self):
+        """Tests the derated timing data"""
+
+        process = Process(self._process_data)
+        (slow, fast) = process.get_corners()
+        timing_data = TimingData({"nldm": {"drive_resistance_kohm": 0.5}})
+        derated = slow.get_timing_data(timing_data)
+        self.assertIs(derated, slow.get_timing_data(timing_data))
+        self.assertAlmostEqual(
+            derated.get_access_time(), timing_data.get_access_time() * 2
+        )
+        self.assertAlmostEqual(
+            derated.get_setup_time(), timing_data.get_setup_time() * 2
+        )
+        self.assertAlmostEqual(
+            derated.get_leakage_power(), timing_data.get_leakage_power() * 4
+        )
+        self.assertEqual(
+            derated.get_pin_dynamic_power(), timing_data.get_pin_dynamic_power()
+        )
+        self.assertAlmostEqual(derated.get_drive_resistance_kohm(), 1.0)
+        self.assertEqual(
+            fast.get_timing_data(timing_data).get_access_time(),
+            timing_data.get_access_time(),
+        )
+        # The cache isn't kept on the corner, which can't be changed
+        self.assertTrue(slow.is_frozen())
+        other_slow = Process(self._process_data).get_corners()[0]
+        self.assertIs(other_slow.get_timing_data(timing_data), derated)
+        self._process_data["corners"].append(
+            {"name": "ss_0.63_125", "voltage": 0.6, "temperature": 0}
+        )
+        with self.assertRaises(Exception):
+            Process(self._process_data)
+
+    def test_name(self):
+        """Tests that a corner name can't change the Liberty file path"""
+
+        for name in ["../ss", "ss/0.63", "ss 125", ""]:
+            self._process_data["corners"] = [
+                {"name": name, "voltage": 0.63, "temperature": 125}
+            ]
+            with self.assertRaisesRegex(Exception, "Invalid corner name"):
+                Process(self._process_data)
+
+    def test_write(self):
+        """Tests that each corner gets its own Liberty file"""
+
+        process = Process(self._process_data)
+        mem_config = MemoryConfig("corner_ram", 32, 256, 1, 0)
+        mem = MemoryFactory.create(mem_config, "RAM", "SP", process, TimingData())
+        RunUtils.write_memory(mem, self._results_dir)
+        mem_dir = os.path.join(self._results_dir, "corner_ram")
+        with open(os.path.join(mem_dir, "corner_ram.lib")) as in_fh:
+            nominal = in_fh.read()
+        self.assertIn("library(corner_ram) {", nominal)
+        self.assertIn("operating_conditions(tt_1.0_25.0) {", nominal)
+        self.assertIn("nom_process : 1;", nominal)
+        with open(os.path.join(mem_dir, "corner_ram_ss_0.63_125.lib")) as in_fh:
+            slow = in_fh.read()
+        self.assertIn("library(corner_ram_ss_0.63_125) {", slow)
+        self.assertIn("operating_conditions(ss_0.63_125) {", slow)
+        self.assertIn("default_operating_conditions : ss_0.63_125;", slow)
+        self.assertIn("nom_temperature : 125.000;", slow)
+        self.assertIn("nom_voltage : 0.630;", slow)
+        self.assertIn("cell(corner_ram) {", slow)
+        self.assertIn('"%.3f, %.3f"' % (0.2183 * 2, 0.2183 * 2), slow)
+        self.assertTrue(
+            os.path.exists(os.path.join(mem_dir, "corner_ram_ff_0.77_m40.lib"))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import unittest
+import subprocess
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from run_utils import RunUtils
+from hashing_writer import HashingWriter
+from batch_runner import BatchRunner
+from manifest import Manifest
+from class_process import Process
+from timing_data import TimingData
+from memory_config import MemoryConfig
+from single_port_ssram import SinglePortSSRAM
+from test_utils import TestUtils
+
+
+class DedupTest(unittest.TestCase):
+    """Tests that srams that only differ by name are written as copies"""
+
+    def setUp(self):
+        """Writes a config with copies of the same sram"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._exec = os.path.join(self._test_dir, "..", "run.py")
+        self._results_dir = os.path.join(self._test_dir, "dedup_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+        os.makedirs(self._results_dir)
+        json_data = RunUtils.get_config(
+            os.path.join(self._test_dir, "cfg", "spsram_example.cfg")
+        )
+        json_data["corners"] = [
+            {"name": "ss", "voltage": 0.63, "temperature": 125, "delay_derate": 1.3}
+        ]
+        json_data["timing_model"] = {
+            "access_time_ns": {"const": 0.12, "log2_depth": 0.008, "width": 0.0004}
+        }
+        json_data["srams"] = [
+            {"name": "cpu_ram", "width": 32, "depth": 256, "banks": 2},
+            {"name": "gpu_ram", "width": 32, "depth": 256, "banks": 2},
+            {"name": "small_ram", "width": 16, "depth": 64, "banks": 1},
+            {"name": "dsp_ram", "width": 32, "depth": 256, "banks": 2},
+            {
+                "name": "io_ram",
+                "width": 32,
+                "depth": 256,
+                "banks": 2,
+                "additional_height": 0.0,
+            },
+        ]
+        self._names = [sram_data["name"] for sram_data in json_data["srams"]]
+        self._cfg_file_name = os.path.join(self._results_dir, "dedup.cfg")
+        with open(self._cfg_file_name, "w") as out_fh:
+            json.dump(json_data, out_fh)
+
+    def _run(self, output_dir, *options):
+        """Runs run.py and returns its output"""
+
+        cmd = [sys.executable, self._exec, self._cfg_file_name]
+        cmd += ["--output_dir", output_dir] + list(options)
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout
+
+    @staticmethod
+    def _read(file_name):
+        """Returns the lines of the file without the Liberty date"""
+
+        with open(file_name) as in_fh:
+            return [line for line in in_fh if "date" not in line]
+
+    def _check_same(self, output_dir, golden_dir):
+        """Checks that every file matches the full render and the manifest"""
+
+        with open(os.path.join(output_dir, "manifest.json")) as in_fh:
+            manifest = json.load(in_fh)
+        self.assertListEqual(
+            [memory["name"] for memory in manifest["memories"]], self._names
+        )
+        for memory in manifest["memories"]:
+            for file_record in memory["files"]:
+                file_name = os.path.join(output_dir, file_record["path"])
+                with open(file_name, "rb") as in_fh:
+                    data = in_fh.read()
+                sha256 = hashlib.sha256(data).hexdigest()
+                self.assertEqual(file_record["sha256"], sha256)
+                self.assertListEqual(
+                    self._read(file_name),
+                    self._read(os.path.join(golden_dir, file_record["path"])),
+                    file_record["path"],
+                )
+
+    def test_dedup(self):
+        """Tests that the copies match a full render"""
+
+        golden_dir = os.path.join(self._results_dir, "full")
+        self.assertNotIn("copies", self._run(golden_dir, "--no_dedup"))
+        output_dir = os.path.join(self._results_dir, "dedup")
+        self.assertIn("Writing 3 srams as renamed copies", self._run(output_dir))
+        self._check_same(output_dir, golden_dir)
+        output_dir = os.path.join(self._results_dir, "dedup_jobs")
+        self._run(output_dir, "--jobs", "2")
+        self._check_same(output_dir, golden_dir)
+
+    def test_fallback(self):
+        """Tests that a group whose renamed render differs is rendered in full"""
+
+        golden_dir = os.path.join(self._results_dir, "full")
+        self._run(golden_dir, "--no_dedup")
+        output_dir = os.path.join(self._results_dir, "fallback")
+        json_data = RunUtils.get_config(self._cfg_file_name)
+        runner = BatchRunner(json_data, output_dir)
+        # Replacing this placeholder also replaces the verilog keyword
+        runner.placeholder = "endmodule"
+        srams = list(enumerate(json_data["srams"]))
+        runner.find_copies(srams)
+        self.assertEqual(runner.get_num_copies(), 3)
+        manifest = Manifest(output_dir)
+        runner.run(runner.iter_items(srams), manifest)
+        manifest.write()
+        self._check_same(output_dir, golden_dir)
+
+    def test_ssram_views(self):
+        """
+        Tests that a spreadsheet RAM renders the blackbox verilog it writes
+        (see RunUtils.render_views)
+        """
+
+        process = Process(TestUtils.get_base_process_data())
+        mem_config = MemoryConfig("sheet", 32, 256, 1, 0)
+        sheet = SinglePortSSRAM(mem_config, process, TimingData(), 10)
+        self.assertFalse(sheet.has_sparse_model())
+        file_name = os.path.join(self._results_dir, "sheet.v")
+        sheet.write_verilog_file(file_name)
+        with open(file_name) as in_fh:
+            self.assertEqual(sheet.render_verilog(), in_fh.read())
+        self.assertEqual(sheet.render_verilog(), sheet.render_verilog(True))
+
+    def test_write_views(self):
+        """Tests that the views without the name are hardlinked"""
+
+        views = [
+            ("common", "NAME.txt", "the same for every name\n"),
+            ("verilog", "NAME.v", "module NAME;\nendmodule\n"),
+        ]
+        links = {}
+        records = {}
+        for name in ["ram_a", "ram_b"]:
+            records[name] = RunUtils.write_views(
+                name, views, "NAME", self._results_dir, links
+            )
+        common_a = os.path.join(self._results_dir, "ram_a", "ram_a.txt")
+        common_b = os.path.join(self._results_dir, "ram_b", "ram_b.txt")
+        self.assertTrue(os.path.samefile(common_a, common_b))
+        self.assertEqual(records["ram_a"][0]["sha256"], records["ram_b"][0]["sha256"])
+        with open(os.path.join(self._results_dir, "ram_b", "ram_b.v")) as in_fh:
+            self.assertEqual(in_fh.read(), "module ram_b;\nendmodule\n")
+
+        # Writing a link replaces it instead of changing the other links
+        with HashingWriter(common_a) as out_fh:
+            out_fh.write("changed\n")
+        self.assertFalse(os.path.samefile(common_a, common_b))
+        with open(common_b) as in_fh:
+            self.assertEqual(in_fh.read(), "the same for every name\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
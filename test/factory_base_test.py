@@ -55,6 +55,22 @@ class FactoryBaseTest(unittest.TestCase):
             mem_config.set_name("sprf")
             sprf = FactoryBase.create(mem_config, "RF", "SP", None, None)
 
+    def test_class_path(self):
+        """Tests registering a class by its module and class name"""
+
+        FactoryBase.register("RF", "DP", "factory_base_test.DPRAM")
+        mem_config = MemoryConfig("dprf", 32, 256, 2, 0)
+        dprf = FactoryBase.create(mem_config, "RF", "DP", None, None)
+        self.assertEqual(dprf.get_type(), "DPRAM")
+        # The class replaces the string after the first import
+        self.assertIs(FactoryBase.get_class("RF", "DP"), type(dprf))
+        FactoryBase.register("RF", "DP", "no_such_module.DPRAM")
+        with self.assertRaises(ImportError):
+            FactoryBase.create(mem_config, "RF", "DP", None, None)
+        with self.assertRaises(ValueError):
+            FactoryBase.import_class("DPRAM")
+        del FactoryBase._registry[FactoryBase.get_key("RF", "DP")]
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import shutil
+import unittest
+import subprocess
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from class_process import Process
+from timing_data import TimingData
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from verilog_options import VerilogOptions
+from test_utils import TestUtils
+
+
+class FastSimTest(unittest.TestCase):
+    """Tests the fast-sim Verilog model flavor"""
+
+    def setUp(self):
+        """Sets up the results directory"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._results_dir = os.path.join(self._test_dir, "fast_sim_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+        os.makedirs(self._results_dir)
+        self._process = Process(TestUtils.get_base_process_data())
+
+    def _write_model(self, memory_type, port_config):
+        """Writes a fast-sim 32 bit x 256 word model and returns its file name"""
+
+        name = f"fast_sim_{memory_type}_{port_config}"
+        mem_config = MemoryConfig(name, 32, 256, 1, 0)
+        mem = MemoryFactory.create(
+            mem_config, memory_type, port_config, self._process, TimingData()
+        )
+        mem.set_verilog_options(
+            VerilogOptions(
+                {"verilog_flavor": "fast-sim", "sparse_model_threshold_bits": 1}
+            )
+        )
+        file_name = os.path.join(self._results_dir, name + ".v")
+        mem.write_verilog_file(file_name)
+        return file_name
+
+    def test_options(self):
+        """Tests the flavor option"""
+
+        self.assertEqual(VerilogOptions().get_verilog_flavor(), "default")
+        self.assertFalse(VerilogOptions().is_fast_sim())
+        options = VerilogOptions(
+            {"verilog_flavor": "fast-sim", "sparse_model_threshold_bits": 1}
+        )
+        self.assertTrue(options.is_fast_sim())
+        self.assertFalse(options.use_sparse_model(256, 32))
+        with self.assertRaises(Exception):
+            VerilogOptions({"verilog_flavor": "bogus"})
+
+    def test_models(self):
+        """Tests the generated models and lints them if possible"""
+
+        file_names = []
+        for memory_type, port_config in [
+            ("RAM", "SP"),
+            ("RAM", "DP"),
+            ("RF", "SP"),
+            ("RF", "DP"),
+        ]:
+            file_name = self._write_model(memory_type, port_config)
+            file_names.append(file_name)
+            with open(file_name) as in_fh:
+                model = in_fh.read()
+            for text in ["specify", "for (", "'x", "1'bx", "$display", "[int]"]:
+                self.assertNotIn(text, model, file_name)
+            if memory_type == "RF" and port_config == "DP":
+                self.assertNotIn("always_ff", model)
+                lint_off = model.index("verilator lint_off MULTIDRIVEN")
+                lint_on = model.index("verilator lint_on MULTIDRIVEN")
+                self.assertLess(lint_off, model.index("mem ["))
+                self.assertLess(model.index("mem ["), lint_on)
+                self.assertLess(lint_on, model.index("always @"))
+            else:
+                self.assertIn("always_ff @(posedge", model)
+                self.assertNotIn("always @", model)
+
+        verilator = TestUtils.find_tool(self, "verilator")
+        for file_name in file_names:
+            subprocess.run([verilator, "--lint-only", file_name], check=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
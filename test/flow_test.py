@@ -220,7 +220,9 @@ class FlowTest(unittest.TestCase):
             "fakeram_64x22",
         ]
         self.assertTrue(os.path.isdir(self._results_dir))
-        self.assertListEqual(sorted(os.listdir(self._results_dir)), expected_ram_list)
+        self.assertListEqual(
+            sorted(os.listdir(self._results_dir)), expected_ram_list + ["manifest.json"]
+        )
         ct = 0
         for ram_name in expected_ram_list:
             lef_file = os.path.join(self._results_dir, ram_name, ram_name + ".lef")
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
 import os
+import json
+import hashlib
 import shutil
 import unittest
 import subprocess
@@ -50,9 +52,31 @@ class FlowTestBase(unittest.TestCase):
     def _check_results_dir(self, expected_ram_list):
         """Checks that the expected RAMs were generated"""
         self.assertTrue(os.path.isdir(self._results_dir))
-        self.assertListEqual(sorted(os.listdir(self._results_dir)), expected_ram_list)
+        names = sorted(os.listdir(self._results_dir))
+        self.assertIn("manifest.json", names)
+        names.remove("manifest.json")
+        self.assertListEqual(names, expected_ram_list)
         for ram_name in expected_ram_list:
             self._check_memory(ram_name)
+        self._check_manifest(expected_ram_list)
+
+    def _check_manifest(self, expected_ram_list):
+        """Checks that the manifest matches the files that were written"""
+
+        with open(os.path.join(self._results_dir, "manifest.json")) as in_fh:
+            manifest = json.load(in_fh)
+        names = [memory["name"] for memory in manifest["memories"]]
+        self.assertListEqual(sorted(names), sorted(expected_ram_list))
+        for memory in manifest["memories"]:
+            views = [file_record["view"] for file_record in memory["files"]]
+            self.assertListEqual(views, ["liberty", "lef", "verilog", "sv_blackbox"])
+            for file_record in memory["files"]:
+                file_name = os.path.join(self._results_dir, file_record["path"])
+                with open(file_name, "rb") as in_fh:
+                    data = in_fh.read()
+                self.assertEqual(file_record["size"], len(data))
+                sha256 = hashlib.sha256(data).hexdigest()
+                self.assertEqual(file_record["sha256"], sha256)
 
     def _execute_run(self, tag, expected_ram_list):
         cfg_file_name = f"{tag}_example.cfg"
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from generation_server import GenerationServer
+from run_utils import RunUtils
+
+
+class GenerationServerTest(unittest.TestCase):
+    """Unit test for GenerationServer class"""
+
+    def setUp(self):
+        """Starts a server on a socket in a temporary directory"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._results_dir = os.path.join(self._test_dir, "generation_server_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+        self._config_file = os.path.join(self._test_dir, "cfg", "spsram_example.cfg")
+        # Unix socket paths are short, so keep it out of the test directory
+        self._socket_dir = tempfile.mkdtemp()
+        self._socket_path = os.path.join(self._socket_dir, "fakeram.sock")
+        self._server = GenerationServer(self._socket_path, num_workers=4)
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._server.serve, args=(ready,))
+        self._thread.start()
+        self.assertTrue(ready.wait(10))
+
+    def tearDown(self):
+        """Shuts down the server"""
+
+        reply = self._send({"command": "shutdown"})
+        self.assertEqual(reply["status"], "ok")
+        self._thread.join(10)
+        self.assertFalse(self._thread.is_alive())
+        self.assertFalse(os.path.exists(self._socket_path))
+        shutil.rmtree(self._socket_dir)
+
+    def _send(self, request):
+        """Sends the request and returns the reply"""
+        return GenerationServer.send_request(self._socket_path, request, timeout=60)
+
+    def test_inline(self):
+        """Tests that an inline reply matches the files that run.py writes"""
+
+        sram = {"name": "server_ram", "width": 32, "depth": 64, "banks": 1}
+        reply = self._send(
+            {"id": 7, "config_file": self._config_file, "sram": sram, "inline": True}
+        )
+        self.assertEqual(reply["id"], 7)
+        self.assertEqual(reply["status"], "ok")
+        self.assertEqual(len(reply["memories"]), 1)
+        files = reply["memories"][0]["files"]
+        expected = ["server_ram" + ext for ext in [".lib", ".lef", ".v", ".sv"]]
+        self.assertListEqual(sorted(files), sorted(expected))
+        self.assertFalse(os.path.exists(self._results_dir))
+
+        request = {"config_file": self._config_file, "sram": sram}
+        request["output_dir"] = self._results_dir
+        reply = self._send(request)
+        self.assertEqual(reply["status"], "ok")
+        for file_name, path in reply["memories"][0]["files"].items():
+            self.assertEqual(os.path.basename(path), file_name)
+            with open(path) as in_fh:
+                self.assertEqual(in_fh.read(), files[file_name])
+
+    def test_config(self):
+        """Tests a full config and that the config context is reused"""
+
+        json_data = RunUtils.get_config(self._config_file)
+        reply = self._send({"config": json_data, "output_dir": self._results_dir})
+        self.assertEqual(reply["status"], "ok")
+        names = [memory["name"] for memory in reply["memories"]]
+        self.assertListEqual(names, [sram["name"] for sram in json_data["srams"]])
+        for memory in reply["memories"]:
+            for path in memory["files"].values():
+                self.assertTrue(os.path.isfile(path))
+        # The same config from the file shares the context
+        reply = self._send({"config_file": self._config_file, "inline": True})
+        self.assertEqual(reply["status"], "ok")
+        self.assertEqual(self._server.get_num_contexts(), 1)
+
+    def test_concurrent(self):
+        """Tests concurrent clients"""
+
+        replies = [None] * 8
+
+        def send(index):
+            sram = {"name": f"ram_{index}", "width": 8 * (index + 1), "depth": 32}
+            sram["banks"] = 1
+            request = {"id": index, "config_file": self._config_file, "sram": sram}
+            request["inline"] = True
+            replies[index] = self._send(request)
+
+        threads = [threading.Thread(target=send, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(60)
+        for index, reply in enumerate(replies):
+            self.assertEqual(reply["id"], index)
+            self.assertEqual(reply["status"], "ok")
+            self.assertIn(f"ram_{index}.v", reply["memories"][0]["files"])
+
+    def test_idle_connections(self):
+        """Tests that idle connections don't keep other clients waiting"""
+
+        idle = []
+        try:
+            # More idle clients than worker threads
+            for _ in range(self._server.get_num_workers() + 2):
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.connect(self._socket_path)
+                idle.append(sock)
+            reply = GenerationServer.send_request(
+                self._socket_path, {"command": "ping"}, timeout=10
+            )
+            self.assertEqual(reply["status"], "ok")
+        finally:
+            for sock in idle:
+                sock.close()
+
+    def test_errors(self):
+        """Tests the error replies"""
+
+        self.assertEqual(self._send({"command": "ping"})["status"], "ok")
+        reply = self._send({"id": "x", "command": "bogus"})
+        self.assertEqual(reply["id"], "x")
+        self.assertEqual(reply["status"], "error")
+        self.assertIn("bogus", reply["error"])
+        self.assertEqual(self._send({"sram": {}})["status"], "error")
+        reply = self._send({"config_file": os.path.join(self._test_dir, "missing.cfg")})
+        self.assertEqual(reply["status"], "error")
+        self.assertEqual(self._send([1, 2])["status"], "error")
+        # The server keeps serving after errors
+        self.assertEqual(self._send({"command": "ping"})["status"], "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
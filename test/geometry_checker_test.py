@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from port import Port
+from class_process import Process
+from timing_data import TimingData
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from geometry_checker import GeometryChecker
+from test_utils import TestUtils
+
+
+class GeometryCheckerTest(unittest.TestCase):
+    """Unit test for GeometryChecker class"""
+
+    def setUp(self):
+        """Creates a memory with legal pin shapes"""
+
+        self._process = Process(TestUtils.get_base_process_data())
+        mem_config = MemoryConfig("test", 32, 256, 1, 0)
+        self._mem = MemoryFactory.create(
+            mem_config, "RAM", "SP", self._process, TimingData()
+        )
+        # Use a layer that doesn't have pins or straps on it
+        self._layer = "M7"
+
+    def _add_port(self, name, rect):
+        port = Port(name)
+        port.set_layer(self._layer)
+        port.add_rect(rect)
+        self._mem.add_port(port)
+
+    def _get_types(self, violations):
+        return sorted(violation["type"] for violation in violations)
+
+    def test_clean(self):
+        """Tests that the generated memory has no violations"""
+
+        checker = GeometryChecker(self._mem)
+        self.assertAlmostEqual(checker.get_min_spacing(), 0.024)
+        self.assertListEqual(checker.check(), [])
+
+    def test_violations(self):
+        """Tests out of bounds, overlap and spacing violations"""
+
+        physical = self._mem.get_physical_data()
+        w = physical.get_width()
+        h = physical.get_height()
+        self._add_port("oob", [w - 1, h - 0.01, w + 1, h + 1])
+        self._add_port("a", [1, 10, 2, 11])
+        self._add_port("b", [1.5, 10.5, 2.5, 12])
+        self._add_port("c", [2.51, 10, 3, 11])
+        self._add_port("d", [3, 10, 3.5, 11])
+        violations = GeometryChecker(self._mem).check()
+        self.assertListEqual(
+            self._get_types(violations),
+            ["out_of_bounds", "overlap", "overlap", "spacing"],
+        )
+        shapes = {
+            violation["type"]: sorted(violation["shapes"])
+            for violation in violations
+            if violation["type"] != "overlap"
+        }
+        self.assertListEqual(shapes["out_of_bounds"], ["oob"])
+        self.assertListEqual(shapes["spacing"], ["b", "c"])
+        message = GeometryChecker.format_violation(violations[0])
+        self.assertTrue(message.startswith("out_of_bounds on M7: oob"))
+
+    def test_obstructions(self):
+        """Tests that obstructions are only checked against the extents"""
+
+        self._mem.add_obstruction(self._layer, [-1, 0, 1, 1])
+        violations = GeometryChecker(self._mem).check()
+        self.assertListEqual(self._get_types(violations), ["out_of_bounds"])
+        self.assertListEqual(violations[0]["shapes"], ["OBS"])
+
+
+if __name__ == "__main__":
+    unittest.main()
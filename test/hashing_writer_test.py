@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import shutil
+import hashlib
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from hashing_writer import HashingWriter
+
+
+class HashingWriterTest(unittest.TestCase):
+    """Unit test for HashingWriter class"""
+
+    def setUp(self):
+        """Sets up the results directory"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._results_dir = os.path.join(self._test_dir, "hashing_writer_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+        os.makedirs(self._results_dir)
+
+    def test_write(self):
+        """Tests the hash and size across buffer flushes and non-ASCII text"""
+
+        file_name = os.path.join(self._results_dir, "out.txt")
+        chunks = [f"line {i} µm\n" for i in range(1000)]
+        with HashingWriter(file_name, buffer_size=100) as out_fh:
+            for chunk in chunks:
+                out_fh.write(chunk)
+        with open(file_name, "rb") as in_fh:
+            data = in_fh.read()
+        self.assertEqual(data, "".join(chunks).encode("utf-8"))
+        self.assertEqual(out_fh.get_num_bytes(), len(data))
+        self.assertEqual(out_fh.get_sha256(), hashlib.sha256(data).hexdigest())
+
+    def test_empty(self):
+        """Tests an empty file"""
+
+        file_name = os.path.join(self._results_dir, "empty.txt")
+        with HashingWriter(file_name) as out_fh:
+            pass
+        self.assertEqual(os.path.getsize(file_name), 0)
+        self.assertEqual(out_fh.get_num_bytes(), 0)
+        self.assertEqual(out_fh.get_sha256(), hashlib.sha256(b"").hexdigest())
+
+
+if __name__ == "__main__":
+    unittest.main()
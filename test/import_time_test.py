@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "bench")))
+import import_time
+
+
+class ImportTimeTest(unittest.TestCase):
+    """Tests the startup imports of run.py"""
+
+    def test_lazy_imports(self):
+        """Tests that the memory classes and exporters aren't imported"""
+
+        records = import_time.measure("run")
+        self.assertEqual(import_time.get_eager_lazy_modules(records), [])
+        names = {name.rpartition(".")[2] for name, _, _, _ in records}
+        self.assertIn("memory_factory", names)
+
+    def test_budget(self):
+        """Tests the median import time against the budget of the benchmark"""
+
+        times_us = []
+        for _ in range(5):
+            records = import_time.measure("run")
+            times_us.append(import_time.get_script_time_us(records, "run"))
+        self.assertLess(sorted(times_us)[2], import_time.BUDGET_MS * 1000)
+
+    def test_parse(self):
+        """Tests parsing the -X importtime output"""
+
+        stderr = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:        10 |         10 |   child",
+                "import time:        20 |         30 | parent",
+                "unrelated line",
+            ]
+        )
+        records = import_time.parse_import_times(stderr)
+        self.assertListEqual(records, [("child", 1, 10, 10), ("parent", 0, 20, 30)])
+        self.assertEqual(import_time.get_script_time_us(records, "parent"), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
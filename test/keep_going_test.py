@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import shutil
+import unittest
+import subprocess
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from run_utils import RunUtils
+
+
+class KeepGoingTest(unittest.TestCase):
+    """Tests run.py --keep_going and --jobs"""
+
+    def setUp(self):
+        """Writes a config with two srams that fail"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._exec = os.path.join(self._test_dir, "..", "run.py")
+        self._results_dir = os.path.join(self._test_dir, "keep_going_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+        os.makedirs(self._results_dir)
+        json_data = RunUtils.get_config(
+            os.path.join(self._test_dir, "cfg", "spsram_example.cfg")
+        )
+        json_data["srams"] = [
+            {"name": "good_a", "width": 32, "depth": 64, "banks": 1},
+            {"name": "bad_banks", "width": 32, "depth": 64, "banks": 3},
+            {"name": "good_b", "width": 16, "depth": 32, "banks": 2},
+            {"name": "no_banks", "width": 16, "depth": 32},
+            {"name": "good_c", "width": 8, "depth": 16, "banks": 1},
+        ]
+        self._cfg_file_name = os.path.join(self._results_dir, "keep_going.cfg")
+        with open(self._cfg_file_name, "w") as out_fh:
+            json.dump(json_data, out_fh)
+
+    def _run(self, output_dir, *options):
+        """Runs run.py and returns the completed process"""
+
+        cmd = [sys.executable, self._exec, self._cfg_file_name]
+        cmd += ["--output_dir", output_dir] + list(options)
+        return subprocess.run(cmd, capture_output=True, text=True)
+
+    def _check_keep_going(self, output_dir, *options):
+        """Checks that the good srams are written and the bad ones reported"""
+
+        result = self._run(output_dir, "--keep_going", *options)
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("2 of 5 srams failed", result.stderr)
+        with open(os.path.join(output_dir, "errors.json")) as in_fh:
+            report = json.load(in_fh)
+        self.assertEqual(report["num_memories"], 5)
+        self.assertEqual(report["num_failed"], 2)
+        failures = report["failures"]
+        names = [failure["name"] for failure in failures]
+        self.assertListEqual(names, ["bad_banks", "no_banks"])
+        self.assertListEqual([failure["index"] for failure in failures], [1, 3])
+        self.assertListEqual(
+            [failure["stage"] for failure in failures], ["create", "config"]
+        )
+        self.assertIn("Unsupported number of banks", failures[0]["message"])
+        self.assertIn("Traceback", failures[0]["traceback"])
+        with open(os.path.join(output_dir, "manifest.json")) as in_fh:
+            manifest = json.load(in_fh)
+        names = [memory["name"] for memory in manifest["memories"]]
+        self.assertListEqual(names, ["good_a", "good_b", "good_c"])
+        for name in names:
+            lef_file_name = os.path.join(output_dir, name, name + ".lef")
+            self.assertTrue(os.path.isfile(lef_file_name))
+
+    def test_keep_going(self):
+        """Tests --keep_going with one and several jobs"""
+
+        self._check_keep_going(os.path.join(self._results_dir, "serial"))
+        output_dir = os.path.join(self._results_dir, "parallel")
+        self._check_keep_going(output_dir, "--jobs", "3")
+
+    def test_stop(self):
+        """
+        Tests that without --keep_going the problems of every sram are
+        reported before anything is generated
+        """
+
+        output_dir = os.path.join(self._results_dir, "stop")
+        for options in [[], ["--jobs", "2"]]:
+            result = self._run(output_dir, *options)
+            self.assertNotEqual(result.returncode, 0)
+            self.assertIn("found 2 problems", result.stderr)
+            self.assertIn("srams[1] bad_banks: Unsupported number", result.stdout)
+            self.assertIn("srams[3] no_banks: missing banks", result.stdout)
+            self.assertFalse(os.path.exists(os.path.join(output_dir, "good_a")))
+            self.assertFalse(os.path.exists(os.path.join(output_dir, "errors.json")))
+
+    def test_report_cleanup(self):
+        """Tests that a successful run removes an old error report"""
+
+        output_dir = os.path.join(self._results_dir, "cleanup")
+        self._run(output_dir, "--keep_going")
+        self.assertTrue(os.path.exists(os.path.join(output_dir, "errors.json")))
+        with open(self._cfg_file_name) as in_fh:
+            json_data = json.load(in_fh)
+        json_data["srams"] = [json_data["srams"][0]]
+        with open(self._cfg_file_name, "w") as out_fh:
+            json.dump(json_data, out_fh)
+        result = self._run(output_dir, "--keep_going", "-j", "2")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertFalse(os.path.exists(os.path.join(output_dir, "errors.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
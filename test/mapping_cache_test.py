@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from mapping_cache import MappingCache
+
+
+class MappingCacheTest(unittest.TestCase):
+    """Unit test for MappingCache class"""
+
+    def setUp(self):
+        """Copies the example mapping file to a temporary directory"""
+
+        self._temp_dir = tempfile.mkdtemp()
+        src_file = os.path.join(os.path.dirname(__file__), "cfg", "csv_map.py")
+        self._mapping_file = os.path.join(self._temp_dir, "csv_map.py")
+        shutil.copyfile(src_file, self._mapping_file)
+        self._pin_type_map = {"addr_i": "address_bus", "clk": "clock"}
+        self._key_map = {"NumWords": {"key": "depth", "type": int}}
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def test_round_trip(self):
+        """Tests saving and loading the maps"""
+
+        cache = MappingCache(self._mapping_file)
+        self.assertEqual(
+            cache.get_cache_file_name(), self._mapping_file + MappingCache.suffix
+        )
+        self.assertIsNone(cache.load())
+        self.assertTrue(cache.save(self._pin_type_map, self._key_map))
+        self.assertTrue(os.path.exists(cache.get_cache_file_name()))
+        (pin_type_map, key_map) = MappingCache(self._mapping_file).load()
+        self.assertDictEqual(pin_type_map, self._pin_type_map)
+        self.assertDictEqual(key_map, self._key_map)
+        self.assertIs(key_map["NumWords"]["type"], int)
+
+    def test_stale_cache(self):
+        """Tests that editing the mapping file invalidates the cache"""
+
+        cache = MappingCache(self._mapping_file)
+        cache.save(self._pin_type_map, self._key_map)
+        with open(self._mapping_file, "a") as out_fh:
+            out_fh.write("\n# edited\n")
+        self.assertIsNone(cache.load())
+
+    def test_corrupt_cache(self):
+        """Tests that an unreadable cache is ignored"""
+
+        cache = MappingCache(self._mapping_file)
+        with open(cache.get_cache_file_name(), "w") as out_fh:
+            out_fh.write("not a pickle")
+        self.assertIsNone(cache.load())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import io
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from class_process import Process
+from timing_data import TimingData
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from single_port_ram_liberty_exporter import SinglePortRAMLibertyExporter
+from test_utils import TestUtils
+
+
+class NLDMModelTest(unittest.TestCase):
+    """Unit test for NLDMModel class"""
+
+    def setUp(self):
+        """Sets up the NLDM config"""
+
+        self._nldm_data = {
+            "size": [7, 5],
+            "delay_slew_sensitivity": 0.1,
+            "drive_resistance_kohm": 0.5,
+            "constraint_slew_sensitivity": 0.05,
+            "power_slew_sensitivity": 0.2,
+        }
+
+    def test_default(self):
+        """Tests that the default tables have the same value in every entry"""
+
+        timing_data = TimingData()
+        self.assertEqual(timing_data.get_num_slew_indices(), 2)
+        self.assertEqual(timing_data.get_num_load_indices(), 2)
+        model = timing_data.get_nldm_model()
+        self.assertIs(model, timing_data.get_nldm_model())
+        self.assertEqual(
+            model.get_delay_rows(0.2183, ""), '"0.218, 0.218", \\\n"0.218, 0.218" \\\n'
+        )
+        self.assertEqual(
+            model.get_transition_row(),
+            "%.3f, %.3f" % (timing_data.get_min_slew(), timing_data.get_max_slew()),
+        )
+        self.assertEqual(model.get_power_row(1.5), "1.500, 1.500")
+
+    def test_tables(self):
+        """Tests the table sizes and values"""
+
+        timing_data = TimingData({"nldm": self._nldm_data})
+        slews = timing_data.get_slew_index_values()
+        loads = timing_data.get_load_index_values()
+        self.assertEqual(len(slews), 7)
+        self.assertEqual(len(loads), 5)
+        self.assertEqual(slews[0], timing_data.get_min_slew())
+        self.assertEqual(slews[-1], timing_data.get_max_slew())
+        self.assertEqual(len(timing_data.get_slew_indices_str().split(",")), 7)
+        model = timing_data.get_nldm_model()
+        delay_rows = model.get_delay_rows(0.2, "").splitlines()
+        self.assertEqual(len(delay_rows), 7)
+        last_row = [float(val) for val in delay_rows[-1].strip('"\\ ,').split(",")]
+        self.assertEqual(len(last_row), 5)
+        expected = 0.2 + 0.1 * (slews[-1] - slews[0]) + 0.5 * (loads[-1] - loads[0])
+        self.assertAlmostEqual(last_row[-1], expected, places=3)
+        setup_rows = model.get_constraint_rows(0.05, False, "").splitlines()
+        hold_rows = model.get_constraint_rows(0.05, True, "").splitlines()
+        setup_first = [float(val) for val in setup_rows[0].strip('"\\ ,').split(",")]
+        hold_first = [float(val) for val in hold_rows[0].strip('"\\ ,').split(",")]
+        self.assertLess(setup_first[0], setup_first[-1])
+        self.assertGreater(hold_first[0], hold_first[-1])
+        power_row = [float(val) for val in model.get_power_row(1.0).split(",")]
+        self.assertEqual(len(power_row), 7)
+        self.assertEqual(power_row[0], 1.0)
+
+    def test_errors(self):
+        """Tests the invalid NLDM configs"""
+
+        with self.assertRaises(Exception):
+            TimingData({"nldm": {"size": 1}})
+        with self.assertRaises(Exception):
+            TimingData({"nldm": {"bogus": 1}})
+
+    def test_liberty(self):
+        """Tests the table templates and tables in the Liberty output"""
+
+        timing_data = TimingData({"nldm": self._nldm_data})
+        mem_config = MemoryConfig("nldm_ram", 32, 256, 1, 0)
+        mem = MemoryFactory.create(
+            mem_config,
+            "RAM",
+            "SP",
+            Process(TestUtils.get_base_process_data()),
+            timing_data,
+        )
+        out_fh = io.StringIO()
+        SinglePortRAMLibertyExporter(mem).export(out_fh)
+        liberty = out_fh.getvalue()
+        self.assertIn('index_1 ("1000, 1001, 1002, 1003, 1004, 1005, 1006");', liberty)
+        self.assertIn('index_2 ("1000, 1001, 1002, 1003, 1004");', liberty)
+        self.assertIn(f'index_2 ("{timing_data.get_load_indices_str()}");', liberty)
+
+
+if __name__ == "__main__":
+    unittest.main()
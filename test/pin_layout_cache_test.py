@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import shutil
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from pin_layout_cache import PinLayoutCache
+from class_process import Process
+from timing_data import TimingData
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from test_utils import TestUtils
+
+
+class PinLayoutCacheTest(unittest.TestCase):
+    """Unit test for PinLayoutCache class"""
+
+    def setUp(self):
+        """Clears the cache"""
+
+        self._process = Process(TestUtils.get_base_process_data())
+        self._cache_dir = os.path.join(
+            os.path.abspath(os.path.dirname(__file__)), "pin_layout_cache_results"
+        )
+        if os.path.isdir(self._cache_dir):
+            shutil.rmtree(self._cache_dir)
+        PinLayoutCache.clear()
+
+    def tearDown(self):
+        """Disables the on-disk cache"""
+
+        PinLayoutCache.set_cache_dir(None)
+        PinLayoutCache.clear()
+
+    def _create_memory(self, name, width, depth, num_banks):
+        """Creates a memory, which creates its ports"""
+
+        mem_config = MemoryConfig(name, width, depth, num_banks, 0)
+        timing_data = TimingData()
+        return MemoryFactory.create(mem_config, "RAM", "SP", self._process, timing_data)
+
+    @staticmethod
+    def _get_rects(memory):
+        """Returns the rects of each signal and pg port"""
+
+        ports = dict(memory.get_ports())
+        ports.update(memory.get_pg_ports())
+        return {name: port.get_rects() for name, port in ports.items()}
+
+    def test_lru(self):
+        """Tests the hits, misses and eviction"""
+
+        old_max_size = PinLayoutCache.max_size
+        PinLayoutCache.max_size = 2
+        try:
+            for key in ["a", "b", "a", "c", "b"]:
+                layout = PinLayoutCache.get(key, lambda: [key])
+                self.assertListEqual(layout, [key])
+        finally:
+            PinLayoutCache.max_size = old_max_size
+        # b was evicted by c, since a was used more recently
+        self.assertDictEqual(
+            PinLayoutCache.get_stats(), {"hits": 1, "disk_hits": 0, "misses": 4}
+        )
+
+    def test_disk(self):
+        """Tests that the layouts are read back bit-identical"""
+
+        PinLayoutCache.set_cache_dir(self._cache_dir)
+        layout = [[0, 0.1 + 0.2, 1 / 3.0, 2.0**-30]]
+        self.assertIs(PinLayoutCache.get(("key", 0.3), lambda: layout), layout)
+        PinLayoutCache.clear()
+        cached = PinLayoutCache.get(("key", 0.3), lambda: None)
+        self.assertIsNot(cached, layout)
+        self.assertEqual(repr(cached), repr(layout))
+        self.assertEqual(PinLayoutCache.get_stats()["disk_hits"], 1)
+
+        # A broken cache file is recomputed
+        with open(PinLayoutCache.get_file_name(("key", 0.3)), "wb") as out_fh:
+            out_fh.write(b"broken")
+        PinLayoutCache.clear()
+        self.assertEqual(PinLayoutCache.get(("key", 0.3), lambda: [1]), [1])
+        self.assertEqual(PinLayoutCache.get_stats()["misses"], 1)
+
+    def test_memories(self):
+        """Tests that memories with the same layout share the rects"""
+
+        first = self._create_memory("first", 32, 256, 2)
+        stats = PinLayoutCache.get_stats()
+        self.assertEqual(stats["misses"], 2)
+        second = self._create_memory("second", 32, 256, 2)
+        self.assertEqual(PinLayoutCache.get_stats()["hits"], 2)
+        first_rects = self._get_rects(first)
+        second_rects = self._get_rects(second)
+        self.assertDictEqual(first_rects, second_rects)
+        self.assertIs(first_rects["addr_in[0]"][0], second_rects["addr_in[0]"][0])
+        self.assertIs(first_rects["VDD"][0], second_rects["VDD"][0])
+        # The shared rects can't be changed through one of the memories
+        with self.assertRaises(TypeError):
+            first_rects["VDD"][0][0] = 0.0
+        first_rects["addr_in[0]"].append((0, 0, 1, 1))
+        self.assertEqual(len(second_rects["addr_in[0]"]), 1)
+
+        # A different width changes the pins and the width of the straps
+        third = self._create_memory("third", 16, 256, 2)
+        self.assertEqual(PinLayoutCache.get_stats()["misses"], 4)
+        self.assertEqual(len(third.get_ports()), len(first.get_ports()) - 32)
+
+        # The layout from the on-disk cache is the same as the computed one
+        PinLayoutCache.set_cache_dir(self._cache_dir)
+        PinLayoutCache.clear()
+        computed = self._get_rects(self._create_memory("fourth", 8, 64, 1))
+        PinLayoutCache.clear()
+        cached = self._get_rects(self._create_memory("fourth", 8, 64, 1))
+        self.assertEqual(PinLayoutCache.get_stats()["disk_hits"], 2)
+        self.assertEqual(repr(computed), repr(cached))
+
+
+if __name__ == "__main__":
+    unittest.main()
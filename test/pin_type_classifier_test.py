@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from pin_type_classifier import PinTypeClassifier
+from ss_port_organizer import SSPortOrganizer
+
+
+class PinTypeClassifierTest(unittest.TestCase):
+    """Unit test for PinTypeClassifier class"""
+
+    def setUp(self):
+        """Sets up a pin type map with overlapping prefixes"""
+
+        self._pin_type_map = {
+            "VDD": "power",
+            "VDDA_CTL": "toggle_power",
+            "VSS": "ground",
+            "addr": "address_bus",
+            "clk": "clock",
+            "clk_gate": "mem_enable",
+        }
+
+    def test_exact_match(self):
+        """Tests that exact matches are returned"""
+
+        classifier = PinTypeClassifier(self._pin_type_map)
+        for name, pin_type in self._pin_type_map.items():
+            self.assertEqual(classifier.classify(name), pin_type)
+
+    def test_longest_prefix(self):
+        """Tests that the longest matching prefix wins"""
+
+        classifier = PinTypeClassifier(self._pin_type_map)
+        self.assertEqual(classifier.classify("VDDA"), "power")
+        self.assertEqual(classifier.classify("VDDA_CTL_1"), "toggle_power")
+        self.assertEqual(classifier.classify("clk_a"), "clock")
+        self.assertEqual(classifier.classify("clk_gate_en"), "mem_enable")
+        self.assertEqual(classifier.classify("addr_in"), "address_bus")
+        self.assertIsNone(classifier.classify("din"))
+        self.assertIsNone(classifier.classify(""))
+
+    def test_order_independent(self):
+        """Tests that the result doesn't depend on the map order"""
+
+        reversed_map = dict(reversed(list(self._pin_type_map.items())))
+        classifier = PinTypeClassifier(self._pin_type_map)
+        reversed_classifier = PinTypeClassifier(reversed_map)
+        for name in ["clk_gate_en", "clk_b", "VDDA_CTL_1", "VDD_1", "foo"]:
+            self.assertEqual(
+                classifier.classify(name), reversed_classifier.classify(name)
+            )
+
+    def test_organizer(self):
+        """Tests that the organizer uses the longest prefix match"""
+
+        organizer = SSPortOrganizer(self._pin_type_map)
+        self.assertEqual(organizer.classify_pin("clk_gate_en"), "mem_enable")
+        self.assertEqual(organizer.classify_pin("clk_a"), "clock")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -161,7 +161,7 @@ class ProcessTest(unittest.TestCase):
         """
 
         process = Process(self._base_data)
-        process._calc_y_step()
+        self.assertEqual(process._calc_y_step(), process.get_y_step())
         # 0.048 + (0.024 / 2) = 0.06
         self.assertEqual(process.get_y_step(), 0.06)
 
@@ -173,7 +173,7 @@ class ProcessTest(unittest.TestCase):
         base_data["pin_width_nm"] = 12
         process = Process(base_data)
         # 0.046 + (0.024 / 2) = 0.06
-        process._calc_y_step()
+        self.assertEqual(process._calc_y_step(), process.get_y_step())
         self.assertEqual(process.get_y_step(), 0.052)
 
 
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+import os
+import csv
+import sys
+import json
+import shutil
+import pstats
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from profiler import Profiler
+
+
+class ProfilerTest(unittest.TestCase):
+    """Unit test for Profiler class"""
+
+    def setUp(self):
+        """Sets up the results directory"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._results_dir = os.path.join(self._test_dir, "profiler_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+        os.makedirs(self._results_dir)
+
+    def tearDown(self):
+        """Makes sure profiling is off for the other tests"""
+        Profiler.deactivate()
+
+    def _profile_run(self):
+        """Profiles a fake run with two macros and returns the profiler"""
+
+        profiler = Profiler()
+        profiler.activate()
+        with Profiler.active_stage("", "config"):
+            pass
+        for macro, num_bytes in [("small", 10), ("large", 1000)]:
+            file_name = os.path.join(self._results_dir, macro + ".lib")
+            with Profiler.active_stage(macro, "create"):
+                with Profiler.active_stage(macro, "create_ports"):
+                    pass
+            with Profiler.active_stage(macro, "liberty", file_name):
+                with open(file_name, "w") as out_fh:
+                    out_fh.write("x" * num_bytes)
+        profiler.add_stage("large", "lef", 10**9)
+        return profiler
+
+    def test_inactive(self):
+        """Tests that the stages are ignored if profiling is off"""
+
+        self.assertIsNone(Profiler.get_active())
+        with Profiler.active_stage("macro", "create"):
+            pass
+        Profiler.record_memory(None)
+        Profiler.finish("unused.json", 10)
+
+    def test_stages(self):
+        """Tests the stage records and macro summaries"""
+
+        profiler = self._profile_run()
+        stages = [
+            (rec["macro"], rec["stage"], rec["depth"]) for rec in profiler.get_stages()
+        ]
+        self.assertEqual(stages[0], ("", "config", 0))
+        self.assertIn(("small", "create_ports", 1), stages)
+        self.assertIn(("small", "create", 0), stages)
+        (slowest,) = profiler.get_slowest_macros(1)
+        self.assertEqual(slowest["macro"], "large")
+        self.assertEqual(slowest["slowest_stage"], "lef")
+        self.assertEqual(slowest["bytes"], 1000)
+        summaries = {
+            summary["macro"]: summary for summary in profiler.get_macro_summaries()
+        }
+        small_stages = [rec for rec in profiler.get_stages() if rec["macro"] == "small"]
+        self.assertEqual(
+            summaries["small"]["wall_ns"],
+            sum(rec["wall_ns"] for rec in small_stages if rec["depth"] == 0),
+        )
+
+    def test_reports(self):
+        """Tests the JSON and CSV reports"""
+
+        profiler = self._profile_run()
+        json_file_name = os.path.join(self._results_dir, "report.json")
+        csv_file_name = os.path.join(self._results_dir, "report.csv")
+        profiler.write_report(json_file_name)
+        profiler.write_report(csv_file_name)
+        with open(json_file_name) as in_fh:
+            report = json.load(in_fh)
+        self.assertEqual(len(report["stages"]), 8)
+        self.assertEqual([mac["macro"] for mac in report["macros"]], ["small", "large"])
+        self.assertGreaterEqual(report["total_wall_ns"], 10**9)
+        with open(csv_file_name) as in_fh:
+            rows = list(csv.DictReader(in_fh))
+        self.assertEqual(len(rows), 8)
+        self.assertEqual(rows[-1]["stage"], "lef")
+
+    def test_cprofile(self):
+        """Tests running under cProfile"""
+
+        stats_file_name = os.path.join(self._results_dir, "run.prof")
+        self.assertEqual(Profiler.run(lambda: sum(range(100)), stats_file_name), 4950)
+        self.assertGreater(pstats.Stats(stats_file_name).total_calls, 0)
+        self.assertEqual(Profiler.run(lambda: 1), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
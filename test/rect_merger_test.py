@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import random
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from rect_merger import RectMerger
+from class_process import Process
+from timing_data import TimingData
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from test_utils import TestUtils
+
+
+class RectMergerTest(unittest.TestCase):
+    """Unit test for RectMerger class"""
+
+    def _area(self, rects):
+        return sum((rect[2] - rect[0]) * (rect[3] - rect[1]) for rect in rects)
+
+    def _covers(self, rects, x, y):
+        return any(
+            rect[0] <= x < rect[2] and rect[1] <= y < rect[3] for rect in rects
+        )
+
+    def _check_disjoint(self, rects):
+        for i, a in enumerate(rects):
+            for b in rects[i + 1 :]:
+                overlaps = a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+                self.assertFalse(overlaps, f"{a} overlaps {b}")
+
+    def test_merge_intervals(self):
+        """Tests merging of overlapping and abutting intervals"""
+
+        self.assertEqual(
+            RectMerger.merge_intervals([(5, 6), (0, 2), (2, 3), (1, 1.5)]),
+            [(0, 3), (5, 6)],
+        )
+
+    def test_simple_cases(self):
+        """Tests duplicate, overlapping, abutting and disjoint rects"""
+
+        self.assertEqual(RectMerger.merge([]), [])
+        self.assertEqual(
+            RectMerger.merge([[0, 0, 10, 10], [0, 0, 10, 10]]), [[0, 0, 10, 10]]
+        )
+        self.assertEqual(
+            RectMerger.merge([[0, 0, 6, 10], [4, 0, 10, 10]]), [[0, 0, 10, 10]]
+        )
+        self.assertEqual(
+            RectMerger.merge([[0, 0, 5, 10], [5, 0, 10, 10]]), [[0, 0, 10, 10]]
+        )
+        self.assertEqual(
+            RectMerger.merge([[0, 0, 10, 5], [0, 5, 10, 10]]), [[0, 0, 10, 10]]
+        )
+        self.assertEqual(
+            RectMerger.merge([[0, 0, 1, 1], [2, 2, 3, 3]]),
+            [[0, 0, 1, 1], [2, 2, 3, 3]],
+        )
+        # contained rect and zero area rect disappear
+        self.assertEqual(
+            RectMerger.merge([[0, 0, 10, 10], [2, 2, 3, 3], [4, 4, 4, 8]]),
+            [[0, 0, 10, 10]],
+        )
+
+    def test_random_union(self):
+        """Tests that the merged rects cover the same area without overlaps"""
+
+        rng = random.Random(1234)
+        rects = []
+        for _ in range(200):
+            x = rng.randint(0, 40)
+            y = rng.randint(0, 40)
+            rects.append([x, y, x + rng.randint(1, 10), y + rng.randint(1, 10)])
+        merged = RectMerger.merge(rects)
+        self.assertLess(len(merged), len(rects))
+        self._check_disjoint(merged)
+        covered = 0
+        for x in range(52):
+            for y in range(52):
+                in_rects = self._covers(rects, x + 0.5, y + 0.5)
+                self.assertEqual(in_rects, self._covers(merged, x + 0.5, y + 0.5))
+                covered += in_rects
+        self.assertEqual(self._area(merged), covered)
+
+    def test_memory_merge_obstructions(self):
+        """Tests merging the obstructions on a memory"""
+
+        process = Process(TestUtils.get_base_process_data())
+        mem_config = MemoryConfig("test", 32, 256, 1, 0)
+        mem = MemoryFactory.create(mem_config, "RAM", "SP", process, TimingData())
+        num_layers = len(mem.get_obstructions())
+        mem.add_obstruction("M9", [0, 0, 5, 5])
+        mem.add_obstruction("M9", [5, 0, 10, 5])
+        mem.add_obstruction("M9", [1, 1, 2, 2])
+        (before, after) = mem.merge_obstructions()
+        self.assertEqual(before, num_layers + 3)
+        self.assertEqual(after, num_layers + 1)
+        self.assertEqual(mem.get_obstructions()["M9"]["rects"], [[0, 0, 10, 5]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import shutil
+import unittest
+import subprocess
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from shard_planner import ShardPlanner
+from manifest import Manifest
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from class_process import Process
+from timing_data import TimingData
+from run_utils import RunUtils
+
+
+class ShardTest(unittest.TestCase):
+    """Unit test for the ShardPlanner and Manifest classes"""
+
+    def setUp(self):
+        """Sets up the results directory"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._script_dir = os.path.abspath(os.path.join(self._test_dir, ".."))
+        self._cfg_dir = os.path.join(self._test_dir, "cfg")
+        self._results_dir = os.path.join(self._test_dir, "shard_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+
+    def test_planner(self):
+        """Tests the balanced and deterministic assignment"""
+
+        costs = [100, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, 50, 50]
+        assignment = ShardPlanner.assign(costs, 2)
+        self.assertListEqual(assignment, ShardPlanner.assign(list(costs), 2))
+        loads = [0, 0]
+        for cost, shard in zip(costs, assignment):
+            loads[shard] += cost
+        self.assertListEqual(sorted(loads), [150, 150])
+        selected = [ShardPlanner(i, 3).select(costs) for i in range(3)]
+        self.assertListEqual(
+            sorted(index for indices in selected for index in indices),
+            list(range(len(costs))),
+        )
+        self.assertEqual(ShardPlanner(0, 4).select([]), [])
+        planner = ShardPlanner.from_string("2/5")
+        self.assertEqual(planner.get_shard_index(), 2)
+        self.assertEqual(planner.get_num_shards(), 5)
+        for shard in ["5/5", "-1/2", "1/0", "x/2", "1"]:
+            with self.assertRaises(Exception):
+                ShardPlanner.from_string(shard)
+
+    def test_count_pins(self):
+        """Tests that count_pins matches the pins of the created memory"""
+
+        cfg_file_name = os.path.join(self._cfg_dir, "spsram_example.cfg")
+        process = Process(RunUtils.get_config(cfg_file_name))
+        timing_data = TimingData()
+        mem_config = MemoryConfig("count_ram", 40, 200, 1, 0)
+        for memory_type in ["RAM", "RF"]:
+            for port_config in ["SP", "DP"]:
+                mem = MemoryFactory.create(
+                    mem_config, memory_type, port_config, process, timing_data
+                )
+                self.assertEqual(
+                    MemoryFactory.count_pins(mem_config, memory_type, port_config),
+                    mem.get_num_pins(),
+                )
+
+    def _run(self, cmd):
+        """Runs the command and returns the stdout"""
+
+        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        return result.stdout
+
+    def _check_merged(self, expected_names):
+        """Checks the merged manifest and returns its JSON data"""
+
+        with open(os.path.join(self._results_dir, "manifest.json")) as in_fh:
+            manifest = json.load(in_fh)
+        self.assertEqual(manifest["num_shards"], 2)
+        names = [memory["name"] for memory in manifest["memories"]]
+        self.assertListEqual(names, expected_names)
+        self.assertEqual({memory["shard"] for memory in manifest["memories"]}, {0, 1})
+        for memory in manifest["memories"]:
+            for file_record in memory["files"]:
+                file_name = os.path.join(self._results_dir, file_record["path"])
+                self.assertTrue(os.path.isfile(file_name))
+        return manifest
+
+    def test_run(self):
+        """Tests sharding run.py and merging the partial manifests"""
+
+        cfg_file_name = os.path.join(self._cfg_dir, "spsram_example.cfg")
+        cmd = [sys.executable, os.path.join(self._script_dir, "run.py")]
+        cmd += ["--output_dir", self._results_dir]
+        self._run(cmd + [cfg_file_name, "--shard", "0/2"])
+        with self.assertRaises(subprocess.CalledProcessError):
+            self._run(cmd + ["--merge_manifests"])
+        self._run(cmd + [cfg_file_name, "--shard", "1/2"])
+        self._run(cmd + ["--merge_manifests"])
+        srams = RunUtils.get_config(cfg_file_name)["srams"]
+        expected = [sram["name"] for sram in srams]
+        self._check_merged(expected)
+
+        # A shard that writes a memory twice is an error
+        partial_file_name = os.path.join(
+            self._results_dir, Manifest.get_partial_file_name(1, 2)
+        )
+        with open(partial_file_name) as in_fh:
+            partial = json.load(in_fh)
+        partial["memories"].append(Manifest.read(partial_file_name)["memories"][0])
+        partial["memories"][-1]["name"] = expected[0]
+        Manifest.write_json(partial_file_name, partial)
+        with self.assertRaises(Exception):
+            Manifest.merge(self._results_dir)
+
+        # A shard of another config is an error
+        partial["memories"].pop()
+        self.assertIsNotNone(partial["config_hash"])
+        Manifest.write_json(partial_file_name, partial)
+        Manifest.merge(self._results_dir)
+        partial["config_hash"] = "stale"
+        Manifest.write_json(partial_file_name, partial)
+        with self.assertRaisesRegex(Exception, "different configs"):
+            Manifest.merge(self._results_dir)
+
+    def test_entries(self):
+        """Tests that the entries are kept in a file until the manifest is written"""
+
+        manifest = Manifest(self._results_dir, ShardPlanner(0, 2), "hash")
+        self.assertListEqual(manifest.get_memories(), [])
+        for index in [2, 0, 1]:
+            manifest.add_entry({"name": f"ram_{index}", "index": index})
+        entries_file_name = manifest.get_entries_file_name()
+        self.assertTrue(os.path.isfile(entries_file_name))
+        self.assertListEqual(
+            [memory["index"] for memory in manifest.get_memories()], [0, 1, 2]
+        )
+        json_data = Manifest.read(manifest.write())
+        self.assertFalse(os.path.exists(entries_file_name))
+        self.assertEqual(json_data["config_hash"], "hash")
+        self.assertListEqual(
+            [memory["name"] for memory in json_data["memories"]],
+            ["ram_0", "ram_1", "ram_2"],
+        )
+
+    def test_spreadsheet(self):
+        """Tests sharding a spreadsheet batch"""
+
+        physical_files = ["sssram_64x256_physical.csv"]
+        physical_files.append("ss_dpsram_128x64_physical.csv")
+        cmd = [sys.executable, os.path.join(self._script_dir, "spreadsheet_ram.py")]
+        cmd += ["--config", os.path.join(self._cfg_dir, "spsram_example.cfg")]
+        cmd += ["--mem_config", os.path.join(self._cfg_dir, "ss_metrics.csv")]
+        cmd += ["--mapping", os.path.join(self._cfg_dir, "csv_map.py")]
+        cmd += ["--output_dir", self._results_dir, "--no_mapping_cache"]
+        cmd.append("--physical")
+        cmd += [os.path.join(self._cfg_dir, file_name) for file_name in physical_files]
+        for shard in ["0/2", "1/2"]:
+            self._run(cmd + ["--shard", shard])
+        Manifest.merge(self._results_dir)
+        self._check_merged(["sssram_64x256", "ss_dpsram_128x64"])
+
+
+if __name__ == "__main__":
+    unittest.main()
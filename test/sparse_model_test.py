@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import shutil
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from class_process import Process
+from timing_data import TimingData
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from verilog_options import VerilogOptions
+from run_utils import RunUtils
+from test_utils import TestUtils
+
+
+class SparseModelTest(unittest.TestCase):
+    """Tests the sparse (associative array) Verilog models"""
+
+    def setUp(self):
+        """Sets up the results directory"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._results_dir = os.path.join(self._test_dir, "sparse_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+        os.makedirs(self._results_dir)
+        self._process = Process(TestUtils.get_base_process_data())
+
+    def _create_memory(self, memory_type, port_config, threshold):
+        """Creates a 32 bit x 256 word memory with the given threshold"""
+
+        name = f"sparse_{memory_type}_{port_config}_{threshold}"
+        mem_config = MemoryConfig(name, 32, 256, 1, 0)
+        mem = MemoryFactory.create(
+            mem_config, memory_type, port_config, self._process, TimingData()
+        )
+        mem.set_verilog_options(
+            VerilogOptions({"sparse_model_threshold_bits": threshold})
+        )
+        return mem
+
+    def _write_model(self, memory_type, port_config, threshold):
+        """
+        Writes the Verilog model and the sparse model, if there is one, and
+        returns their contents (None if there's no sparse model)
+        """
+
+        mem = self._create_memory(memory_type, port_config, threshold)
+        file_name = os.path.join(self._results_dir, mem.get_name() + ".v")
+        mem.write_verilog_file(file_name)
+        with open(file_name) as in_fh:
+            model = in_fh.read()
+        if not mem.has_sparse_model():
+            return (model, None)
+        sparse_file_name = RunUtils.get_sparse_model_file_name(file_name)
+        mem.write_sparse_model_file(sparse_file_name)
+        with open(sparse_file_name) as in_fh:
+            return (model, in_fh.read())
+
+    def test_threshold(self):
+        """Tests that the sparse model is only used above the threshold"""
+
+        options = VerilogOptions()
+        self.assertEqual(options.get_sparse_model_threshold_bits(), 0)
+        self.assertFalse(options.use_sparse_model(1 << 20, 64))
+        options = VerilogOptions({"sparse_model_threshold_bits": 8192})
+        self.assertTrue(options.use_sparse_model(256, 32))
+        self.assertFalse(options.use_sparse_model(255, 32))
+        for memory_type, port_config in [("RAM", "SP"), ("RAM", "DP"), ("RF", "SP")]:
+            (dense_model, sparse_model) = self._write_model(
+                memory_type, port_config, 8193
+            )
+            self.assertIsNone(sparse_model)
+            self.assertNotIn("[int]", dense_model)
+            self.assertNotIn("exists", dense_model)
+
+    def test_models(self):
+        """Tests the generated sparse models"""
+
+        # The Verilog model stays Verilog-2005 with the sparse model
+        for memory_type, port_config in [("RAM", "SP"), ("RAM", "DP"), ("RF", "SP")]:
+            (model, _) = self._write_model(memory_type, port_config, 8192)
+            for text in ["[int]", "exists", "delete"]:
+                self.assertNotIn(text, model)
+
+        (_, sp_ram) = self._write_model("RAM", "SP", 8192)
+        self.assertIn("mem [int];", sp_ram)
+        self.assertIn("mem.delete();", sp_ram)
+        self.assertNotIn("for (j = 0", sp_ram)
+        self.assertIn(
+            "rd_out <= ((^addr_in === 1'bx) || !mem.exists(addr_in)) ? 'x : mem[addr_in];",
+            sp_ram,
+        )
+        self.assertIn("if (^addr_in !== 1'bx) mem[addr_in] <= wd_in;", sp_ram)
+        (_, dp_ram) = self._write_model("RAM", "DP", 8192)
+        self.assertIn("mem [int];", dp_ram)
+        self.assertEqual(dp_ram.count("mem.delete();"), 2)
+        self.assertNotIn("mem[i] <=", dp_ram)
+        (_, sp_rf) = self._write_model("RF", "SP", 8192)
+        self.assertIn("mem [int];", sp_rf)
+        self.assertIn("mem.exists(", sp_rf)
+
+    def test_views(self):
+        """Tests that the sparse model is rendered as a separate view"""
+
+        mem = self._create_memory("RAM", "SP", 8192)
+        views = RunUtils.render_views(mem)
+        (view, base_name, contents) = views[-1]
+        self.assertEqual(view, "sparse_model")
+        self.assertEqual(base_name, mem.get_name() + "_sparse.sv")
+        self.assertIn("mem [int];", contents)
+        mem = self._create_memory("RAM", "SP", 0)
+        self.assertNotIn(
+            "sparse_model", [view for view, _, _ in RunUtils.render_views(mem)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
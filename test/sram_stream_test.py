@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import shutil
+import unittest
+import subprocess
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from run_utils import RunUtils
+from sram_stream import SramStream
+from config_validator import ConfigValidator
+
+
+class SramStreamTest(unittest.TestCase):
+    """Tests SramStream and configs with a srams_file"""
+
+    def setUp(self):
+        """Writes the srams of the example config to a JSON Lines file"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._exec = os.path.join(self._test_dir, "..", "run.py")
+        self._results_dir = os.path.join(self._test_dir, "sram_stream_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+        os.makedirs(self._results_dir)
+        json_data = RunUtils.get_config(
+            os.path.join(self._test_dir, "cfg", "spsram_example.cfg")
+        )
+        self._srams = json_data.pop("srams")
+        self._srams_file_name = os.path.join(self._results_dir, "srams.jsonl")
+        with open(self._srams_file_name, "w") as out_fh:
+            out_fh.write("# name, width, depth and banks of each sram\n")
+            for sram_data in self._srams:
+                out_fh.write(json.dumps(sram_data) + "\n\n")
+        json_data["srams_file"] = "srams.jsonl"
+        self._cfg_file_name = os.path.join(self._results_dir, "header.cfg")
+        with open(self._cfg_file_name, "w") as out_fh:
+            json.dump(json_data, out_fh)
+
+    def test_stream(self):
+        """Tests that the stream can be read more than once"""
+
+        json_data = RunUtils.get_config(self._cfg_file_name)
+        srams = json_data["srams"]
+        self.assertIsInstance(srams, SramStream)
+        self.assertEqual(srams.get_file_name(), self._srams_file_name)
+        self.assertListEqual(list(srams), self._srams)
+        self.assertListEqual(list(srams), self._srams)
+
+        with open(self._srams_file_name, "a") as out_fh:
+            out_fh.write('{"name": "broken", "width": 8\n')
+        with self.assertRaisesRegex(Exception, r"srams\.jsonl:8: invalid JSON"):
+            list(srams)
+        validator = ConfigValidator(json_data)
+        messages = [
+            ConfigValidator.format_problem(problem) for problem in validator.validate()
+        ]
+        self.assertEqual(len(messages), 1)
+        self.assertIn("srams.jsonl:8", messages[0])
+        self.assertEqual(validator.get_num_srams(), len(self._srams))
+
+    def test_both(self):
+        """Tests that a config can't have both srams and a srams_file"""
+
+        with open(self._cfg_file_name) as in_fh:
+            json_data = json.load(in_fh)
+        json_data["srams"] = self._srams
+        with open(self._cfg_file_name, "w") as out_fh:
+            json.dump(json_data, out_fh)
+        with self.assertRaisesRegex(Exception, "both srams and srams_file"):
+            RunUtils.get_config(self._cfg_file_name)
+
+    def test_run(self):
+        """Tests that run.py generates the streamed srams with several jobs"""
+
+        output_dir = os.path.join(self._results_dir, "out")
+        cmd = [sys.executable, self._exec, self._cfg_file_name]
+        cmd += ["--output_dir", output_dir, "--jobs", "2"]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        with open(os.path.join(output_dir, "manifest.json")) as in_fh:
+            manifest = json.load(in_fh)
+        self.assertListEqual(
+            [memory["name"] for memory in manifest["memories"]],
+            [sram_data["name"] for sram_data in self._srams],
+        )
+        self.assertListEqual(
+            [memory["index"] for memory in manifest["memories"]],
+            list(range(len(self._srams))),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import shutil
+import unittest
+import subprocess
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from run_utils import RunUtils
+from sram_sweep import SramSweep
+
+
+class SramSweepTest(unittest.TestCase):
+    """Tests SramSweep and run.py with sweep entries"""
+
+    def test_expand(self):
+        """Tests the order, names and values of the expanded entries"""
+
+        srams = [
+            {"name": "plain", "width": 8, "depth": 16, "banks": 1},
+            {
+                "name": "fakeram_{depth}x{width}_b{banks}",
+                "width": [8, 16],
+                "depth": {"range": [64, 256], "scale": "pow2"},
+                "banks": [1, 2],
+            },
+        ]
+        entries = list(SramSweep(srams))
+        self.assertEqual(len(entries), 1 + 2 * 3 * 2)
+        self.assertIs(entries[0], srams[0])
+        self.assertDictEqual(
+            entries[1], {"name": "fakeram_64x8_b1", "width": 8, "depth": 64, "banks": 1}
+        )
+        self.assertEqual(entries[2]["name"], "fakeram_64x8_b2")
+        self.assertEqual(entries[3]["name"], "fakeram_128x8_b1")
+        self.assertEqual(entries[-1]["name"], "fakeram_256x16_b2")
+        # Re-iterable
+        self.assertListEqual(list(SramSweep(srams)), entries)
+
+    def test_ranges(self):
+        """Tests linear ranges and invalid sweeps"""
+
+        sweep = {"name": "r{depth}", "depth": {"range": [10, 40], "step": 15}}
+        names = [entry["name"] for entry in SramSweep.expand(sweep)]
+        self.assertListEqual(names, ["r10", "r25", "r40"])
+        self.assertFalse(SramSweep.is_sweep({"name": "x{y}", "width": 8}))
+        for sweep, message in [
+            ({"name": "a", "depth": {"range": [8]}}, "expected"),
+            ({"name": "a", "depth": {"range": [8, 4]}}, "Empty depth range"),
+            ({"name": "a", "depth": {"range": [0, 4], "scale": "pow2"}}, "pow2"),
+            ({"name": "a", "depth": {"range": [1, 4], "scale": "log"}}, "scale"),
+            ({"name": "a", "width": []}, "Empty width list"),
+            ({"name": "a{bits}", "width": [8]}, "name template"),
+        ]:
+            with self.assertRaisesRegex(Exception, message):
+                list(SramSweep.expand(sweep))
+
+    def test_run(self):
+        """Tests that run.py generates a sweep with several jobs"""
+
+        test_dir = os.path.abspath(os.path.dirname(__file__))
+        results_dir = os.path.join(test_dir, "sram_sweep_results")
+        if os.path.isdir(results_dir):
+            shutil.rmtree(results_dir)
+        os.makedirs(results_dir)
+        json_data = RunUtils.get_config(
+            os.path.join(test_dir, "cfg", "spsram_example.cfg")
+        )
+        json_data["srams"] = [
+            {
+                "name": "sweep_{depth}x{width}",
+                "width": [16, 32],
+                "depth": {"range": [256, 512], "scale": "pow2"},
+                "banks": 2,
+            }
+        ]
+        cfg_file_name = os.path.join(results_dir, "sweep.cfg")
+        with open(cfg_file_name, "w") as out_fh:
+            json.dump(json_data, out_fh)
+        output_dir = os.path.join(results_dir, "out")
+        cmd = [sys.executable, os.path.join(test_dir, "..", "run.py"), cfg_file_name]
+        validate_cmd = cmd + ["--validate-only"]
+        result = subprocess.run(validate_cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("4 srams", result.stdout)
+        cmd += ["--output_dir", output_dir, "--jobs", "2"]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        with open(os.path.join(output_dir, "manifest.json")) as in_fh:
+            manifest = json.load(in_fh)
+        self.assertListEqual(
+            [memory["name"] for memory in manifest["memories"]],
+            ["sweep_256x16", "sweep_512x16", "sweep_256x32", "sweep_512x32"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
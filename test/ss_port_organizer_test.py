@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from ss_port_organizer import SSPortOrganizer
+
+
+class SSPortOrganizerTest(unittest.TestCase):
+    """Unit test for SSPortOrganizer class"""
+
+    def setUp(self):
+        """Sets up a pin type map and some pin data"""
+
+        self._pin_type_map = {
+            "addr_i": "address_bus",
+            "din_i": "data_bus",
+            "dout_o": "output_bus",
+            "we_i": "write_enable",
+            "clk": "clock",
+            "VSS": "ground",
+            "VDD": "power",
+        }
+        pin_names = ["addr_i[3]", "clk", "addr_i[0]", "rm_i[2]", "addr_i[1]"]
+        pin_names += ["rm_i[1]", "we_i", "VDD", "addr_i[2]", "ce_i"]
+        self._macro_data = {
+            "pin_data": {name: {"name": name} for name in pin_names}
+        }
+
+    def test_parse_pin_name(self):
+        """Tests splitting pin names into base name and bit index"""
+
+        self.assertEqual(SSPortOrganizer.parse_pin_name("addr_i[12]"), ("addr_i", 12))
+        self.assertEqual(SSPortOrganizer.parse_pin_name("clk"), ("clk", None))
+        pin_data = {"name": "din_i[7]"}
+        self.assertEqual(SSPortOrganizer.get_parsed_name(pin_data), ("din_i", 7))
+        self.assertEqual(pin_data["base_name"], "din_i")
+        self.assertEqual(pin_data["bit"], 7)
+
+    def test_organize_ports(self):
+        """Tests bus consolidation and grouping"""
+
+        organizer = SSPortOrganizer(self._pin_type_map)
+        organizer.organize_ports(self._macro_data)
+        rw_group = organizer.get_rw_groups()[""]
+        addr_bus = rw_group["address_bus"]
+        self.assertEqual(addr_bus["name"], "addr_i")
+        self.assertEqual(addr_bus["lsb"], 0)
+        self.assertEqual(addr_bus["msb"], 3)
+        self.assertEqual(rw_group["clock"]["name"], "clk")
+        self.assertEqual(rw_group["write_enable"]["name"], "we_i")
+        misc_busses = organizer.get_misc_busses()
+        self.assertEqual(len(misc_busses), 1)
+        self.assertEqual(misc_busses[0]["name"], "rm_i")
+        self.assertEqual(misc_busses[0]["lsb"], 1)
+        self.assertEqual(misc_busses[0]["msb"], 2)
+        misc_ports = [port["name"] for port in organizer.get_misc_ports()]
+        self.assertListEqual(misc_ports, ["VDD", "ce_i"])
+
+
+if __name__ == "__main__":
+    unittest.main()
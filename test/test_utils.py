@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import os
+import shutil
 
 
 class TestUtils:
@@ -35,3 +36,18 @@ class TestUtils:
         else:  # pragma: nocover
             exec_cmd = exec_name
         return exec_cmd
+
+    @staticmethod
+    def find_tool(test_case, tool_name):
+        """
+        Returns the path of a simulation or lint tool. If it isn't installed,
+        the test is skipped, except in CI (CI is set), where the tools are
+        installed and the test fails instead
+        """
+
+        tool = shutil.which(tool_name)
+        if tool:
+            return tool
+        if os.environ.get("CI"):
+            test_case.fail(f"{tool_name} not found")
+        test_case.skipTest(f"{tool_name} not found")  # pragma: no cover
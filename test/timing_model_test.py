@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import math
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from timing_model import TimingModel
+from memory_config import MemoryConfig
+
+
+class TimingModelTest(unittest.TestCase):
+    """Unit test for TimingModel class"""
+
+    def setUp(self):
+        """Sets up a model and some memory configurations"""
+
+        self._json_data = {
+            "cycle_time_ns": 0.5,
+            "timing_model": {
+                "access_time_ns": {"const": 0.1, "log2_depth": 0.01, "width": 0.001},
+                "standby_leakage_per_bank_mW": {"bits": 1e-5, "column_mux": 0.1},
+            },
+        }
+        self._mem_configs = [
+            MemoryConfig("small", 21, 64, 2, 0),
+            MemoryConfig("large", 39, 2048, 4, 0),
+        ]
+
+    def test_evaluate(self):
+        """Tests the per macro values"""
+
+        model = TimingModel(self._json_data)
+        self.assertFalse(model.is_empty())
+        values = model.evaluate(self._mem_configs, 4)
+        for mem_config, macro_values in zip(self._mem_configs, values):
+            width = mem_config.get_width_in_bits()
+            depth = mem_config.get_depth()
+            self.assertAlmostEqual(
+                macro_values["access_time_ns"],
+                0.1 + 0.01 * math.log2(depth) + 0.001 * width,
+            )
+            self.assertAlmostEqual(
+                macro_values["standby_leakage_per_bank_mW"],
+                1e-5 * width * depth + 0.4,
+            )
+
+    def test_timing_data(self):
+        """Tests the TimingData created for each macro"""
+
+        model = TimingModel(self._json_data)
+        (small, large) = model.create_timing_data(
+            self._json_data, self._mem_configs, 1
+        )
+        self.assertLess(small.get_access_time(), large.get_access_time())
+        self.assertEqual(small.get_cycle_time(), 0.5)
+        self.assertEqual(large.get_cycle_time(), 0.5)
+        shared = TimingModel({}).create_timing_data({}, self._mem_configs, 1)
+        self.assertIs(shared[0], shared[1])
+
+    def test_errors(self):
+        """Tests the unsupported and negative values"""
+
+        with self.assertRaises(Exception):
+            TimingModel({"timing_model": {"bogus_ns": {"const": 1}}})
+        with self.assertRaises(Exception):
+            TimingModel({"timing_model": {"access_time_ns": {"area": 1}}})
+        model = TimingModel({"timing_model": {"access_time_ns": {"const": -1}}})
+        with self.assertRaises(Exception):
+            model.evaluate(self._mem_configs, 1)
+
+    def test_zero(self):
+        """Tests that a value can be 0"""
+
+        model = TimingModel({"timing_model": {"t_hold_ns": {"const": 0}}})
+        for macro_values in model.evaluate(self._mem_configs, 1):
+            self.assertEqual(macro_values["t_hold_ns"], 0.0)
+        (timing_data, _) = model.create_timing_data({}, self._mem_configs, 1)
+        self.assertEqual(timing_data.get_hold_time(), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from write_pipeline import WritePipeline
+from profiler import Profiler
+
+
+class WritePipelineTest(unittest.TestCase):
+    """Unit test for WritePipeline class"""
+
+    def tearDown(self):
+        """Turns profiling off"""
+        Profiler.deactivate()
+
+    def _run(self, pipeline, num_writes):
+        """Submits writes that return their number and returns the results"""
+
+        results = []
+
+        def write(number):
+            # The later writes finish first
+            time.sleep(0.001 * (num_writes - number))
+            return number
+
+        with pipeline:
+            for number in range(num_writes):
+                results += pipeline.submit(lambda number=number: write(number))
+                # At most max_pending writes are outstanding
+                self.assertLessEqual(
+                    number + 1 - len(results), pipeline.get_max_pending()
+                )
+            results += list(pipeline.drain())
+        return results
+
+    def test_order(self):
+        """Tests that the results are returned in order"""
+
+        profiler = Profiler()
+        profiler.activate()
+        pipeline = WritePipeline(3, 4)
+        self.assertListEqual(self._run(pipeline, 20), list(range(20)))
+        stats = profiler.get_queue_stats()["write"]
+        self.assertEqual(stats["samples"], 20)
+        self.assertEqual(stats["max"], 4)
+
+    def test_no_writers(self):
+        """Tests that the writes are done when submitted without writers"""
+
+        pipeline = WritePipeline(0)
+        with pipeline:
+            self.assertListEqual(pipeline.submit(lambda: "done"), ["done"])
+            self.assertListEqual(list(pipeline.drain()), [])
+
+    def test_error(self):
+        """Tests that the exception of a write is raised"""
+
+        def fail():
+            raise Exception("disk full")
+
+        with self.assertRaisesRegex(Exception, "disk full"):
+            with WritePipeline(2, 2) as pipeline:
+                for write_fn in [fail, lambda: 1, lambda: 2, lambda: 3]:
+                    pipeline.submit(write_fn)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import shutil
+import unittest
+import subprocess
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "utils")))
+from class_process import Process
+from timing_data import TimingData
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from verilog_options import VerilogOptions
+from test_utils import TestUtils
+
+
+class XCorruptionTest(unittest.TestCase):
+    """Tests the single port RAM Verilog X corruption styles"""
+
+    def setUp(self):
+        """Sets up the results directory"""
+
+        self._test_dir = os.path.abspath(os.path.dirname(__file__))
+        self._results_dir = os.path.join(self._test_dir, "xcorrupt_results")
+        if os.path.isdir(self._results_dir):
+            shutil.rmtree(self._results_dir)
+        os.makedirs(self._results_dir)
+        self._process = Process(TestUtils.get_base_process_data())
+
+    def _write_model(self, name, style):
+        """Writes an 8 bit x 16 word model with the given style"""
+
+        mem_config = MemoryConfig(name, 8, 16, 1, 0)
+        mem = MemoryFactory.create(
+            mem_config, "RAM", "SP", self._process, TimingData()
+        )
+        mem.set_verilog_options(VerilogOptions({"x_corruption_style": style}))
+        file_name = os.path.join(self._results_dir, name + ".v")
+        mem.write_verilog_file(file_name)
+        with open(file_name) as in_fh:
+            return in_fh.read()
+
+    def test_styles(self):
+        """Tests the generated models and runs the testbench if possible"""
+
+        loop_model = self._write_model("xcorrupt_loop", "loop")
+        gen_model = self._write_model("xcorrupt_gen", "generation")
+        self.assertIn("for (j = 0; j < WORD_DEPTH; j = j + 1)", loop_model)
+        self.assertNotIn("cur_gen", loop_model)
+        self.assertNotIn("mem[j] <= 'x;", gen_model)
+        self.assertIn("mem_gen[g] = 0;", gen_model)
+        self.assertIn("cur_gen <= cur_gen + 1;", gen_model)
+        self.assertIn("mem_gen[addr_in] <= cur_gen;", gen_model)
+        with self.assertRaises(Exception):
+            VerilogOptions({"x_corruption_style": "bogus"})
+
+        iverilog = TestUtils.find_tool(self, "iverilog")
+        tb_file = os.path.join(self._test_dir, "tb", "x_corruption_tb.v")
+        sim_file = os.path.join(self._results_dir, "x_corruption_tb.vvp")
+        subprocess.run(
+            [
+                iverilog,
+                # The models use SystemVerilog unbased literals ('x)
+                "-g2012",
+                "-o",
+                sim_file,
+                tb_file,
+                os.path.join(self._results_dir, "xcorrupt_loop.v"),
+                os.path.join(self._results_dir, "xcorrupt_gen.v"),
+            ],
+            check=True,
+        )
+        out = subprocess.run(
+            ["vvp", sim_file], check=True, capture_output=True, text=True
+        )
+        self.assertIn("PASS", out.stdout, out.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
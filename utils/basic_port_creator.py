@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 from port import Port
+from pin_layout_cache import PinLayoutCache
 
 
 class BasicPortCreator:
@@ -44,35 +45,45 @@ class BasicPortCreator:
         )
         self.create_obs(metal_layer, metal_prefix, w, h)
 
-    def create_signal_pins(self, pin_pitch, group_pitch):
-        """Creates the signal pin/port shapes"""
+    def get_signal_pins(self):
+        """
+        Returns the (name, direction) of each signal pin from the bottom up,
+        with None where a group pitch separates two groups of pins
+        """
 
-        y_step = self._mem.get_process_data().y_step
+        pins = []
         for rw_port_group in self._mem.get_rw_port_groups():
-            y_step = self.create_signals(rw_port_group, y_step, pin_pitch, group_pitch)
-        for rw_port_group in self._mem.get_rw_port_groups():
-            y_step = self.add_pin(
-                rw_port_group.get_write_enable_name(),
-                Port.Direction.INPUT,
-                y_step,
-                pin_pitch,
+            bits = self._mem.get_width()
+            # rw signal bundle, comprised of dout, din, addr busses
+            pins += self.get_bus_pins(
+                rw_port_group.get_data_output_bus_name(),
+                0,
+                bits,
+                Port.Direction.OUTPUT,
             )
-            y_step = self.add_pin(
-                rw_port_group.get_clock_name(), Port.Direction.INPUT, y_step, pin_pitch
+            pins.append(None)
+            pins += self.get_bus_pins(
+                rw_port_group.get_data_input_bus_name(), 0, bits, Port.Direction.INPUT
             )
-        for bus_data in self._mem.get_misc_busses():
-            y_step += group_pitch
-            y_step = self.write_signal_bus(
-                bus_data["name"],
-                bus_data["lsb"],
-                bus_data["msb"],
+            pins.append(None)
+            pins += self.get_bus_pins(
+                rw_port_group.get_address_bus_name(),
+                0,
+                self._mem.get_addr_width(),
                 Port.Direction.INPUT,
-                y_step,
-                pin_pitch,
+            )
+            pins.append(None)
+        for rw_port_group in self._mem.get_rw_port_groups():
+            pins.append((rw_port_group.get_write_enable_name(), Port.Direction.INPUT))
+            pins.append((rw_port_group.get_clock_name(), Port.Direction.INPUT))
+        for bus_data in self._mem.get_misc_busses():
+            pins.append(None)
+            pins += self.get_bus_pins(
+                bus_data["name"], bus_data["lsb"], bus_data["msb"], Port.Direction.INPUT
             )
         for port_name in self._mem.get_misc_ports():
-            port = self._mem.get_port(port_name)
-            y_step = self.add_pin(port_name, Port.Direction.INPUT, y_step, pin_pitch)
+            pins.append((port_name, Port.Direction.INPUT))
+        return pins
 
     def create_signals(self, rw_port_group, y_step, pin_pitch, group_pitch):
         """creates rw signal bundle, comprised of dout, din, addr busses"""
@@ -115,27 +126,108 @@ class BasicPortCreator:
             y_step = self.add_pin(name_format % i, direction, y_step, pin_pitch)
         return y_step
 
-    def add_pin(self, pin_name, direction, y, pitch):
+    def get_bus_pins(self, name, lsb, msb, direction):
+        """Returns the (name, direction) of the individual pins of a bus"""
+
+        name_format = f"{name}[%d]"
+        return [(name_format % i, direction) for i in range(lsb, msb)]
+
+    def get_signal_layout_key(self, pins, pin_pitch, group_pitch):
         """
-        Helper function that adds a signal pin
+        Returns the PinLayoutCache key of the signal pin rects: the values
+        they're computed from and the number of pins in each group
         """
+
         process = self._mem.get_process_data()
-        layer = process.get_metal_layer()
-        pw = process.get_pin_width_um()
-        hpw = process.get_pin_width_um() / 2.0
+        group_sizes = []
+        group_size = 0
+        for pin in pins:
+            if pin is None:
+                group_sizes.append(group_size)
+                group_size = 0
+            else:
+                group_size += 1
+        group_sizes.append(group_size)
+        return (
+            "signal",
+            process.get_y_step(),
+            process.get_pin_width_um(),
+            self._rect_pin_mode,
+            pin_pitch,
+            group_pitch,
+            tuple(group_sizes),
+        )
+
+    def compute_signal_rects(self, pins, pin_pitch, group_pitch):
+        """
+        Returns a tuple with the rect of each signal pin. The rects are
+        tuples, so the layouts shared through PinLayoutCache can't be
+        changed by one of the memories
+        """
+
+        rects = []
+        y_step = self._mem.get_process_data().get_y_step()
+        for pin in pins:
+            if pin is None:
+                y_step += group_pitch
+            else:
+                rects.append(self.get_pin_rect(y_step))
+                y_step += pin_pitch
+        return tuple(rects)
+
+    def create_signal_pins(self, pin_pitch, group_pitch):
+        """
+        Creates the signal pin/port shapes. The rects are shared with the
+        memories that have the same layout (see PinLayoutCache)
+        """
+
+        pins = self.get_signal_pins()
+        rects = PinLayoutCache.get(
+            self.get_signal_layout_key(pins, pin_pitch, group_pitch),
+            lambda: self.compute_signal_rects(pins, pin_pitch, group_pitch),
+        )
+        signal_pins = (pin for pin in pins if pin is not None)
+        for (pin_name, direction), rect in zip(signal_pins, rects):
+            self.add_signal_pin(pin_name, direction, rect)
+
+    def get_pin_rect(self, y):
+        """Returns the rect of a signal pin centered on y as a tuple"""
+
+        pw = self._mem.get_process_data().get_pin_width_um()
+        hpw = pw / 2.0
         # half pin width
+        if self._rect_pin_mode:
+            # make pins a little longer in the X direction
+            return (0, y - hpw, pw + hpw, y + hpw)
+        return (0, y - hpw, pw, y + hpw)
+
+    def add_signal_pin(self, pin_name, direction, rect):
+        """Adds a signal pin with the rect"""
 
         port = Port(pin_name)
         port.set_direction(direction)
-        port.set_layer(layer)
-        if self._rect_pin_mode:
-            # make pins a little longer in the X direction
-            port.add_rect([0, y - hpw, pw + hpw, y + hpw])
-        else:
-            port.add_rect([0, y - hpw, pw, y + hpw])
+        port.set_layer(self._mem.get_process_data().get_metal_layer())
+        port.add_rect(rect)
         self._mem.add_port(port)
+
+    def add_pin(self, pin_name, direction, y, pitch):
+        """
+        Helper function that adds a signal pin
+        """
+
+        self.add_signal_pin(pin_name, direction, self.get_pin_rect(y))
         return y + pitch
 
+    def add_pg_pin(self, pin_name, pin_use, metal_layer, rects):
+        """Adds a power/ground pin with the rects"""
+
+        port = Port(pin_name)
+        port.set_direction(Port.Direction.INOUT)
+        port.set_use(pin_use)
+        port.set_layer(metal_layer)
+        port.add_rects(rects)
+        self._mem.add_pg_port(port)
+
     def create_pg_pin(
         self,
         pin_name,
@@ -151,12 +243,7 @@ class BasicPortCreator:
     ):
         """Writes a power/ground pin"""
 
-        port = Port(pin_name)
-        port.set_direction(Port.Direction.INOUT)
-        port.set_use(pin_use)
-        port.set_layer(metal_layer)
-        self.create_pg_shapes(
-            port,
+        rects = self.get_pg_rects(
             w,
             h,
             y_step,
@@ -165,7 +252,7 @@ class BasicPortCreator:
             supply_pin_half_width,
             supply_pin_pitch,
         )
-        self._mem.add_pg_port(port)
+        self.add_pg_pin(pin_name, pin_use, metal_layer, rects)
 
     def create_pg_shapes(
         self,
@@ -180,26 +267,72 @@ class BasicPortCreator:
     ):
         """Creates power/ground shapes"""
 
+        port.add_rects(
+            self.get_pg_rects(
+                w,
+                h,
+                y_step,
+                x_offset,
+                y_offset,
+                supply_pin_half_width,
+                supply_pin_pitch,
+            )
+        )
+
+    def get_pg_rects(
+        self,
+        w,
+        h,
+        y_step,
+        x_offset,
+        y_offset,
+        supply_pin_half_width,
+        supply_pin_pitch,
+    ):
+        """Returns a tuple with the power/ground shapes, each a tuple"""
+
+        rects = []
         # if in rect_pin_mode we start the pin two offsets in to avoid
         # spacing issues with the signal pin
         mod_x_offset = x_offset * (self._rect_pin_mode + 1)
         while y_step <= h - y_offset:
-            port.add_rect(
-                [
+            rects.append(
+                (
                     mod_x_offset,
                     y_step - supply_pin_half_width,
                     w - mod_x_offset,
                     y_step + supply_pin_half_width,
-                ]
+                )
             )
             y_step += (
                 supply_pin_pitch * 2
             )  # this *2 is important because we want alternate VDD and VSS pins
+        return tuple(rects)
+
+    def get_pg_layout_key(self, min_pin_width, min_pin_pitch, x_offset, y_offset, w, h):
+        """
+        Returns the PinLayoutCache key of the power/ground strap rects: the
+        values they're computed from
+        """
+
+        return (
+            "pg",
+            min_pin_width,
+            min_pin_pitch,
+            x_offset,
+            y_offset,
+            w,
+            h,
+            self._rect_pin_mode,
+        )
 
     def create_pg_straps(
         self, min_pin_width, min_pin_pitch, x_offset, y_offset, w, h, metal_layer
     ):
-        """Create power/ground straps"""
+        """
+        Create power/ground straps. The rects are shared with the memories
+        that have the same layout (see PinLayoutCache)
+        """
 
         supply_pin_width = min_pin_width * 4
         supply_pin_half_width = supply_pin_width / 2
@@ -208,33 +341,30 @@ class BasicPortCreator:
 
         ## Create supply pins  : How are we ensuring that supply pins don't overlap
         ## with the signal pins? Is it by giving x_offset as the base x coordinate ?
-        y_step = y_offset
-        self.create_pg_pin(
-            "VSS",
-            "GROUND",
-            metal_layer,
-            w,
-            h,
-            y_step,
-            x_offset,
-            y_offset,
-            supply_pin_half_width,
-            supply_pin_pitch,
-        )
+        def compute_pg_rects():
+            # VSS starts at y_offset and VDD one supply pin pitch above it
+            return {
+                pin_name: self.get_pg_rects(
+                    w,
+                    h,
+                    y_step,
+                    x_offset,
+                    y_offset,
+                    supply_pin_half_width,
+                    supply_pin_pitch,
+                )
+                for pin_name, y_step in [
+                    ("VSS", y_offset),
+                    ("VDD", y_offset + supply_pin_pitch),
+                ]
+            }
 
-        y_step = y_offset + supply_pin_pitch
-        self.create_pg_pin(
-            "VDD",
-            "POWER",
-            metal_layer,
-            w,
-            h,
-            y_step,
-            x_offset,
-            y_offset,
-            supply_pin_half_width,
-            supply_pin_pitch,
+        key = self.get_pg_layout_key(
+            min_pin_width, min_pin_pitch, x_offset, y_offset, w, h
         )
+        pg_rects = PinLayoutCache.get(key, compute_pg_rects)
+        self.add_pg_pin("VSS", "GROUND", metal_layer, pg_rects["VSS"])
+        self.add_pg_pin("VDD", "POWER", metal_layer, pg_rects["VDD"])
 
     def create_obs(self, metal_layer, metal_prefix, w, h):
         """Create obstructions"""
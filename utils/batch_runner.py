@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+
+import os
+import json
+import collections
+
+from run_utils import RunUtils
+from class_process import Process
+from manifest import Manifest
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from timing_model import TimingModel
+from verilog_options import VerilogOptions
+from profiler import Profiler
+from write_pipeline import WritePipeline
+
+# BatchRunner of a worker process (see BatchRunner.init_worker)
+_worker_runner = None
+
+
+class BatchRunner:
+    """
+    Creates and writes the memories of a config
+
+    The srams[] entries are parsed and their timing data is created by
+    create_items, a chunk at a time by iter_items so that a lazy srams
+    stream (see SramStream) is never loaded at once. Each memory is then
+    created, rendered and optionally checked by render_item, and its files
+    are written by write_item on the writer threads of a WritePipeline, so
+    that the writes of a memory overlap with rendering the next ones. The
+    pipeline holds a bounded number of rendered memories. By default the
+    first exception is raised, which stops the run. With keep_going, the
+    exception is recorded as a failure (the memory name and index, the stage
+    that failed, the exception and its traceback) and the rest of the
+    memories are still generated. The failures can then be written to a JSON
+    error report.
+
+    Memories that only differ by name (see find_copies) are created and
+    rendered once, with a placeholder name, and the files of each one are
+    written by replacing the placeholder with its name. A full render of the
+    first memory of each group checks that this gives the same files (see
+    render_item).
+
+    With more than one job, the memories are generated by a pool of worker
+    processes, each with its own BatchRunner, and the results are gathered
+    in order by the parent. Profiling only covers the parent then. With
+    more than one thread (and a single job), the memories are generated by
+    a pool of threads that share the runner and its Process, which is
+    immutable, and the results are gathered in order the same way.
+    """
+
+    # Number of srams[] entries whose timing data is created in one batch
+    chunk_size = 256
+    # Number of items submitted ahead per job
+    pending_per_job = 4
+    # Name of the memory rendered for a group of copies (see render_item)
+    placeholder = "fakeram_name_placeholder__"
+
+    def __init__(
+        self,
+        json_data,
+        output_dir,
+        check_geometry=False,
+        keep_going=False,
+        num_jobs=1,
+        num_writers=2,
+        num_threads=1,
+    ):
+        """Initializer"""
+
+        self._json_data = json_data
+        self._output_dir = output_dir
+        self._check_geometry = check_geometry
+        self._keep_going = keep_going
+        self._num_jobs = max(1, num_jobs)
+        self._num_writers = num_writers
+        self._num_threads = max(1, num_threads)
+        self._process = Process(json_data)
+        self._verilog_options = VerilogOptions(json_data)
+        self._memory_type = json_data.get("memory_type", "RAM")
+        self._port_config = json_data.get("port_configuration", "SP")
+        # Only used to create the manifest entries
+        self._manifest = Manifest(output_dir)
+        self._failures = []
+        self._num_violations = 0
+        # index of the first sram of a group -> [(index, name)] of its copies
+        # and the indices of all copies (see find_copies)
+        self._copies = {}
+        self._copy_indices = set()
+
+    def get_process(self):
+        """Returns the process shared by the memories"""
+        return self._process
+
+    def get_failures(self):
+        """Returns the failures sorted by index"""
+        return sorted(self._failures, key=lambda failure: failure["index"])
+
+    def get_num_violations(self):
+        """Returns the number of geometry violations"""
+        return self._num_violations
+
+    @staticmethod
+    def get_failure(index, name, stage, ex):
+        """Returns the failure record of the exception being handled"""
+
+        # traceback is only needed once something has failed
+        import traceback
+
+        return {
+            "index": index,
+            "name": name,
+            "stage": stage,
+            "error_type": type(ex).__name__,
+            "message": str(ex),
+            "traceback": traceback.format_exc(),
+        }
+
+    def _add_failure(self, failure):
+        """Prints and records a failure"""
+
+        print(
+            "Error: {} failed in {}: {}: {}".format(
+                failure["name"],
+                failure["stage"],
+                failure["error_type"],
+                failure["message"],
+            )
+        )
+        self._failures.append(failure)
+
+    def get_cost(self, sram_data):
+        """
+        Returns the pin count of a srams[] entry, which is used to balance
+        shards, or 0 if the entry is invalid (it fails later in create_items)
+        """
+
+        try:
+            mem_config = MemoryConfig.from_json(sram_data)
+            return MemoryFactory.count_pins(
+                mem_config, self._memory_type, self._port_config
+            )
+        except Exception:
+            return 0
+
+    def create_items(self, srams):
+        """
+        Parses the (index, srams[] entry) pairs and returns the
+        (index, mem_config, timing_data) items that generate takes
+        """
+
+        parsed = []
+        for index, sram_data in srams:
+            try:
+                parsed.append((index, MemoryConfig.from_json(sram_data)))
+            except Exception as ex:
+                if not self._keep_going:
+                    raise
+                name = sram_data.get("name") if isinstance(sram_data, dict) else None
+                self._add_failure(self.get_failure(index, name, "config", ex))
+
+        timing_model = TimingModel(self._json_data)
+        column_mux = self._process.get_column_mux_factor()
+        mem_configs = [mem_config for _, mem_config in parsed]
+        try:
+            timing_data_list = timing_model.create_timing_data(
+                self._json_data, mem_configs, column_mux
+            )
+            return [
+                (index, mem_config, timing_data)
+                for (index, mem_config), timing_data in zip(parsed, timing_data_list)
+            ]
+        except Exception:
+            if not self._keep_going:
+                raise
+        # Find the memories the timing model fails on
+        items = []
+        for index, mem_config in parsed:
+            try:
+                (timing_data,) = timing_model.create_timing_data(
+                    self._json_data, [mem_config], column_mux
+                )
+                items.append((index, mem_config, timing_data))
+            except Exception as ex:
+                self._add_failure(
+                    self.get_failure(index, mem_config.get_name(), "timing_model", ex)
+                )
+        return items
+
+    @staticmethod
+    def get_dedup_key(mem_config):
+        """
+        Returns the normalized parameters of the memory, which are the same
+        for memories that only differ by name. The timing data only depends
+        on these parameters and the process
+        """
+
+        return (
+            mem_config.get_width_in_bits(),
+            mem_config.get_depth(),
+            mem_config.get_num_banks(),
+            float(mem_config.get_additional_height()),
+        )
+
+    def find_copies(self, srams):
+        """
+        Finds the (index, srams[] entry) pairs that only differ by name from
+        an earlier pair. Each group is rendered once by its first sram and
+        the files of the copies are written by replacing the name (see
+        render_item). Geometry checks are done on each memory, so
+        nothing is deduplicated with check_geometry
+        """
+
+        self._copies = {}
+        self._copy_indices = set()
+        if self._check_geometry:
+            return
+        # dedup key -> index of the first sram
+        first_indices = {}
+        for index, sram_data in srams:
+            try:
+                mem_config = MemoryConfig.from_json(sram_data)
+            except Exception:
+                # Fails in create_items
+                continue
+            key = self.get_dedup_key(mem_config)
+            first_index = first_indices.setdefault(key, index)
+            if first_index != index:
+                self._copies.setdefault(first_index, []).append(
+                    (index, mem_config.get_name())
+                )
+                self._copy_indices.add(index)
+
+    def get_num_copies(self):
+        """Returns the number of srams written as copies of another"""
+        return len(self._copy_indices)
+
+    def iter_items(self, srams):
+        """
+        Yields the (index, mem_config, timing_data) items of the (index,
+        srams[] entry) pairs, which can be a lazy iterable, chunk_size entries
+        at a time (see create_items)
+        """
+
+        chunk = []
+        for pair in srams:
+            if pair[0] in self._copy_indices:
+                # Written by the first sram of its group
+                continue
+            chunk.append(pair)
+            if len(chunk) == self.chunk_size:
+                yield from self._create_chunk_items(chunk)
+                chunk = []
+        if chunk:
+            yield from self._create_chunk_items(chunk)
+
+    def _create_chunk_items(self, chunk):
+        """Returns the items of a chunk of (index, srams[] entry) pairs"""
+
+        with Profiler.active_stage("", "timing_model"):
+            return self.create_items(chunk)
+
+    @staticmethod
+    def get_renamed_config(mem_config, name):
+        """Returns a copy of the memory configuration with another name"""
+
+        return MemoryConfig(
+            name,
+            mem_config.get_width_in_bits(),
+            mem_config.get_depth(),
+            mem_config.get_num_banks(),
+            mem_config.get_additional_height(),
+        )
+
+    def is_renamed_render(self, views, full_views, name):
+        """
+        Returns True if the views rendered with the placeholder name match
+        the full render of the named memory once the placeholder is replaced
+        """
+
+        return full_views == [
+            (
+                view,
+                base_name.replace(self.placeholder, name),
+                contents.replace(self.placeholder, name),
+            )
+            for view, base_name, contents in views
+        ]
+
+    def render_item(self, index, mem_config, timing_data):
+        """
+        Creates, renders and optionally checks the memory of an item and
+        returns a function that writes its files and returns its generate
+        result (see write_item), so that the writing can be done by a writer
+        thread (see WritePipeline)
+
+        The first sram of a group of copies (see find_copies) is created and
+        rendered once with a placeholder name, and written under its name
+        and the name of each copy. The first sram is also rendered under its
+        own name. If that doesn't match the placeholder render once renamed,
+        each sram of the group is rendered in full instead.
+        """
+
+        name = mem_config.get_name()
+        names = [(index, name)] + self._copies.get(index, [])
+        stage = "create"
+
+        def render(render_config):
+            nonlocal stage
+            stage = "create"
+            render_name = render_config.get_name()
+            with Profiler.active_stage(render_name, "create"):
+                memory = MemoryFactory.create(
+                    render_config,
+                    self._memory_type,
+                    self._port_config,
+                    self._process,
+                    timing_data,
+                )
+            memory.set_verilog_options(self._verilog_options)
+            stage = "render"
+            with Profiler.active_stage(render_name, "render"):
+                return (memory, RunUtils.render_views(memory))
+
+        try:
+            if len(names) == 1:
+                # (memory, views, [(index, name)] to write them under)
+                renders = [render(mem_config) + (names,)]
+            else:
+                (memory, views) = render(
+                    self.get_renamed_config(mem_config, self.placeholder)
+                )
+                (full_memory, full_views) = render(mem_config)
+                if self.is_renamed_render(views, full_views, name):
+                    renders = [(memory, views, names)]
+                else:
+                    # e.g. the Liberty date changed between the renders
+                    print(f"Warning: rendering the copies of {name} in full")
+                    renders = [(full_memory, full_views, names[:1])]
+                    for copy_index, copy_name in names[1:]:
+                        copy_config = self.get_renamed_config(mem_config, copy_name)
+                        renders.append(
+                            render(copy_config) + ([(copy_index, copy_name)],)
+                        )
+            num_violations = 0
+            if self._check_geometry:
+                stage = "check_geometry"
+                num_violations = RunUtils.check_geometry(renders[0][0])
+        except Exception as ex:
+            if not self._keep_going:
+                raise
+            results = [
+                {"failure": self.get_failure(copy_index, copy_name, stage, ex)}
+                for copy_index, copy_name in names
+            ]
+            return lambda: results
+        return lambda: self.write_item(renders, num_violations)
+
+    def write_item(self, renders, num_violations):
+        """
+        Writes the views of each (memory, views, [(index, name)]) rendered by
+        render_item under each of its (index, name) and returns a list with
+        the generate result of each: a dictionary with its manifest entry and
+        number of geometry violations or, with keep_going, its failure if it
+        failed
+        """
+
+        results = []
+        for memory, views, names in renders:
+            # view -> record of the file of the first name, for the views that
+            # don't depend on the name (only needed with copies)
+            links = {} if len(names) > 1 else None
+            for index, name in names:
+                try:
+                    file_records = RunUtils.write_views(
+                        name, views, memory.get_name(), self._output_dir, links
+                    )
+                except Exception as ex:
+                    if not self._keep_going:
+                        raise
+                    results.append(
+                        {"failure": self.get_failure(index, name, "write", ex)}
+                    )
+                    continue
+                Profiler.record_memory(memory, name)
+                entry = self._manifest.create_entry(memory, index, file_records, name)
+                results.append({"entry": entry, "num_violations": num_violations})
+        return results
+
+    def generate_item(self, index, mem_config, timing_data):
+        """
+        Creates, renders, checks and writes the memory of an item and returns
+        a list with the generate result of the sram and of its copies, if
+        it's the first sram of a group
+        """
+
+        return self.render_item(index, mem_config, timing_data)()
+
+    def _add_results(self, results, manifest):
+        """Adds the results of generate_item"""
+
+        for result in results:
+            self._add_result(result, manifest)
+
+    def _add_result(self, result, manifest):
+        """Adds the result of generate to the manifest or the failures"""
+
+        failure = result.get("failure")
+        if failure:
+            self._add_failure(failure)
+        else:
+            manifest.add_entry(result["entry"])
+            self._num_violations += result["num_violations"]
+
+    def run(self, items, manifest):
+        """
+        Generates each (index, mem_config, timing_data) item, which can come
+        from a lazy iterable (see iter_items), and adds the memories to the
+        manifest
+        """
+
+        if self._num_jobs == 1 and self._num_threads > 1:
+            # The executors are imported when a pool is used, which keeps
+            # concurrent.futures out of the startup of run.py
+            from concurrent.futures import ThreadPoolExecutor
+
+            # The threads share the runner, its (immutable) process and the
+            # pin layout cache
+            with ThreadPoolExecutor(
+                max_workers=self._num_threads, thread_name_prefix="generator"
+            ) as executor:
+                self._run_pool(
+                    executor,
+                    self.generate_item,
+                    self._num_threads,
+                    "threads",
+                    items,
+                    manifest,
+                )
+            return
+
+        if self._num_jobs == 1:
+            # Each memory is written by the writer threads while the next
+            # ones are created and rendered
+            with WritePipeline(self._num_writers) as pipeline:
+                for item in items:
+                    for results in pipeline.submit(self.render_item(*item)):
+                        self._add_results(results, manifest)
+                for results in pipeline.drain():
+                    self._add_results(results, manifest)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+        from pin_layout_cache import PinLayoutCache
+
+        with ProcessPoolExecutor(
+            max_workers=self._num_jobs,
+            initializer=BatchRunner.init_worker,
+            initargs=(
+                self._json_data,
+                self._output_dir,
+                self._check_geometry,
+                self._keep_going,
+                self._copies,
+                PinLayoutCache.get_cache_dir(),
+            ),
+        ) as executor:
+            self._run_pool(
+                executor,
+                BatchRunner.generate_in_worker,
+                self._num_jobs,
+                "jobs",
+                items,
+                manifest,
+            )
+
+    def _run_pool(
+        self, executor, generate_fn, num_workers, queue_name, items, manifest
+    ):
+        """
+        Calls generate_fn on each item with the executor and adds the results
+        in order. The number of pending items is recorded as the depth of the
+        named queue
+        """
+
+        # Only a few items per worker are submitted ahead, so that the items
+        # are read as the workers need them
+        max_pending = num_workers * self.pending_per_job
+        pending = collections.deque()
+        try:
+            for item in items:
+                Profiler.record_queue_depth(queue_name, len(pending))
+                pending.append(executor.submit(generate_fn, *item))
+                if len(pending) >= max_pending:
+                    self._add_results(pending.popleft().result(), manifest)
+            while pending:
+                self._add_results(pending.popleft().result(), manifest)
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+    @staticmethod
+    def init_worker(
+        json_data, output_dir, check_geometry, keep_going, copies, pin_cache_dir
+    ):
+        """Creates the BatchRunner of a worker process"""
+
+        from pin_layout_cache import PinLayoutCache
+
+        global _worker_runner
+        # A forked worker inherits the parent's profiler, which it can't report
+        Profiler.deactivate()
+        PinLayoutCache.set_cache_dir(pin_cache_dir)
+        _worker_runner = BatchRunner(json_data, output_dir, check_geometry, keep_going)
+        _worker_runner._copies = copies
+
+    @staticmethod
+    def generate_in_worker(index, mem_config, timing_data):
+        """Calls generate_item with the BatchRunner of the worker process"""
+        return _worker_runner.generate_item(index, mem_config, timing_data)
+
+    def write_error_report(self, file_name, num_memories):
+        """Writes the failures to a JSON error report"""
+
+        dir_name = os.path.dirname(os.path.abspath(file_name))
+        if not os.path.isdir(dir_name):
+            os.makedirs(dir_name)
+        failures = self.get_failures()
+        with open(file_name, "w") as out_fh:
+            json.dump(
+                {
+                    "num_memories": num_memories,
+                    "num_failed": len(failures),
+                    "failures": failures,
+                },
+                out_fh,
+                indent=2,
+            )
+            out_fh.write("\n")
@@ -7,6 +7,9 @@ from physical_data import PhysicalData
 from lef_exporter import LefExporter
 from named_object import NamedObject
 from basic_port_creator import BasicPortCreator
+from rect_merger import RectMerger
+from verilog_options import VerilogOptions
+from profiler import Profiler
 
 ################################################################################
 # MEMORY CLASS
@@ -18,27 +21,34 @@ from basic_port_creator import BasicPortCreator
 
 
 class Memory(NamedObject):
-    def __init__(self, mem_config, process, timing_data):
+    def __init__(self, mem_config, process, timing_data, calc_dimensions=True):
         """
         Initializer
 
         Stores the process and timing_data objects directly on the memory, so
         that they can be accessed by the appropriate exporters. The physical
         data stores anything related to LEF.
+
+        If calc_dimensions is set, the macro dimensions and pin pitches are
+        calculated from the process parameters or bitcell sizes. It's not
+        set in spreadsheet mode, where they're read from the physical data
+        files. The process is shared by every memory, so it's never changed.
         """
         NamedObject.__init__(self, mem_config.get_name())
 
         self.process = process
         self.width_in_bits = mem_config.get_width_in_bits()
         self.depth = mem_config.get_depth()
-        self.addr_width = math.ceil(math.log2(self.depth))
+        self.addr_width = Memory.calc_addr_width(self.depth)
         self.num_banks = mem_config.get_num_banks()
         self.width_in_bytes = math.ceil(self.width_in_bits / 8.0)
         self.total_size = self.width_in_bytes * self.depth
         self.additional_height = mem_config.get_additional_height()
         self.timing_data = timing_data
+        self.verilog_options = VerilogOptions()
         self.physical = PhysicalData()
-        if self.process.calc_dimensions():
+        self._calc_dimensions = calc_dimensions
+        if calc_dimensions:
             (width_um, height_um) = self.process.get_macro_dimensions(
                 self.width_in_bits, self.depth, self.num_banks, self.additional_height
             )
@@ -76,9 +86,19 @@ class Memory(NamedObject):
         #
         self._obs_dict = {}
 
+    @staticmethod
+    def calc_addr_width(depth):
+        """Returns the address bus width for the depth"""
+        return math.ceil(math.log2(depth))
+
+    def get_num_pins(self):
+        """Returns the total number of logical pins (see count_pins)"""
+        return self.count_pins(self.get_width(), self.get_depth())
+
     def create_ports(self):
-        creator = BasicPortCreator(self)
-        creator.create_ports()
+        with Profiler.active_stage(self.get_name(), "create_ports"):
+            creator = BasicPortCreator(self)
+            creator.create_ports()
 
     def get_depth(self):
         """Returns the depth"""
@@ -135,10 +155,25 @@ class Memory(NamedObject):
         """Returns the timing data"""
         return self.timing_data
 
+    def calc_dimensions(self):
+        """
+        Returns True if the dimensions are calculated from the process
+        parameters (see the initializer)
+        """
+        return self._calc_dimensions
+
     def get_physical_data(self):
         """Returns the physical data"""
         return self.physical
 
+    def set_verilog_options(self, verilog_options):
+        """Sets the options used by the Verilog exporters"""
+        self.verilog_options = verilog_options
+
+    def get_verilog_options(self):
+        """Returns the options used by the Verilog exporters"""
+        return self.verilog_options
+
     def add_rw_port_group(self, rw_port_group):
         """Adds a RW Port Group"""
         self._rw_port_groups.append(rw_port_group)
@@ -201,15 +236,98 @@ class Memory(NamedObject):
         """Returns the obs dict"""
         return self._obs_dict
 
+    def merge_obstructions(self):
+        """
+        Replaces the obstruction rects on each layer with the smallest set of
+        non-overlapping rects that RectMerger can find for their union.
+
+        Returns the (before, after) rect counts
+        """
+
+        before = after = 0
+        for layer_data in self._obs_dict.values():
+            before += len(layer_data["rects"])
+            layer_data["rects"] = RectMerger.merge(layer_data["rects"])
+            after += len(layer_data["rects"])
+        return (before, after)
+
     def dump_ports(self):
         for port_name, port in self.get_ports().items():
             print(port_name)
 
+    def create_lef_exporter(self):
+        """Returns a LEF exporter for the memory"""
+        return LefExporter(self)
+
     def write_lef_file(self, out_file_name):
-        """Writes the LEF content to a file"""
+        """
+        Writes the LEF content to a file and returns its size in bytes and
+        SHA-256 hex digest
+        """
+
+        exporter = self.create_lef_exporter()
+        return exporter.export_file(out_file_name)
+
+    def write_verilog_file(self, out_file_name, is_blackbox=False):
+        """
+        Writes the verilog content to a file
+
+        If is_blackbox, then write the port declarations only. Otherwise, write
+        the full RTL. The exporter comes from create_verilog_exporter, which
+        is defined by the memory type. Returns the size in bytes and SHA-256
+        hex digest of the file
+        """
+
+        exporter = self.create_verilog_exporter()
+        return exporter.export_file(out_file_name, is_blackbox)
+
+    def render_verilog(self, is_blackbox=False):
+        """
+        Returns the verilog content that write_verilog_file writes as a
+        string
+        """
+
+        exporter = self.create_verilog_exporter()
+        return exporter.export_string(is_blackbox)
+
+    def has_sparse_model(self):
+        """
+        Returns True if a sparse SystemVerilog model is written in addition to
+        the Verilog model (see VerilogOptions)
+        """
+
+        return self.verilog_options.use_sparse_model(
+            self.get_depth(), self.get_width()
+        )
+
+    def write_sparse_model_file(self, out_file_name):
+        """
+        Writes the sparse SystemVerilog model to a file and returns its size in
+        bytes and SHA-256 hex digest
+        """
+
+        exporter = self.create_verilog_exporter(sparse=True)
+        return exporter.export_file(out_file_name)
+
+    def render_sparse_model(self):
+        """
+        Returns the sparse SystemVerilog model that write_sparse_model_file
+        writes as a string
+        """
+
+        exporter = self.create_verilog_exporter(sparse=True)
+        return exporter.export_string()
+
+    def write_liberty_file(self, out_file_name, corner=None):
+        """
+        Writes the Liberty content to a file (for the corner if one is given).
+        The exporter comes from create_liberty_exporter, which is defined by
+        the memory type. Returns the size in bytes and SHA-256 hex digest of
+        the file
+        """
 
-        exporter = LefExporter(self)
-        exporter.export_file(out_file_name)
+        exporter = self.create_liberty_exporter(corner)
+        return exporter.export_file(out_file_name)
 
     @staticmethod
     def main(memory_type, port_config):  # pragma: nocover
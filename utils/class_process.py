@@ -1,14 +1,21 @@
+from corner import Corner
+from immutable_object import ImmutableObject
+
 ################################################################################
 # PROCESS CLASS
 #
 # This class stores the infromation about the process that the memory is being
 # generated in. Every memory has a pointer to a process object. The information
 # for the process comes from the json configuration file (typically before the
-# "sram" list section).
+# "sram" list section). A process is immutable once initialized, so it can be
+# shared by memories created on different threads.
 ################################################################################
 
 
-class Process:
+class Process(ImmutableObject):
+    # Supported numbers of banks (see get_macro_dimensions)
+    num_banks_choices = (1, 2, 4)
+
     def __init__(self, json_data):
         """Initialize from json_data imported from config file"""
 
@@ -57,25 +64,30 @@ class Process:
         self.y_offset = 1 * self.pin_pitch_um
         # as told by MSK
 
-        self._calc_y_step()
+        self.y_step = self._calc_y_step()
         self.bitcell_width_um = json_data.get("bitcell_width_um", None)
         self.bitcell_height_um = json_data.get("bitcell_height_um", None)
 
-        # Set to True when we want to use the process parameters or bitcell
-        # sizes to calculate the macro dimensions. Set to False for spreadsheet
-        # mode
-        self._calc_dimensions = True
+        # Optional PVT corners, each of which gets its own Liberty file
+        self.corners = tuple(
+            Corner(corner_data) for corner_data in json_data.get("corners", [])
+        )
+        corner_names = [corner.get_name() for corner in self.corners]
+        if len(set(corner_names)) != len(corner_names):
+            raise Exception(f"Duplicate corner names: {', '.join(corner_names)}")
+
+        self.freeze()
 
     def _calc_y_step(self):
         """
-        Calculates y_step, which is really the y location for the center of
-        the first pin
+        Returns y_step, which is really the y location for the center of the
+        first pin
         """
 
         offset_snap = round(self.y_offset % self.manufacturing_grid_um, 2)
         if offset_snap < self.manufacturing_grid_um:
             offset_snap = 0
-        self.y_step = self.y_offset - offset_snap + (self.pin_width_um / 2.0)
+        return self.y_offset - offset_snap + (self.pin_width_um / 2.0)
 
     def has_defined_bitcell_size(self):
         return self.bitcell_width_um and self.bitcell_height_um
@@ -105,11 +117,11 @@ class Process:
         all_bitcell_height = bitcell_height * depth
         all_bitcell_width = bitcell_width * width_in_bits
 
-        if num_banks == 2 or num_banks == 4:
+        if num_banks not in self.num_banks_choices:
+            raise Exception("Unsupported number of banks: {}".format(num_banks))
+        if num_banks != 1:
             all_bitcell_height = all_bitcell_height / num_banks
             all_bitcell_width = all_bitcell_width * num_banks
-        elif num_banks != 1:
-            raise Exception("Unsupported number of banks: {}".format(num_banks))
 
         all_bitcell_height = all_bitcell_height / column_mux_factor
         all_bitcell_width = all_bitcell_width * column_mux_factor
@@ -205,14 +217,6 @@ class Process:
         """Returns the column mux factor"""
         return self.column_mux_factor
 
-    def set_calc_dimensions(self, val):
-        """
-        Sets a predicate to indicate if we should calculate the dimensions
-        """
-        self._calc_dimensions = val
-
-    def calc_dimensions(self):
-        """
-        Returns a predicate to indicate if we should calculate the dimensions
-        """
-        return self._calc_dimensions
+    def get_corners(self):
+        """Returns the PVT corners"""
+        return self.corners
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+from class_process import Process
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from physical_data import PhysicalData
+from sram_stream import SramStream
+from sram_sweep import SramSweep
+
+
+class ConfigValidator:
+    """
+    Checks a whole config before anything is generated, so that every
+    problem is reported at once instead of when the run reaches the srams[]
+    entry, possibly after minutes of writing
+
+    The process keys are checked by creating the Process, and the bitcell
+    size must be given or derivable from the poly and fin pitches. Each
+    srams[] entry must have a unique name, integer width, depth and banks,
+    a supported number of banks, and no more pins than there are tracks on
+    the side of the macro. The macro height and track count are computed
+    with the same math as Memory (Process.get_macro_dimensions,
+    PhysicalData.snap_side_to_grid and PhysicalData.calc_num_tracks), once
+    per distinct shape.
+
+    The srams[] entries are visited once, so a SramStream or SramSweep is
+    read without building the full list.
+
+    Each problem is a dictionary with the index and name of the srams[]
+    entry (both None for the config-level keys) and a message.
+    """
+
+    required_keys = ("name", "width", "depth", "banks")
+
+    def __init__(self, json_data):
+        """Initializer"""
+
+        self._json_data = json_data
+        self._problems = []
+        self._num_srams = 0
+        self._process = None
+        self._memory_type = json_data.get("memory_type", "RAM")
+        self._port_config = json_data.get("port_configuration", "SP")
+        # (width, depth, banks, additional_height) -> message or None
+        self._shape_messages = {}
+
+    def get_problems(self):
+        """Returns the problems found by validate"""
+        return self._problems
+
+    def get_num_srams(self):
+        """Returns the number of srams[] entries checked by validate"""
+        return self._num_srams
+
+    @staticmethod
+    def format_problem(problem):
+        """Returns the problem as a one-line string"""
+
+        if problem["index"] is None:
+            return f"config: {problem['message']}"
+        return "srams[{}] {}: {}".format(
+            problem["index"], problem["name"], problem["message"]
+        )
+
+    def _add_problem(self, index, name, message):
+        """Records a problem"""
+        self._problems.append({"index": index, "name": name, "message": message})
+
+    def validate(self):
+        """Checks the config and returns the list of problems"""
+
+        self._problems = []
+        self._num_srams = 0
+        self._validate_process()
+        srams = self._json_data.get("srams")
+        source = srams.get_srams() if isinstance(srams, SramSweep) else srams
+        if not isinstance(source, (list, SramStream)):
+            self._add_problem(None, None, "srams must be a list")
+            return self._problems
+        names = {}
+        try:
+            for index, sram_data in enumerate(srams):
+                self._validate_sram(index, sram_data, names)
+                self._num_srams += 1
+        except Exception as ex:
+            # The srams_file can't be read or the sweep can't be expanded past
+            # this point
+            self._add_problem(None, None, str(ex))
+        return self._problems
+
+    def _validate_process(self):
+        """Checks the config-level keys"""
+
+        try:
+            self._process = Process(self._json_data)
+        except KeyError as ex:
+            self._add_problem(None, None, f"missing {ex.args[0]}")
+        except Exception as ex:
+            self._add_problem(None, None, str(ex))
+        if self._process and not self._process.has_defined_bitcell_size():
+            missing = [
+                key
+                for key in ("contacted_poly_pitch_nm", "fin_pitch_nm")
+                if self._json_data.get(key) is None
+            ]
+            if missing:
+                self._add_problem(
+                    None,
+                    None,
+                    "bitcell_width_um and bitcell_height_um are not set and "
+                    f"neither is {' or '.join(missing)}",
+                )
+                self._process = None
+        if not MemoryFactory.is_registered(self._memory_type, self._port_config):
+            self._add_problem(
+                None,
+                None,
+                "unsupported memory_type {} and port_configuration {}".format(
+                    self._memory_type, self._port_config
+                ),
+            )
+            self._process = None
+
+    def _validate_sram(self, index, sram_data, names):
+        """Checks a srams[] entry"""
+
+        if not isinstance(sram_data, dict):
+            self._add_problem(index, None, "entry is not an object")
+            return
+        name = sram_data.get("name")
+        missing = [key for key in self.required_keys if key not in sram_data]
+        if missing:
+            self._add_problem(index, name, f"missing {', '.join(missing)}")
+        if name is not None:
+            name = str(name)
+            if name in names:
+                self._add_problem(
+                    index, name, f"duplicate name (also srams[{names[name]}])"
+                )
+            else:
+                names[name] = index
+        if missing:
+            return
+
+        try:
+            mem_config = MemoryConfig.from_json(sram_data)
+        except (TypeError, ValueError) as ex:
+            self._add_problem(index, name, f"invalid value: {ex}")
+            return
+        messages = []
+        if mem_config.get_width_in_bits() < 1:
+            messages.append(f"width must be positive: {mem_config.get_width_in_bits()}")
+        if mem_config.get_depth() < 1:
+            messages.append(f"depth must be positive: {mem_config.get_depth()}")
+        additional_height = mem_config.get_additional_height()
+        if not isinstance(additional_height, (int, float)) or additional_height < 0:
+            messages.append(f"invalid additional_height: {additional_height}")
+        if mem_config.get_num_banks() not in Process.num_banks_choices:
+            messages.append(
+                "Unsupported number of banks: {}".format(mem_config.get_num_banks())
+            )
+        if not messages and self._process:
+            message = self._check_shape(mem_config)
+            if message:
+                messages.append(message)
+        for message in messages:
+            self._add_problem(index, name, message)
+
+    def _check_shape(self, mem_config):
+        """
+        Returns the problem with the pins of the memory or None (shapes
+        repeat across a config, so the result is cached)
+        """
+
+        shape = (
+            mem_config.get_width_in_bits(),
+            mem_config.get_depth(),
+            mem_config.get_num_banks(),
+            mem_config.get_additional_height(),
+        )
+        if shape in self._shape_messages:
+            return self._shape_messages[shape]
+
+        process = self._process
+        (_, height) = process.get_macro_dimensions(*shape)
+        height = PhysicalData.snap_side_to_grid(height, process.get_snap_height_nm())
+        num_tracks = PhysicalData.calc_num_tracks(
+            height, process.get_pin_pitch_um(), process.get_y_offset()
+        )
+        num_pins = MemoryFactory.count_pins(
+            mem_config, self._memory_type, self._port_config
+        )
+        message = None
+        if num_pins > num_tracks:
+            message = (
+                "not enough tracks (num pins: {}, available tracks: {}, "
+                "height: {:.3f} um)".format(num_pins, num_tracks, height)
+            )
+        self._shape_messages[shape] = message
+        return message
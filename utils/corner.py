@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import re
+import weakref
+import threading
+
+from immutable_object import ImmutableObject
+
+# Derated TimingData keyed on the nominal TimingData and then on the derating
+# factors, so memories that share the nominal TimingData share the derated
+# one. The keys are weak so that a long-lived process doesn't keep every
+# TimingData. The cache is shared by the memories created on different
+# threads, so it's only accessed with the lock held
+_derated_timing_data = weakref.WeakKeyDictionary()
+_derated_lock = threading.Lock()
+
+
+class Corner(ImmutableObject):
+    """
+    Process/voltage/temperature corner used to write an additional Liberty
+    file (see the "corners" config section)
+
+    The delays (setup, hold, access and cycle time and the output drive
+    resistance) are multiplied by delay_derate, the standby leakage by
+    leakage_derate and the pin dynamic power by power_derate.
+
+    The name is used in the Liberty file name (<name>_<corner>.lib) and
+    library name, so it may only have letters, digits, "_" and ".". A
+    corner is immutable once initialized, like the Process it belongs to.
+    """
+
+    name_re = re.compile(r"[A-Za-z0-9_.]+")
+
+    def __init__(self, json_data):
+        """Initializer"""
+
+        self._name = str(json_data["name"])
+        if not self.name_re.fullmatch(self._name):
+            raise Exception(
+                f"Invalid corner name {self._name!r}: only letters, digits, "
+                "'_' and '.' are allowed"
+            )
+        self._process = float(json_data.get("process", 1.0))
+        self._voltage = float(json_data["voltage"])
+        self._temperature = float(json_data["temperature"])
+        self._delay_derate = float(json_data.get("delay_derate", 1.0))
+        self._leakage_derate = float(json_data.get("leakage_derate", 1.0))
+        self._power_derate = float(json_data.get("power_derate", 1.0))
+        self.freeze()
+
+    def get_name(self):
+        """Returns the name"""
+        return self._name
+
+    def get_process(self):
+        """Returns the process factor"""
+        return self._process
+
+    def get_voltage(self):
+        """Returns the voltage"""
+        return self._voltage
+
+    def get_temperature(self):
+        """Returns the temperature in C"""
+        return self._temperature
+
+    def get_delay_derate(self):
+        """Returns the delay derating factor"""
+        return self._delay_derate
+
+    def get_leakage_derate(self):
+        """Returns the leakage derating factor"""
+        return self._leakage_derate
+
+    def get_power_derate(self):
+        """Returns the dynamic power derating factor"""
+        return self._power_derate
+
+    def get_timing_data(self, timing_data):
+        """Returns the TimingData derated for this corner"""
+
+        derates = (self._delay_derate, self._leakage_derate, self._power_derate)
+        with _derated_lock:
+            derated_data = _derated_timing_data.setdefault(timing_data, {})
+            derated = derated_data.get(derates)
+            if derated is None:
+                derated = timing_data.get_derated(*derates)
+                derated_data[derates] = derated
+        return derated
@@ -37,11 +37,12 @@ class DualPortRegFile(RegFile):
         self.add_rw_port_group(RWPortGroup("b"))
         self.create_ports()
 
-    def get_num_pins(self):
-        """Returns the total number of logical pins"""
+    @staticmethod
+    def count_pins(width, depth):
+        """Returns the total number of logical pins for the width and depth"""
 
         # din (#bits) + dout (#bits) + addr (#addr_width) + we
-        rw_port_group_size = (2 * self.get_width()) + self.get_addr_width() + 2
+        rw_port_group_size = (2 * width) + Memory.calc_addr_width(depth) + 2
         # 2 rw groups
         return 2 * rw_port_group_size
 
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+import io
+from hashing_writer import HashingWriter
+
 
 class Exporter:
     """Base class for all exporters. Contains common code"""
@@ -12,7 +15,22 @@ class Exporter:
         """Returns the memory for this exporter"""
         return self._memory
 
-    def export_file(self, file_name):
-        """Exports the contents to the specified file"""
-        with open(file_name, "w") as out_fh:
-            self.export(out_fh)
+    def export_file(self, file_name, *args):
+        """
+        Exports the contents to the specified file and returns its size in
+        bytes and SHA-256 hex digest. The arguments are passed on to export
+        """
+
+        with HashingWriter(file_name) as out_fh:
+            self.export(out_fh, *args)
+        return (out_fh.get_num_bytes(), out_fh.get_sha256())
+
+    def export_string(self, *args):
+        """
+        Returns the contents as a string. The arguments are passed on to
+        export (e.g. is_blackbox for the Verilog exporter)
+        """
+
+        out_fh = io.StringIO()
+        self.export(out_fh, *args)
+        return out_fh.getvalue()
@@ -1,8 +1,17 @@
 #!/usr/bin/env python3
 
+import importlib
+
 
 class FactoryBase:
-    """Base class for factory registration and creation"""
+    """
+    Base class for factory registration and creation
+
+    A class can be registered directly or as a string with its module and
+    class name ("module.ClassName"), in which case the module is only
+    imported the first time the class is created. This keeps the startup of
+    the scripts from importing every memory class and exporter.
+    """
 
     _registry = {}
 
@@ -13,9 +22,54 @@ class FactoryBase:
 
     @classmethod
     def register(self, memory_type, port_config, klass):
-        """Registers a class for the given memory_type and port_config"""
+        """
+        Registers a class (or a "module.ClassName" string) for the given
+        memory_type and port_config
+        """
         self._registry[self.get_key(memory_type, port_config)] = klass
 
+    @classmethod
+    def is_registered(self, memory_type, port_config):
+        """Returns True if a class is registered for the memory_type and port_config"""
+        return self.get_key(memory_type, port_config) in self._registry
+
+    @staticmethod
+    def import_class(class_path):
+        """Imports and returns the class named by a "module.ClassName" string"""
+
+        (module_name, _, class_name) = class_path.rpartition(".")
+        if not module_name:
+            raise ValueError(f"Class path isn't module.ClassName: {class_path}")
+        return getattr(importlib.import_module(module_name), class_name)
+
+    @classmethod
+    def get_class(self, memory_type, port_config):
+        """
+        Returns the class registered for the memory_type and port_config
+        (importing it if it was registered as a string) or None
+        """
+
+        key = self.get_key(memory_type, port_config)
+        klass = self._registry.get(key)
+        if isinstance(klass, str):
+            klass = self.import_class(klass)
+            self._registry[key] = klass
+        return klass
+
+    @classmethod
+    def count_pins(self, mem_config, memory_type, port_config):
+        """
+        Returns the number of logical pins of the memory that create would
+        return, without creating it
+        """
+
+        klass = self.get_class(memory_type, port_config)
+        if klass is None:
+            raise ValueError(
+                f"No class registered under key: {memory_type} {port_config}"
+            )
+        return klass.count_pins(mem_config.get_width_in_bits(), mem_config.get_depth())
+
     @classmethod
     def create(self, mem_config, memory_type, port_config, process, timing_data):
         """
@@ -28,8 +82,7 @@ class FactoryBase:
         process_data (Process): process data container
         timing_data (TimingData): timing data container
         """
-        key = self.get_key(memory_type, port_config)
-        klass = self._registry.get(key)
+        klass = self.get_class(memory_type, port_config)
         if klass is None:
             raise ValueError(
                 f"No class registered under key: {memory_type} {port_config}"
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+
+import os
+import json
+import stat
+import socket
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from run_utils import RunUtils
+from class_process import Process
+from memory_config import MemoryConfig
+from memory_factory import MemoryFactory
+from sram_sweep import SramSweep
+from timing_data import TimingData
+from timing_model import TimingModel
+from verilog_options import VerilogOptions
+
+
+class GenerationServer:
+    """
+    Long-lived generator that serves requests over a Unix domain socket, so
+    that the interpreter, the imported modules and the parsed process data
+    are reused instead of paying for them on every run.py invocation
+
+    Clients send one JSON request per line and get one JSON reply per line
+    on the same connection. A request has the config as either
+        config - the config JSON data
+        config_file - the path to a config file (reparsed when it changes)
+    and optionally
+        sram - a single srams[] entry (or sweep, see SramSweep) to generate
+               instead of every entry in the config's srams list (the
+               config needs no srams list then)
+        output_dir - directory the files are written to (default "results",
+                     relative to the server's working directory)
+        inline - if true, nothing is written and the reply has the contents
+                 of each file instead of its path
+        verilog_flavor - overrides verilog_flavor in the config
+        id - echoed back in the reply
+    The replies are {"id": ..., "status": "ok", "memories": [...]}, where
+    each memory is {"name": ..., "files": {file name: path or contents}}, or
+    {"id": ..., "status": "error", "error": message}. The commands
+    {"command": "ping"} and {"command": "shutdown"} are also supported.
+
+    The Process, VerilogOptions, TimingModel and (without a timing model)
+    TimingData of each distinct config are built once and kept in an LRU
+    cache keyed on the config without its srams list. Each connection is
+    read by its own thread, which hands every request to a pool of
+    num_workers threads, so idle connections don't hold a worker.
+    """
+
+    def __init__(self, socket_path, num_workers=4, context_cache_size=32):
+        """Initializer"""
+
+        self._socket_path = socket_path
+        self._num_workers = num_workers
+        self._context_cache_size = context_cache_size
+        self._lock = threading.Lock()
+        # config key -> context dictionary (see _create_context)
+        self._contexts = OrderedDict()
+        # config file name -> ((mtime, size), json_data)
+        self._config_files = {}
+        # connection -> thread that reads its requests
+        self._connections = {}
+        self._shutdown_event = threading.Event()
+
+    def get_socket_path(self):
+        """Returns the socket path"""
+        return self._socket_path
+
+    def get_num_workers(self):
+        """Returns the number of worker threads"""
+        return self._num_workers
+
+    def get_num_contexts(self):
+        """Returns the number of cached config contexts"""
+        return len(self._contexts)
+
+    # -------------- Generation --------------
+    @staticmethod
+    def get_context_key(json_data):
+        """Returns the cache key of the config: everything but the srams"""
+
+        return json.dumps(
+            {key: val for key, val in json_data.items() if key != "srams"},
+            sort_keys=True,
+        )
+
+    @staticmethod
+    def _create_context(json_data):
+        """Creates the objects that are shared by every memory of a config"""
+
+        timing_model = TimingModel(json_data)
+        return {
+            "process": Process(json_data),
+            "verilog_options": VerilogOptions(json_data),
+            "timing_model": timing_model,
+            "timing_data": TimingData(json_data) if timing_model.is_empty() else None,
+        }
+
+    def get_context(self, json_data):
+        """Returns the cached context of the config, creating it if needed"""
+
+        key = self.get_context_key(json_data)
+        with self._lock:
+            context = self._contexts.get(key)
+            if context is None:
+                context = self._create_context(json_data)
+                self._contexts[key] = context
+                if len(self._contexts) > self._context_cache_size:
+                    self._contexts.popitem(last=False)
+            else:
+                self._contexts.move_to_end(key)
+        return context
+
+    def warm(self, json_data):
+        """Creates the context of the config ahead of the first request"""
+        self.get_context(json_data)
+
+    def _load_config_file(self, file_name):
+        """Returns the parsed config file, reparsing it if it changed"""
+
+        file_name = os.path.realpath(file_name)
+        file_stat = os.stat(file_name)
+        version = (file_stat.st_mtime_ns, file_stat.st_size)
+        with self._lock:
+            cached = self._config_files.get(file_name)
+        if cached and cached[0] == version:
+            return cached[1]
+        json_data = RunUtils.get_config(file_name)
+        with self._lock:
+            self._config_files[file_name] = (version, json_data)
+        return json_data
+
+    def get_config(self, request):
+        """Returns the config JSON data of the request"""
+
+        if "config" in request:
+            json_data = request["config"]
+        elif "config_file" in request:
+            json_data = self._load_config_file(request["config_file"])
+        else:
+            raise Exception("Request has neither a config nor a config_file")
+        if not isinstance(json_data, dict):
+            raise Exception("The config must be a JSON object")
+        # Copied so that the overrides don't change the cached config
+        json_data = dict(json_data)
+        if request.get("verilog_flavor"):
+            json_data["verilog_flavor"] = request["verilog_flavor"]
+        return json_data
+
+    def generate(self, request):
+        """
+        Generates the memories of the request and returns a list with the
+        name and files of each
+        """
+
+        json_data = self.get_config(request)
+        context = self.get_context(json_data)
+        process = context["process"]
+        if "sram" in request:
+            srams = list(SramSweep([request["sram"]]))
+        else:
+            srams = list(SramSweep(json_data.get("srams") or []))
+        if not srams:
+            raise Exception("Request has no sram and the config has no srams")
+        mem_configs = [MemoryConfig.from_json(sram_data) for sram_data in srams]
+        if context["timing_data"] is not None:
+            timing_data_list = [context["timing_data"]] * len(mem_configs)
+        else:
+            timing_data_list = context["timing_model"].create_timing_data(
+                json_data, mem_configs, process.get_column_mux_factor()
+            )
+
+        memory_type = json_data.get("memory_type", "RAM")
+        port_config = json_data.get("port_configuration", "SP")
+        output_dir = request.get("output_dir", "results")
+        memories = []
+        for mem_config, timing_data in zip(mem_configs, timing_data_list):
+            memory = MemoryFactory.create(
+                mem_config, memory_type, port_config, process, timing_data
+            )
+            memory.set_verilog_options(context["verilog_options"])
+            if request.get("inline"):
+                files = RunUtils.get_contents(memory)
+            else:
+                files = {
+                    os.path.basename(file_record["path"]): file_record["path"]
+                    for file_record in RunUtils.write_memory(memory, output_dir)
+                }
+            memories.append({"name": memory.get_name(), "files": files})
+        return memories
+
+    # -------------- Protocol --------------
+    def handle_request(self, request):
+        """Handles one decoded request and returns the reply"""
+
+        reply = {"id": request.get("id") if isinstance(request, dict) else None}
+        try:
+            if not isinstance(request, dict):
+                raise Exception("The request must be a JSON object")
+            command = request.get("command", "generate")
+            if command == "generate":
+                reply["memories"] = self.generate(request)
+            elif command == "shutdown":
+                self.shutdown()
+            elif command != "ping":
+                raise Exception(f"Unknown command: {command}")
+            reply["status"] = "ok"
+        except Exception as ex:
+            reply["status"] = "error"
+            reply["error"] = f"{type(ex).__name__}: {ex}"
+        return reply
+
+    def handle_line(self, line):
+        """Handles one request line and returns the reply line"""
+
+        try:
+            request = json.loads(line)
+        except ValueError as ex:
+            reply = {"id": None, "status": "error", "error": f"Invalid JSON: {ex}"}
+        else:
+            reply = self.handle_request(request)
+        return (json.dumps(reply) + "\n").encode()
+
+    def handle_connection(self, conn, executor):
+        """
+        Reads the requests of a connection until the client closes it. Each
+        request is handled by a thread of the executor, and its reply is sent
+        before the next request is read
+        """
+
+        try:
+            with conn.makefile("rb") as in_fh, conn.makefile("wb") as out_fh:
+                for line in in_fh:
+                    if line.strip():
+                        future = executor.submit(self.handle_line, line)
+                        out_fh.write(future.result())
+                        out_fh.flush()
+                    if self._shutdown_event.is_set():
+                        break
+        except (OSError, RuntimeError):
+            # The client went away or the server is shutting down (the
+            # executor raises RuntimeError once it no longer takes requests)
+            pass
+        finally:
+            with self._lock:
+                self._connections.pop(conn, None)
+            conn.close()
+
+    # -------------- Server --------------
+    def _remove_stale_socket(self):
+        """
+        Removes a socket file left behind by a server that's gone. Raises an
+        exception if a server is still listening on it
+        """
+
+        if not os.path.exists(self._socket_path):
+            return
+        if not stat.S_ISSOCK(os.stat(self._socket_path).st_mode):
+            raise Exception(f"{self._socket_path} exists and isn't a socket")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(self._socket_path)
+            except OSError:
+                os.remove(self._socket_path)
+                return
+        raise Exception(f"A server is already listening on {self._socket_path}")
+
+    def serve(self, ready_event=None):
+        """
+        Serves requests until a shutdown request (or KeyboardInterrupt). Sets
+        ready_event, if given, once the socket accepts connections
+        """
+
+        self._remove_stale_socket()
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            listener.bind(self._socket_path)
+            listener.listen()
+            # Wake up periodically to notice a shutdown request
+            listener.settimeout(0.2)
+            if ready_event:
+                ready_event.set()
+            with ThreadPoolExecutor(max_workers=self._num_workers) as executor:
+                try:
+                    while not self._shutdown_event.is_set():
+                        try:
+                            (conn, _) = listener.accept()
+                        except socket.timeout:
+                            continue
+                        conn.settimeout(None)
+                        thread = threading.Thread(
+                            target=self.handle_connection,
+                            args=(conn, executor),
+                            daemon=True,
+                        )
+                        with self._lock:
+                            self._connections[conn] = thread
+                        thread.start()
+                except KeyboardInterrupt:
+                    pass
+                finally:
+                    self.shutdown()
+                    # Finish the requests that are being handled before the
+                    # executor stops taking them
+                    with self._lock:
+                        threads = list(self._connections.values())
+                    for thread in threads:
+                        thread.join()
+        finally:
+            listener.close()
+            if os.path.exists(self._socket_path):
+                os.remove(self._socket_path)
+
+    def shutdown(self):
+        """
+        Stops accepting connections and closes the idle ones. Requests that
+        are being handled are finished first
+        """
+
+        self._shutdown_event.set()
+        with self._lock:
+            connections = list(self._connections)
+        for conn in connections:
+            try:
+                conn.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+
+    # -------------- Client --------------
+    @staticmethod
+    def send_request(socket_path, request, timeout=None):
+        """Sends one request to a server and returns the decoded reply"""
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path)
+            with sock.makefile("rwb") as sock_fh:
+                sock_fh.write((json.dumps(request) + "\n").encode())
+                sock_fh.flush()
+                line = sock_fh.readline()
+        if not line:
+            raise Exception("The server closed the connection without a reply")
+        return json.loads(line)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+import heapq
+import math
+
+
+class GeometryChecker:
+    """
+    Checks the pin, power/ground and obstruction shapes of a memory
+
+    Reports:
+        out_of_bounds - shape extends outside the macro extents
+        overlap - shapes from different ports overlap or touch on the same
+                  layer
+        spacing - shapes from different ports on the same layer are closer
+                  than the minimum spacing
+
+    Obstructions are only checked against the macro extents since they are
+    expected to cover the pins. The minimum spacing defaults to the gap
+    between two pins on adjacent tracks (pin pitch - pin width).
+
+    Each layer is checked with a sweep line over y. Shapes are visited in
+    lly order and only compared against the active shapes whose ury is
+    within the minimum spacing, which are kept in a heap ordered by ury.
+    """
+
+    def __init__(self, mem, min_spacing=None, tolerance=1e-6):
+        """Initializer"""
+
+        self._mem = mem
+        process = mem.get_process_data()
+        if min_spacing is None:
+            min_spacing = process.get_pin_pitch_um() - process.get_pin_width_um()
+        self._min_spacing = min_spacing
+        self._tolerance = tolerance
+
+    def get_min_spacing(self):
+        """Returns the minimum spacing in um"""
+        return self._min_spacing
+
+    def check(self):
+        """Checks the memory and returns the list of violations"""
+
+        violations = []
+        layer_shapes = {}
+        ports = list(self._mem.get_ports().values())
+        ports += list(self._mem.get_pg_ports().values())
+        for port in ports:
+            for rect in port.get_rects():
+                self._check_bounds(violations, port.get_layer(), rect, port.get_name())
+                layer_shapes.setdefault(port.get_layer(), []).append(
+                    (rect, port.get_name())
+                )
+        for layer, layer_data in self._mem.get_obstructions().items():
+            for rect in layer_data["rects"]:
+                self._check_bounds(violations, layer, rect, "OBS")
+        for layer in sorted(layer_shapes):
+            self._check_layer(violations, layer, layer_shapes[layer])
+        return violations
+
+    def _check_bounds(self, violations, layer, rect, owner):
+        """Adds a violation if the rect is outside of the macro extents"""
+
+        physical = self._mem.get_physical_data()
+        tol = self._tolerance
+        if (
+            rect[0] < -tol
+            or rect[1] < -tol
+            or rect[2] > physical.get_width() + tol
+            or rect[3] > physical.get_height() + tol
+        ):
+            violations.append(
+                {
+                    "type": "out_of_bounds",
+                    "layer": layer,
+                    "shapes": [owner],
+                    "rects": [rect],
+                }
+            )
+
+    def _check_layer(self, violations, layer, shapes):
+        """Sweeps over the shapes on a layer and adds overlap/spacing violations"""
+
+        tol = self._tolerance
+        spacing = self._min_spacing
+        shapes.sort(key=lambda shape: shape[0][1])
+        # heap of (ury, index into shapes) of the shapes still in range
+        active = []
+        for index, (rect, owner) in enumerate(shapes):
+            while active and active[0][0] + spacing <= rect[1] + tol:
+                heapq.heappop(active)
+            for _, active_index in active:
+                (other_rect, other_owner) = shapes[active_index]
+                if other_owner == owner:
+                    continue
+                dx = max(other_rect[0] - rect[2], rect[0] - other_rect[2])
+                dy = max(other_rect[1] - rect[3], rect[1] - other_rect[3])
+                if dx <= tol and dy <= tol:
+                    violation_type = "overlap"
+                elif math.hypot(max(dx, 0), max(dy, 0)) < spacing - tol:
+                    violation_type = "spacing"
+                else:
+                    continue
+                violations.append(
+                    {
+                        "type": violation_type,
+                        "layer": layer,
+                        "shapes": [other_owner, owner],
+                        "rects": [other_rect, rect],
+                    }
+                )
+            heapq.heappush(active, (rect[3], index))
+
+    @staticmethod
+    def format_violation(violation):
+        """Returns a one line description of the violation"""
+
+        shapes = ", ".join(
+            "{} ({})".format(owner, " ".join(f"{val:.5f}" for val in rect))
+            for owner, rect in zip(violation["shapes"], violation["rects"])
+        )
+        return f"{violation['type']} on {violation['layer']}: {shapes}"
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import os
+
+
+class HashingWriter:
+    """
+    Text file writer that computes the SHA-256 and the size of the bytes as
+    they're written, so that the file doesn't have to be read back to be
+    indexed (see Manifest)
+
+    The text is UTF-8 encoded. The writes are collected and encoded, hashed
+    and written in blocks of about buffer_size characters, since the
+    exporters write many short strings.
+    """
+
+    def __init__(self, file_name, buffer_size=1 << 16):
+        """Initializer. Opens the file for writing"""
+
+        # hashlib loads OpenSSL, so it's imported with the first file written
+        # rather than at the startup of run.py
+        import hashlib
+
+        # A hardlinked file (see RunUtils.write_views) is replaced instead of
+        # overwritten, which would change the other links too
+        if os.path.isfile(file_name) and os.stat(file_name).st_nlink > 1:
+            os.remove(file_name)
+        self._out_fh = open(file_name, "wb")
+        self._buffer_size = buffer_size
+        self._chunks = []
+        self._num_pending = 0
+        self._num_bytes = 0
+        self._sha256 = hashlib.sha256()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, text):
+        """Writes the text"""
+
+        self._chunks.append(text)
+        self._num_pending += len(text)
+        if self._num_pending >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Encodes, hashes and writes the pending text"""
+
+        if not self._chunks:
+            return
+        data = "".join(self._chunks).encode("utf-8")
+        self._chunks = []
+        self._num_pending = 0
+        self._sha256.update(data)
+        self._num_bytes += len(data)
+        self._out_fh.write(data)
+
+    def close(self):
+        """Writes the pending text and closes the file"""
+
+        if not self._out_fh.closed:
+            self.flush()
+            self._out_fh.close()
+
+    def get_num_bytes(self):
+        """Returns the number of bytes written"""
+        return self._num_bytes
+
+    def get_sha256(self):
+        """Returns the SHA-256 hex digest of the bytes written"""
+        return self._sha256.hexdigest()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+
+class ImmutableObject:
+    """
+    Base class of value objects that can't be changed once they're
+    initialized (e.g. Process), so that they can be shared by memories
+    created on different threads. The initializer of the subclass calls
+    freeze once it has set all of its attributes. Anything that differs
+    between memories is passed to the memory instead (e.g. calc_dimensions)
+    """
+
+    def freeze(self):
+        """Makes the object immutable"""
+        object.__setattr__(self, "_frozen", True)
+
+    def is_frozen(self):
+        """Returns True if the object is immutable"""
+        return self.__dict__.get("_frozen", False)
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get("_frozen", False):
+            raise Exception(f"Cannot set {name}: {type(self).__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        if self.__dict__.get("_frozen", False):
+            raise Exception(
+                f"Cannot delete {name}: {type(self).__name__} is immutable"
+            )
+        object.__delattr__(self, name)
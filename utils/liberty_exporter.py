@@ -8,15 +8,50 @@ from exporter import Exporter
 class LibertyExporter(Exporter):
     """Liberty exporter base class"""
 
-    def __init__(self, memory):
-        """Initializer"""
+    def __init__(self, memory, corner=None):
+        """
+        Initializer. If a corner is given, the Liberty content is written for
+        that corner with the derated timing data
+        """
+
         Exporter.__init__(self, memory)
+        self._corner = corner
+        if corner:
+            self._timing_data = corner.get_timing_data(memory.get_timing_data())
+        else:
+            self._timing_data = memory.get_timing_data()
+
+    def get_corner(self):
+        """Returns the corner (None for the nominal Liberty file)"""
+        return self._corner
+
+    def get_timing_data(self):
+        """Returns the timing data for the corner"""
+        return self._timing_data
+
+    def get_operating_conditions(self):
+        """
+        Returns the (name, process, temperature, voltage) of the operating
+        conditions
+        """
+
+        if self._corner:
+            return (
+                self._corner.get_name(),
+                self._corner.get_process(),
+                self._corner.get_temperature(),
+                self._corner.get_voltage(),
+            )
+        return ("tt_1.0_25.0", 1, 25.0, self.get_memory().get_process_data().voltage)
 
     def export(self, out_fh):
         """Exports the Liberty content to the output stream"""
 
         name = self.get_memory().get_name()
-        out_fh.write("library(%s) {\n" % name)
+        if self._corner:
+            out_fh.write("library(%s_%s) {\n" % (name, self._corner.get_name()))
+        else:
+            out_fh.write("library(%s) {\n" % name)
         self.write_header(out_fh)
         self.write_defaults(out_fh)
         self.write_table_templates(out_fh)
@@ -42,7 +77,7 @@ class LibertyExporter(Exporter):
 
         out_fh.write(
             "    cell_leakage_power : %.3f;\n"
-            % (self.get_memory().get_timing_data().leakage)
+            % (self.get_timing_data().leakage)
         )
         out_fh.write("}\n")
 
@@ -54,7 +89,7 @@ class LibertyExporter(Exporter):
         date = d.isoformat()
         current_time = time.strftime("%H:%M:%SZ", time.gmtime())
 
-        voltage = self.get_memory().get_process_data().voltage
+        (conditions, process, temperature, voltage) = self.get_operating_conditions()
         out_fh.write("    technology (cmos);\n")
         out_fh.write("    delay_model : table_lookup;\n")
         out_fh.write("    revision : 1.0;\n")
@@ -64,14 +99,14 @@ class LibertyExporter(Exporter):
         out_fh.write('    voltage_unit : "1V";\n')
         out_fh.write('    current_unit : "1uA";\n')
         out_fh.write('    leakage_power_unit : "1uW";\n')
-        out_fh.write("    nom_process : 1;\n")
-        out_fh.write("    nom_temperature : 25.000;\n")
+        out_fh.write("    nom_process : %g;\n" % process)
+        out_fh.write("    nom_temperature : %.3f;\n" % temperature)
         out_fh.write("    nom_voltage : %.3f;\n" % voltage)
         out_fh.write("    capacitive_load_unit (1,pf);\n\n")
         out_fh.write('    pulling_resistance_unit : "1kohm";\n\n')
-        out_fh.write("    operating_conditions(tt_1.0_25.0) {\n")
-        out_fh.write("        process : 1;\n")
-        out_fh.write("        temperature : 25.000;\n")
+        out_fh.write("    operating_conditions(%s) {\n" % conditions)
+        out_fh.write("        process : %g;\n" % process)
+        out_fh.write("        temperature : %.3f;\n" % temperature)
         out_fh.write("        voltage : %.3f;\n" % voltage)
         out_fh.write("        tree_type : balanced_tree;\n")
         out_fh.write("    }\n")
@@ -89,9 +124,12 @@ class LibertyExporter(Exporter):
         out_fh.write("    default_input_pin_cap : 0.0;\n")
         out_fh.write(
             "    default_max_transition : %.3f;\n\n"
-            % self.get_memory().get_timing_data().max_slew
+            % self.get_timing_data().max_slew
+        )
+        out_fh.write(
+            "    default_operating_conditions : %s;\n"
+            % self.get_operating_conditions()[0]
         )
-        out_fh.write("    default_operating_conditions : tt_1.0_25.0;\n")
         out_fh.write("    default_leakage_power_density : 0.0;\n")
         out_fh.write("\n")
 
@@ -111,31 +149,39 @@ class LibertyExporter(Exporter):
         """Writes the default table templates"""
 
         name = self.get_memory().get_name()
+        timing_data = self.get_timing_data()
+        slew_index = self.get_template_index(timing_data.get_num_slew_indices())
+        load_index = self.get_template_index(timing_data.get_num_load_indices())
         out_fh.write("    lu_table_template(%s_mem_out_delay_template) {\n" % name)
         out_fh.write("        variable_1 : input_net_transition;\n")
         out_fh.write("        variable_2 : total_output_net_capacitance;\n")
-        out_fh.write('            index_1 ("1000, 1001");\n')
-        out_fh.write('            index_2 ("1000, 1001");\n')
+        out_fh.write('            index_1 ("%s");\n' % slew_index)
+        out_fh.write('            index_2 ("%s");\n' % load_index)
         out_fh.write("    }\n")
         out_fh.write("    lu_table_template(%s_mem_out_slew_template) {\n" % name)
         out_fh.write("        variable_1 : total_output_net_capacitance;\n")
-        out_fh.write('            index_1 ("1000, 1001");\n')
+        out_fh.write('            index_1 ("%s");\n' % load_index)
         out_fh.write("    }\n")
         out_fh.write("    lu_table_template(%s_constraint_template) {\n" % name)
         out_fh.write("        variable_1 : related_pin_transition;\n")
         out_fh.write("        variable_2 : constrained_pin_transition;\n")
-        out_fh.write('            index_1 ("1000, 1001");\n')
-        out_fh.write('            index_2 ("1000, 1001");\n')
+        out_fh.write('            index_1 ("%s");\n' % slew_index)
+        out_fh.write('            index_2 ("%s");\n' % slew_index)
         out_fh.write("    }\n")
         out_fh.write("    power_lut_template(%s_energy_template_clkslew) {\n" % name)
         out_fh.write("        variable_1 : input_transition_time;\n")
-        out_fh.write('            index_1 ("1000, 1001");\n')
+        out_fh.write('            index_1 ("%s");\n' % slew_index)
         out_fh.write("    }\n")
         out_fh.write("    power_lut_template(%s_energy_template_sigslew) {\n" % name)
         out_fh.write("        variable_1 : input_transition_time;\n")
-        out_fh.write('            index_1 ("1000, 1001");\n')
+        out_fh.write('            index_1 ("%s");\n' % slew_index)
         out_fh.write("    }\n")
 
+    @staticmethod
+    def get_template_index(num_indices):
+        """Returns the placeholder index of a table template"""
+        return ", ".join(str(1000 + index) for index in range(num_indices))
+
     def write_bus_defs(self, out_fh):
         """Writes the bus type definitions"""
 
@@ -180,7 +226,8 @@ class LibertyExporter(Exporter):
 
         out_fh.write("            %s_power(%s) {\n" % (rise_fall, template_name))
         out_fh.write('                index_1 ("%s");\n' % slew_indices)
-        out_fh.write('                values ("%.3f, %.3f")\n' % (dynamic, dynamic))
+        nldm_model = self.get_timing_data().get_nldm_model()
+        out_fh.write('                values ("%s")\n' % nldm_model.get_power_row(dynamic))
         out_fh.write("            }\n")
 
     def write_internal_power(
@@ -199,7 +246,7 @@ class LibertyExporter(Exporter):
         """Writes the clock pin section"""
 
         int_power_template = self.get_memory().get_name() + "_energy_template_clkslew"
-        timing_data = self.get_memory().get_timing_data()
+        timing_data = self.get_timing_data()
         out_fh.write(f"    pin({pin_name})   {{\n")
         out_fh.write("        direction : input;\n")
         out_fh.write(
@@ -227,33 +274,32 @@ class LibertyExporter(Exporter):
         out_fh.write("            cell_%s(%s) {\n" % (rise_fall, template_name))
         out_fh.write('                index_1 ("%s");\n' % slew_indices)
         out_fh.write('                index_2 ("%s");\n' % load_indices)
+        nldm_model = self.get_timing_data().get_nldm_model()
         out_fh.write("                values ( \\\n")
-        out_fh.write('                  "%.3f, %.3f", \\\n' % (delay, delay))
-        out_fh.write('                  "%.3f, %.3f" \\\n' % (delay, delay))
+        out_fh.write(nldm_model.get_delay_rows(delay, "                  "))
         out_fh.write("                )\n")
         out_fh.write("            }\n")
 
-    def write_cell_transition(
-        self, out_fh, rise_fall, template_name, load_indices, min_slew, max_slew
-    ):
+    def write_cell_transition(self, out_fh, rise_fall, template_name, load_indices):
         """Writes the cell transition section"""
 
         out_fh.write("            %s_transition(%s) {\n" % (rise_fall, template_name))
         out_fh.write('                index_1 ("%s");\n' % load_indices)
-        out_fh.write('                values ("%.3f, %.3f")\n' % (min_slew, max_slew))
+        nldm_model = self.get_timing_data().get_nldm_model()
+        out_fh.write('                values ("%s")\n' % nldm_model.get_transition_row())
         out_fh.write("            }\n")
 
     def write_cell_constraint(
-        self, out_fh, rise_fall, template_name, slew_indices, val
+        self, out_fh, rise_fall, template_name, slew_indices, val, is_hold=False
     ):
         """Writes the cell constraint section"""
 
+        nldm_model = self.get_timing_data().get_nldm_model()
         out_fh.write("            %s_constraint(%s) {\n" % (rise_fall, template_name))
         out_fh.write('                index_1 ("%s");\n' % slew_indices)
         out_fh.write('                index_2 ("%s");\n' % slew_indices)
         out_fh.write("                values ( \\\n")
-        out_fh.write('                  "%.3f, %.3f", \\\n' % (val, val))
-        out_fh.write('                  "%.3f, %.3f" \\\n' % (val, val))
+        out_fh.write(nldm_model.get_constraint_rows(val, is_hold, "                  "))
         out_fh.write("                )\n")
         out_fh.write("            }\n")
 
@@ -264,12 +310,10 @@ class LibertyExporter(Exporter):
 
         delay_template_name = name + "_mem_out_delay_template"
         transition_template_name = name + "_mem_out_slew_template"
-        timing_data = self.get_memory().get_timing_data()
+        timing_data = self.get_timing_data()
         max_load = timing_data.max_load
         slew_indices = timing_data.slew_indices
         load_indices = timing_data.load_indices
-        min_slew = timing_data.min_slew
-        max_slew = timing_data.max_slew
         tcq = timing_data.access_time_ns
 
         out_fh.write("    bus(%s)   {\n" % pin_name)
@@ -292,10 +336,10 @@ class LibertyExporter(Exporter):
             out_fh, "fall", delay_template_name, slew_indices, load_indices, tcq
         )
         self.write_cell_transition(
-            out_fh, "rise", transition_template_name, load_indices, min_slew, max_slew
+            out_fh, "rise", transition_template_name, load_indices
         )
         self.write_cell_transition(
-            out_fh, "fall", transition_template_name, load_indices, min_slew, max_slew
+            out_fh, "fall", transition_template_name, load_indices
         )
         out_fh.write("        }\n")
         out_fh.write("    }\n")
@@ -304,7 +348,7 @@ class LibertyExporter(Exporter):
         """Writes the enable pin definition"""
 
         template_name = name + "_constraint_template"
-        timing_data = self.get_memory().get_timing_data()
+        timing_data = self.get_timing_data()
         min_driver_in_cap = timing_data.min_driver_in_cap
         slew_indices = timing_data.slew_indices
         tsetup = timing_data.t_setup_ns
@@ -332,14 +376,18 @@ class LibertyExporter(Exporter):
         out_fh.write("        timing() {\n")
         out_fh.write(f"            related_pin : {clk_pin_name};\n")
         out_fh.write("            timing_type : hold_rising ;\n")
-        self.write_cell_constraint(out_fh, "rise", template_name, slew_indices, thold)
-        self.write_cell_constraint(out_fh, "fall", template_name, slew_indices, thold)
+        self.write_cell_constraint(
+            out_fh, "rise", template_name, slew_indices, thold, True
+        )
+        self.write_cell_constraint(
+            out_fh, "fall", template_name, slew_indices, thold, True
+        )
         out_fh.write("        }\n")
 
     def write_address_bus(self, out_fh, name, bus_name, clk_pin_name):
         """Writes the address bus"""
 
-        timing_data = self.get_memory().get_timing_data()
+        timing_data = self.get_timing_data()
         min_driver_in_cap = timing_data.min_driver_in_cap
         slew_indices = timing_data.slew_indices
         tsetup = timing_data.t_setup_ns
@@ -367,7 +415,7 @@ class LibertyExporter(Exporter):
     ):
         """Writes the data bus"""
 
-        timing_data = self.get_memory().get_timing_data()
+        timing_data = self.get_timing_data()
         min_driver_in_cap = timing_data.min_driver_in_cap
         slew_indices = timing_data.slew_indices
         tsetup = timing_data.t_setup_ns
@@ -402,7 +450,7 @@ class LibertyExporter(Exporter):
     def write_generic_bus(self, out_fh, name, bus_name, clk_pin_name):
         """Writes the generic bus"""
 
-        timing_data = self.get_memory().get_timing_data()
+        timing_data = self.get_timing_data()
         min_driver_in_cap = timing_data.min_driver_in_cap
         slew_indices = timing_data.slew_indices
         tsetup = timing_data.t_setup_ns
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+
+import os
+import re
+import json
+import time
+import threading
+
+
+class Manifest:
+    """
+    Index of the memories written to an output directory and their files, so
+    that downstream tools can read one file instead of globbing, stat-ing
+    and hashing the output tree
+
+    Each memory records its index in the full macro list, the time it was
+    generated (UTC), its key parameters and a record of each file: view,
+    path relative to the output directory, size in bytes, SHA-256 (computed
+    while the file was written) and the time it took to write in seconds.
+
+    A run writes manifest.json to the output directory. A sharded run
+    (--shard i/N) writes a partial manifest named
+    manifest.shard-<i>-of-<N>.json instead and, once every shard is done,
+    merge combines the partial manifests into manifest.json in the order of
+    the macro list. Each manifest records the hash of the config it was
+    generated from (see RunUtils.get_config_hash), and merge rejects partial
+    manifests from different configs, e.g. a stale shard from an earlier run.
+
+    The entries are appended to a JSON Lines file beside the manifest
+    (manifest.entries.jsonl or manifest.shard-<i>-of-<N>.entries.jsonl) as
+    they're added, so a long run doesn't hold all of them. write reads them
+    back, sorts them by index and removes the entries file.
+    """
+
+    version = 1
+    merged_file_name = "manifest.json"
+    partial_file_name_re = re.compile(r"^manifest\.shard-(\d+)-of-(\d+)\.json$")
+
+    def __init__(self, output_dir, shard_planner=None, config_hash=None):
+        """Initializer"""
+
+        self._output_dir = os.path.realpath(os.path.expanduser(output_dir))
+        self._shard_planner = shard_planner
+        self._config_hash = config_hash
+        # The entries file is opened when the first entry is added
+        self._entries_fh = None
+        self._lock = threading.Lock()
+
+    def get_output_dir(self):
+        """Returns the output directory"""
+        return self._output_dir
+
+    @staticmethod
+    def get_params(memory):
+        """Returns the key parameters of the memory"""
+
+        return {
+            "class": type(memory).__name__,
+            "width": memory.get_width(),
+            "depth": memory.get_depth(),
+            "banks": memory.get_num_banks(),
+            "additional_height": memory.get_additional_height(),
+            "num_pins": memory.get_num_pins(),
+            "tech_nm": memory.get_process_data().get_tech_nm(),
+            "verilog_flavor": memory.get_verilog_options().get_verilog_flavor(),
+        }
+
+    def create_entry(self, memory, index, file_records, name=None):
+        """
+        Returns the manifest entry of a memory with its index in the macro
+        list and the records of its files (see RunUtils.write_file), under
+        its name or the given name (e.g. for copies of a memory)
+        """
+
+        files = []
+        for file_record in file_records:
+            file_record = dict(file_record)
+            file_record["path"] = os.path.relpath(file_record["path"], self._output_dir)
+            files.append(file_record)
+        # The same format as datetime's isoformat, which isn't worth importing
+        generated_at = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+        return {
+            "name": name or memory.get_name(),
+            "index": index,
+            "generated_at": generated_at,
+            "params": self.get_params(memory),
+            "files": files,
+        }
+
+    def add_entry(self, entry):
+        """Adds an entry returned by create_entry to the entries file"""
+
+        with self._lock:
+            if self._entries_fh is None:
+                if not os.path.isdir(self._output_dir):
+                    os.makedirs(self._output_dir, exist_ok=True)
+                self._entries_fh = open(self.get_entries_file_name(), "w")
+            self._entries_fh.write(json.dumps(entry) + "\n")
+
+    def add_memory(self, memory, index, file_records):
+        """Adds the entry of a memory (see create_entry)"""
+        self.add_entry(self.create_entry(memory, index, file_records))
+
+    def get_memories(self):
+        """Returns the memories added so far sorted by index"""
+
+        with self._lock:
+            if self._entries_fh is None:
+                return []
+            self._entries_fh.flush()
+            with open(self.get_entries_file_name(), "r") as in_fh:
+                memories = [json.loads(line) for line in in_fh]
+        return sorted(memories, key=lambda memory: memory["index"])
+
+    @staticmethod
+    def get_partial_file_name(shard_index, num_shards):
+        """Returns the base name of the partial manifest of a shard"""
+        return f"manifest.shard-{shard_index}-of-{num_shards}.json"
+
+    def get_file_name(self):
+        """Returns the full path of the manifest"""
+
+        if self._shard_planner:
+            base_name = self.get_partial_file_name(
+                self._shard_planner.get_shard_index(),
+                self._shard_planner.get_num_shards(),
+            )
+        else:
+            base_name = self.merged_file_name
+        return os.path.join(self._output_dir, base_name)
+
+    def get_entries_file_name(self):
+        """Returns the full path of the entries file"""
+        return os.path.splitext(self.get_file_name())[0] + ".entries.jsonl"
+
+    def get_config_hash(self):
+        """Returns the hash of the config or None"""
+        return self._config_hash
+
+    def get_json_data(self):
+        """Returns the manifest as JSON data"""
+
+        shard = None
+        if self._shard_planner:
+            shard = {
+                "index": self._shard_planner.get_shard_index(),
+                "count": self._shard_planner.get_num_shards(),
+            }
+        return {
+            "version": self.version,
+            "shard": shard,
+            "config_hash": self._config_hash,
+            "memories": self.get_memories(),
+        }
+
+    @staticmethod
+    def write_json(file_name, json_data):
+        """Writes the JSON data to a temporary file and renames it"""
+
+        tmp_file_name = f"{file_name}.{os.getpid()}.tmp"
+        with open(tmp_file_name, "w") as out_fh:
+            json.dump(json_data, out_fh, indent=2)
+            out_fh.write("\n")
+        os.replace(tmp_file_name, file_name)
+
+    def write(self):
+        """
+        Writes the manifest, removes the entries file and returns the
+        manifest file name
+        """
+
+        if not os.path.isdir(self._output_dir):
+            os.makedirs(self._output_dir)
+        file_name = self.get_file_name()
+        self.write_json(file_name, self.get_json_data())
+        self.close()
+        return file_name
+
+    def close(self):
+        """Closes and removes the entries file"""
+
+        with self._lock:
+            if self._entries_fh is not None:
+                self._entries_fh.close()
+                self._entries_fh = None
+            # Also remove the entries of an earlier run that stopped early
+            entries_file_name = self.get_entries_file_name()
+            if os.path.exists(entries_file_name):
+                os.remove(entries_file_name)
+
+    @staticmethod
+    def read(file_name):
+        """Reads and returns the JSON data of a manifest"""
+
+        with open(file_name, "r") as in_fh:
+            json_data = json.load(in_fh)
+        if json_data.get("version") != Manifest.version:
+            raise Exception(
+                "Unsupported manifest version in {}: {}".format(
+                    file_name, json_data.get("version")
+                )
+            )
+        return json_data
+
+    @staticmethod
+    def merge(output_dir):
+        """
+        Merges the partial manifests in the output directory into
+        manifest.json and returns its file name. Raises an exception if a
+        shard is missing, the shards were generated from different configs or
+        two shards wrote the same memory
+        """
+
+        output_dir = os.path.realpath(os.path.expanduser(output_dir))
+        # num_shards -> shard index -> file name
+        partials = {}
+        for base_name in sorted(os.listdir(output_dir)):
+            match = Manifest.partial_file_name_re.match(base_name)
+            if match:
+                (shard_index, num_shards) = (int(match[1]), int(match[2]))
+                partials.setdefault(num_shards, {})[shard_index] = os.path.join(
+                    output_dir, base_name
+                )
+        if not partials:
+            raise Exception(f"No partial manifests found in {output_dir}")
+        if len(partials) > 1:
+            raise Exception(
+                "Partial manifests from different shard counts ({}) in {}".format(
+                    ", ".join(str(num_shards) for num_shards in sorted(partials)),
+                    output_dir,
+                )
+            )
+        (num_shards, file_names) = partials.popitem()
+        missing = [str(i) for i in range(num_shards) if i not in file_names]
+        if missing:
+            raise Exception(
+                "Missing partial manifests for shards {} of {}".format(
+                    ", ".join(missing), num_shards
+                )
+            )
+
+        partial_data = [Manifest.read(file_names[i]) for i in range(num_shards)]
+        config_hashes = [json_data.get("config_hash") for json_data in partial_data]
+        if len(set(config_hashes)) > 1:
+            raise Exception(
+                "Partial manifests from different configs in {} (shards {})".format(
+                    output_dir,
+                    ", ".join(
+                        f"{shard_index}: {config_hash}"
+                        for shard_index, config_hash in enumerate(config_hashes)
+                    ),
+                )
+            )
+
+        memories = []
+        names = {}
+        for shard_index, json_data in enumerate(partial_data):
+            for memory in json_data["memories"]:
+                if memory["name"] in names:
+                    raise Exception(
+                        "Memory {} was written by shards {} and {}".format(
+                            memory["name"], names[memory["name"]], shard_index
+                        )
+                    )
+                names[memory["name"]] = shard_index
+                memories.append(dict(memory, shard=shard_index))
+        memories.sort(key=lambda memory: memory["index"])
+        json_data = {
+            "version": Manifest.version,
+            "shard": None,
+            "config_hash": config_hashes[0],
+            "num_shards": num_shards,
+            "memories": memories,
+        }
+        file_name = os.path.join(output_dir, Manifest.merged_file_name)
+        Manifest.write_json(file_name, json_data)
+        return file_name
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import os
+import pickle
+import hashlib
+
+
+class MappingCache:
+    """
+    Serialized cache of the maps evaluated from a custom spreadsheet mapping
+    file (see SSRAMGenerator._import_custom_mappings)
+
+    The cache is stored beside the mapping file and is keyed on the SHA-256 of
+    the mapping file's contents, so editing the mapping file invalidates it.
+    Any problem reading or writing the cache just falls back to executing the
+    mapping file.
+    """
+
+    suffix = ".map_cache"
+    version = 1
+
+    def __init__(self, mapping_file_name):
+        """Initializer"""
+
+        self._mapping_file_name = mapping_file_name
+        self._cache_file_name = mapping_file_name + self.suffix
+
+    def get_cache_file_name(self):
+        """Returns the cache file name"""
+        return self._cache_file_name
+
+    def get_mapping_hash(self):
+        """Returns the SHA-256 hex digest of the mapping file"""
+
+        with open(self._mapping_file_name, "rb") as in_fh:
+            return hashlib.sha256(in_fh.read()).hexdigest()
+
+    def load(self):
+        """
+        Returns the cached (pin_type_map, key_map) pair or None if the cache
+        doesn't exist, is stale or can't be read
+        """
+
+        if not os.path.exists(self._cache_file_name):
+            return None
+        try:
+            with open(self._cache_file_name, "rb") as in_fh:
+                cache_data = pickle.load(in_fh)
+            if cache_data.get("version") != self.version or cache_data.get(
+                "sha256"
+            ) != self.get_mapping_hash():
+                return None
+            return (cache_data["pin_type_map"], cache_data["key_map"])
+        except Exception as ex:
+            print(f"Warning: ignoring mapping cache {self._cache_file_name}: {ex}")
+            return None
+
+    def save(self, pin_type_map, key_map):
+        """Writes the maps to the cache. Returns True if successful"""
+
+        cache_data = {
+            "version": self.version,
+            "sha256": self.get_mapping_hash(),
+            "pin_type_map": pin_type_map,
+            "key_map": key_map,
+        }
+        # Write to a temporary file and rename it, so that concurrent runs
+        # never see a partially written cache
+        tmp_file_name = f"{self._cache_file_name}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file_name, "wb") as out_fh:
+                pickle.dump(cache_data, out_fh)
+            os.replace(tmp_file_name, self._cache_file_name)
+        except Exception as ex:
+            print(
+                f"Warning: unable to write mapping cache {self._cache_file_name}: {ex}"
+            )
+            if os.path.exists(tmp_file_name):
+                os.remove(tmp_file_name)
+            return False
+        return True
@@ -1,10 +1,6 @@
 #!/usr/bin/env python3
 
 from factory_base import FactoryBase
-from single_port_ram import SinglePortRAM
-from dual_port_ram import DualPortRAM
-from single_port_regfile import SinglePortRegFile
-from dual_port_regfile import DualPortRegFile
 
 
 class MemoryFactory(FactoryBase):
@@ -13,8 +9,9 @@ class MemoryFactory(FactoryBase):
     pass
 
 
-# Register known memory types
-MemoryFactory.register("RAM", "SP", SinglePortRAM)
-MemoryFactory.register("RAM", "DP", DualPortRAM)
-MemoryFactory.register("RF", "SP", SinglePortRegFile)
-MemoryFactory.register("RF", "DP", DualPortRegFile)
+# Register known memory types. The classes are registered by name so that
+# each one (and its exporters) is only imported when it's first created
+MemoryFactory.register("RAM", "SP", "single_port_ram.SinglePortRAM")
+MemoryFactory.register("RAM", "DP", "dual_port_ram.DualPortRAM")
+MemoryFactory.register("RF", "SP", "single_port_regfile.SinglePortRegFile")
+MemoryFactory.register("RF", "DP", "dual_port_regfile.DualPortRegFile")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+
+class NLDMModel:
+    """
+    Linear model of the NLDM (non-linear delay model) table values
+
+    The tables are indexed by the slew and load indices of the TimingData
+    (see the "nldm" config section) and the values are:
+
+        delay(slew, load) = delay + delay_slew_sensitivity * (slew - min_slew)
+                            + drive_resistance_kohm * (load - min_load)
+        transition(load) = min_slew to max_slew, linear in load
+        setup(clk_slew, slew) = setup + constraint_slew_sensitivity *
+                                (slew - clk_slew)
+        hold(clk_slew, slew) = hold + constraint_slew_sensitivity *
+                               (clk_slew - slew)
+        power(slew) = power * (1 + power_slew_sensitivity * (slew - min_slew))
+
+    With the default (zero) coefficients every entry of a table has the same
+    value. Each table is computed and formatted once per value and cached,
+    since the same tables are written for every pin and bus of the macro.
+    """
+
+    def __init__(self, timing_data):
+        """Initializer"""
+
+        self._timing_data = timing_data
+        min_slew = timing_data.get_min_slew()
+        min_load = timing_data.get_min_load()
+        self._slew_deltas = [
+            slew - min_slew for slew in timing_data.get_slew_index_values()
+        ]
+        self._load_deltas = [
+            load - min_load for load in timing_data.get_load_index_values()
+        ]
+        self._cache = {}
+
+    @staticmethod
+    def format_row(values):
+        """Returns the comma separated values"""
+        return ", ".join("%.3f" % value for value in values)
+
+    @staticmethod
+    def format_rows(rows, indent):
+        """Returns the lines of a two dimensional values attribute"""
+
+        lines = [f'{indent}"{NLDMModel.format_row(row)}", \\\n' for row in rows]
+        lines[-1] = f'{indent}"{NLDMModel.format_row(rows[-1])}" \\\n'
+        return "".join(lines)
+
+    def _get_cached(self, key, calc_fn):
+        """Returns the cached value of key, calculating it if needed"""
+
+        if key not in self._cache:
+            self._cache[key] = calc_fn()
+        return self._cache[key]
+
+    def get_delay_rows(self, delay, indent):
+        """Returns the formatted delay table rows (slew x load)"""
+
+        timing_data = self._timing_data
+
+        def calc_rows():
+            slew_sensitivity = timing_data.get_delay_slew_sensitivity()
+            resistance = timing_data.get_drive_resistance_kohm()
+            load_terms = [resistance * load_delta for load_delta in self._load_deltas]
+            return self.format_rows(
+                [
+                    [delay + slew_sensitivity * slew_delta + term for term in load_terms]
+                    for slew_delta in self._slew_deltas
+                ],
+                indent,
+            )
+
+        return self._get_cached(("delay", delay, indent), calc_rows)
+
+    def get_transition_row(self):
+        """Returns the formatted output transition row (load)"""
+
+        timing_data = self._timing_data
+        min_slew = timing_data.get_min_slew()
+        max_slew = timing_data.get_max_slew()
+        load_range = timing_data.get_max_load() - timing_data.get_min_load()
+
+        def calc_row():
+            fractions = [load_delta / load_range for load_delta in self._load_deltas]
+            return self.format_row(
+                (1 - fraction) * min_slew + fraction * max_slew
+                for fraction in fractions
+            )
+
+        return self._get_cached(("transition",), calc_row)
+
+    def get_constraint_rows(self, val, is_hold, indent):
+        """
+        Returns the formatted constraint table rows (related pin slew x
+        constrained pin slew)
+        """
+
+        sensitivity = self._timing_data.get_constraint_slew_sensitivity()
+        if is_hold:
+            sensitivity = -sensitivity
+        return self._get_cached(
+            ("constraint", val, is_hold, indent),
+            lambda: self.format_rows(
+                [
+                    [
+                        val + sensitivity * (slew_delta - clk_slew_delta)
+                        for slew_delta in self._slew_deltas
+                    ]
+                    for clk_slew_delta in self._slew_deltas
+                ],
+                indent,
+            ),
+        )
+
+    def get_power_row(self, power):
+        """Returns the formatted internal power row (slew)"""
+
+        sensitivity = self._timing_data.get_power_slew_sensitivity()
+        return self._get_cached(
+            ("power", power),
+            lambda: self.format_row(
+                power * (1 + sensitivity * slew_delta)
+                for slew_delta in self._slew_deltas
+            ),
+        )
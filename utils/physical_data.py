@@ -58,7 +58,8 @@ class PhysicalData:
             return self._snapped_width_um * self._snapped_height_um
         return self._width_um * self._height_um
 
-    def snap_side_to_grid(self, side_um, snap_nm):
+    @staticmethod
+    def snap_side_to_grid(side_um, snap_nm):
         """Snaps the length to the grid"""
 
         return (math.ceil((side_um * 1000.0) / snap_nm) * snap_nm) / 1000.0
@@ -84,6 +85,14 @@ class PhysicalData:
 
         return self._group_pitch
 
+    @staticmethod
+    def calc_num_tracks(height, min_pin_pitch, y_offset):
+        """
+        Returns the number of pin tracks available on a side of the given
+        height
+        """
+        return math.floor((height - 2 * y_offset) / min_pin_pitch)
+
     def set_pin_pitches(self, name, num_pins, min_pin_pitch, y_offset):
         """Calculate the pin spacing (pitch)"""
 
@@ -92,7 +101,7 @@ class PhysicalData:
             raise Exception(
                 f"Error: attempting to set pin pitches before height ({name})"
             )
-        number_of_tracks_available = math.floor((h - 2 * y_offset) / min_pin_pitch)
+        number_of_tracks_available = self.calc_num_tracks(h, min_pin_pitch, y_offset)
         number_of_spare_tracks = number_of_tracks_available - num_pins
 
         if number_of_spare_tracks < 0:
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+import os
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class PinLayoutCache:
+    """
+    Cache of the pin and strap rects computed by BasicPortCreator, which are
+    the same for every memory with the same snapped size, pin pitches and
+    port structure (e.g. most of a bank family)
+
+    The layouts are keyed on a tuple of the values that affect them (see
+    BasicPortCreator.get_signal_layout_key and get_pg_layout_key) and kept
+    in an in-process LRU of max_size layouts, shared by all threads. If a
+    cache directory is set, each layout is also pickled to a file named
+    after the SHA-256 of its key, so that later runs and other worker
+    processes reuse it. Pickle keeps the floats bit-identical. Any problem
+    reading or writing a cache file just falls back to computing the
+    layout.
+
+    The cached rects are shared by the memories that use them, so
+    BasicPortCreator stores them as tuples, which can't be modified.
+    """
+
+    version = 2
+    suffix = ".pin_layout"
+    max_size = 256
+
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+    _cache_dir = None
+    _stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+    @classmethod
+    def set_cache_dir(self, cache_dir):
+        """Sets the on-disk cache directory (None disables it)"""
+
+        if cache_dir:
+            cache_dir = os.path.realpath(os.path.expanduser(cache_dir))
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir, exist_ok=True)
+        self._cache_dir = cache_dir
+
+    @classmethod
+    def get_cache_dir(self):
+        """Returns the on-disk cache directory or None"""
+        return self._cache_dir
+
+    @classmethod
+    def clear(self):
+        """Clears the in-process cache and the statistics"""
+
+        with self._lock:
+            self._entries.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+
+    @classmethod
+    def get_stats(self):
+        """Returns the number of hits, disk hits and misses"""
+
+        with self._lock:
+            return dict(self._stats)
+
+    @classmethod
+    def get_file_name(self, key):
+        """Returns the on-disk cache file name of the key"""
+
+        digest = hashlib.sha256(repr((self.version, key)).encode("utf-8"))
+        return os.path.join(self._cache_dir, digest.hexdigest() + self.suffix)
+
+    @classmethod
+    def get(self, key, compute_fn):
+        """
+        Returns the layout of the key, calling compute_fn to compute it if
+        it isn't cached
+        """
+
+        with self._lock:
+            layout = self._entries.get(key)
+            if layout is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return layout
+
+        stat_name = "disk_hits"
+        layout = self._load(key) if self._cache_dir else None
+        if layout is None:
+            stat_name = "misses"
+            layout = compute_fn()
+            if self._cache_dir:
+                self._save(key, layout)
+
+        with self._lock:
+            self._stats[stat_name] += 1
+            self._entries[key] = layout
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return layout
+
+    @classmethod
+    def _load(self, key):
+        """Returns the layout from the cache file or None"""
+
+        file_name = self.get_file_name(key)
+        if not os.path.exists(file_name):
+            return None
+        try:
+            with open(file_name, "rb") as in_fh:
+                cache_data = pickle.load(in_fh)
+            if cache_data.get("version") != self.version or cache_data["key"] != key:
+                return None
+            return cache_data["layout"]
+        except Exception as ex:
+            print(f"Warning: ignoring pin layout cache {file_name}: {ex}")
+            return None
+
+    @classmethod
+    def _save(self, key, layout):
+        """Writes the layout to its cache file"""
+
+        file_name = self.get_file_name(key)
+        cache_data = {"version": self.version, "key": key, "layout": layout}
+        # Write to a temporary file and rename it, so that concurrent runs
+        # never see a partially written cache
+        tmp_file_name = f"{file_name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file_name, "wb") as out_fh:
+                pickle.dump(cache_data, out_fh)
+            os.replace(tmp_file_name, file_name)
+        except Exception as ex:
+            print(f"Warning: unable to write pin layout cache {file_name}: {ex}")
+            if os.path.exists(tmp_file_name):
+                os.remove(tmp_file_name)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+
+class PinTypeClassifier:
+    """
+    Classifies pin and bus names using a pin type map (see the spreadsheet
+    mapping file's get_pin_type_map)
+
+    An exact match in the map wins. Otherwise, the longest prefix in the map
+    that matches the name is used, so the result doesn't depend on the order
+    of the entries in the map. The prefixes are stored in a character trie
+    that is built once per map, so a lookup costs O(len(name)) regardless of
+    the number of map entries. Results are memoized since bus base names are
+    looked up repeatedly.
+    """
+
+    # Key used to store the pin type on a trie node. Can't collide with the
+    # single-character keys used for the children
+    _TYPE_KEY = ""
+
+    def __init__(self, pin_type_map):
+        """Initializer"""
+
+        self._pin_type_map = pin_type_map
+        self._trie = {}
+        self._memo = {}
+        for prefix, pin_type in pin_type_map.items():
+            node = self._trie
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[self._TYPE_KEY] = pin_type
+
+    def get_pin_type_map(self):
+        """Returns the pin type map"""
+        return self._pin_type_map
+
+    def classify(self, name):
+        """
+        Returns the pin type for the given pin or bus name or None if there
+        isn't a matching entry in the map
+        """
+
+        if name in self._memo:
+            return self._memo[name]
+        pin_type = self._pin_type_map.get(name)
+        if pin_type is None:
+            pin_type = self._longest_prefix_match(name)
+        self._memo[name] = pin_type
+        return pin_type
+
+    def _longest_prefix_match(self, name):
+        """Walks the trie and returns the type of the longest matching prefix"""
+
+        node = self._trie
+        pin_type = node.get(self._TYPE_KEY)
+        for char in name:
+            node = node.get(char)
+            if node is None:
+                break
+            pin_type = node.get(self._TYPE_KEY, pin_type)
+        return pin_type
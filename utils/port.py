@@ -73,6 +73,10 @@ class Port(NamedObject):
         """Sets the port/pin shape"""
         self._rect_list.append(rect)
 
+    def add_rects(self, rects):
+        """Adds a list of port/pin shapes"""
+        self._rect_list.extend(rects)
+
     def get_rects(self):
         """Gets the port/pin shape list"""
         return self._rect_list
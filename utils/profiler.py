@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+
+import os
+import csv
+import json
+import time
+import threading
+import contextlib
+
+
+class Profiler:
+    """
+    Collects the wall time of each stage of each macro (in ns, with
+    time.perf_counter_ns), the number of bytes written by the stage and the
+    pin and rect counts of each macro
+
+    Stages are timed with Profiler.active_stage, which does nothing unless a
+    profiler has been activated, so the code being profiled doesn't need to
+    pass a profiler around. Run-level stages (e.g. reading the config) use
+    the macro name "". Stages can be nested (e.g. create_ports runs inside
+    create); only the outermost stages count towards the macro totals.
+    """
+
+    _active = None
+
+    def __init__(self):
+        """Initializer"""
+
+        # list of {"macro", "stage", "depth", "wall_ns", "bytes"}
+        self._stages = []
+        # Stage nesting depth of each thread
+        self._local = threading.local()
+        # queue -> {"samples", "total", "max"}
+        self._queue_depths = {}
+        # macro -> {"num_pins", "num_rects"}
+        self._macro_stats = {}
+
+    def activate(self):
+        """Makes this the profiler used by active_stage"""
+        Profiler._active = self
+
+    @staticmethod
+    def get_active():
+        """Returns the active profiler (None if profiling is off)"""
+        return Profiler._active
+
+    @staticmethod
+    def deactivate():
+        """Turns profiling off"""
+        Profiler._active = None
+
+    @staticmethod
+    @contextlib.contextmanager
+    def active_stage(macro, stage, file_name=None):
+        """
+        Times the stage with the active profiler, if there is one. If a file
+        name is given, its size is recorded as the bytes written
+        """
+
+        profiler = Profiler._active
+        if profiler is None:
+            yield
+            return
+        with profiler.stage(macro, stage, file_name):
+            yield
+
+    @staticmethod
+    def record_memory(memory, name=None):
+        """
+        Records the pin and rect counts of the memory with the active
+        profiler, under the name if given (see add_memory_stats)
+        """
+
+        if Profiler._active is not None:
+            Profiler._active.add_memory_stats(memory, name)
+
+    @staticmethod
+    def record_queue_depth(queue, depth):
+        """
+        Records a sample of the depth of the queue with the active profiler,
+        if there is one
+        """
+
+        if Profiler._active is not None:
+            Profiler._active.add_queue_depth(queue, depth)
+
+    @contextlib.contextmanager
+    def stage(self, macro, stage, file_name=None):
+        """Times the stage"""
+
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            wall_ns = time.perf_counter_ns() - start
+            self._local.depth = depth
+            num_bytes = 0
+            if file_name and os.path.exists(file_name):
+                num_bytes = os.path.getsize(file_name)
+            self.add_stage(macro, stage, wall_ns, num_bytes, depth)
+
+    def add_stage(self, macro, stage, wall_ns, num_bytes=0, depth=0):
+        """Adds a stage record"""
+
+        self._stages.append(
+            {
+                "macro": macro,
+                "stage": stage,
+                "depth": depth,
+                "wall_ns": wall_ns,
+                "bytes": num_bytes,
+            }
+        )
+
+    def add_queue_depth(self, queue, depth):
+        """Adds a sample of the depth of the queue"""
+
+        stats = self._queue_depths.setdefault(
+            queue, {"samples": 0, "total": 0, "max": 0}
+        )
+        stats["samples"] += 1
+        stats["total"] += depth
+        stats["max"] = max(stats["max"], depth)
+
+    def get_queue_stats(self):
+        """
+        Returns a dictionary of queue -> number of samples, mean and max
+        depth, in the order the queues were first sampled
+        """
+
+        return {
+            queue: {
+                "samples": stats["samples"],
+                "mean": round(stats["total"] / stats["samples"], 3),
+                "max": stats["max"],
+            }
+            for queue, stats in self._queue_depths.items()
+        }
+
+    def add_memory_stats(self, memory, name=None):
+        """
+        Records the pin and rect counts of the memory under its name or the
+        given name (e.g. for copies of a memory, see RunUtils.write_views)
+        """
+
+        ports = list(memory.get_ports().values())
+        ports += list(memory.get_pg_ports().values())
+        num_rects = sum(len(port.get_rects()) for port in ports)
+        for layer_data in memory.get_obstructions().values():
+            num_rects += len(layer_data["rects"])
+        self._macro_stats[name or memory.get_name()] = {
+            "num_pins": len(ports),
+            "num_rects": num_rects,
+        }
+
+    def get_stages(self):
+        """Returns the stage records"""
+        return self._stages
+
+    def get_macro_summaries(self):
+        """
+        Returns a list with the total wall time, bytes, slowest stage and pin
+        and rect counts of each macro, in the order the macros were profiled
+        """
+
+        summaries = {}
+        for record in self._stages:
+            if not record["macro"]:
+                continue
+            summary = summaries.setdefault(
+                record["macro"],
+                {
+                    "macro": record["macro"],
+                    "wall_ns": 0,
+                    "bytes": 0,
+                    "slowest_stage": None,
+                    "slowest_stage_ns": -1,
+                },
+            )
+            if record["depth"] == 0:
+                summary["wall_ns"] += record["wall_ns"]
+            summary["bytes"] += record["bytes"]
+            if record["wall_ns"] > summary["slowest_stage_ns"]:
+                summary["slowest_stage"] = record["stage"]
+                summary["slowest_stage_ns"] = record["wall_ns"]
+        for macro, summary in summaries.items():
+            summary.update(
+                self._macro_stats.get(macro, {"num_pins": 0, "num_rects": 0})
+            )
+        return list(summaries.values())
+
+    def get_slowest_macros(self, top_n):
+        """Returns the summaries of the top_n slowest macros"""
+
+        summaries = self.get_macro_summaries()
+        summaries.sort(key=lambda summary: summary["wall_ns"], reverse=True)
+        return summaries[:top_n]
+
+    def write_report(self, file_name):
+        """Writes the report as CSV if the file name ends in .csv, else JSON"""
+
+        if file_name.lower().endswith(".csv"):
+            fields = ["macro", "stage", "depth", "wall_ns", "bytes"]
+            fields += ["num_pins", "num_rects"]
+            with open(file_name, "w", newline="") as out_fh:
+                writer = csv.DictWriter(out_fh, fieldnames=fields)
+                writer.writeheader()
+                for record in self._stages:
+                    row = dict(record)
+                    row.update(self._macro_stats.get(record["macro"], {}))
+                    writer.writerow(row)
+        else:
+            report = {
+                "total_wall_ns": sum(
+                    record["wall_ns"]
+                    for record in self._stages
+                    if record["depth"] == 0
+                ),
+                "stages": self._stages,
+                "macros": self.get_macro_summaries(),
+                "queues": self.get_queue_stats(),
+            }
+            with open(file_name, "w") as out_fh:
+                json.dump(report, out_fh, indent=2)
+
+    def print_summary(self, top_n):
+        """Prints the top_n slowest macros"""
+
+        for queue, stats in self.get_queue_stats().items():
+            print(
+                "Queue {}: mean depth {:.2f}, max {} ({} samples)".format(
+                    queue, stats["mean"], stats["max"], stats["samples"]
+                )
+            )
+        slowest = self.get_slowest_macros(top_n)
+        if not slowest:
+            return
+        print(f"Slowest {len(slowest)} macros:")
+        for summary in slowest:
+            print(
+                "  {:<30} {:>10.3f} ms  (slowest stage: {} {:.3f} ms, {} bytes, {} pins, {} rects)".format(
+                    summary["macro"],
+                    summary["wall_ns"] / 1e6,
+                    summary["slowest_stage"],
+                    summary["slowest_stage_ns"] / 1e6,
+                    summary["bytes"],
+                    summary["num_pins"],
+                    summary["num_rects"],
+                )
+            )
+
+    @staticmethod
+    def finish(report_file_name, top_n):
+        """
+        Writes the report of the active profiler, prints its summary and
+        turns profiling off
+        """
+
+        profiler = Profiler._active
+        if profiler is None:
+            return
+        Profiler.deactivate()
+        profiler.write_report(report_file_name)
+        profiler.print_summary(top_n)
+
+    @staticmethod
+    def run(main_fn, cprofile_file_name=None):
+        """
+        Calls main_fn, wrapped in cProfile if a file name is given, in which
+        case the cProfile stats are dumped to it (see pstats)
+        """
+
+        if not cprofile_file_name:
+            return main_fn()
+        # cProfile is only needed with --cprofile
+        import cProfile
+
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            return main_fn()
+        finally:
+            profile.disable()
+            profile.dump_stats(cprofile_file_name)
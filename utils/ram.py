@@ -9,7 +9,7 @@ from ram_liberty_exporter import RAMLibertyExporter
 class RAM(Memory):
     """Base class for RAMs"""
 
-    def __init__(self, mem_config, process_data, timing_data):
+    def __init__(self, mem_config, process_data, timing_data, calc_dimensions=True):
         """
         Initializer
 
@@ -17,22 +17,17 @@ class RAM(Memory):
         mem_config (MemoryConfig): memory parameter container
         process_data (Process): process data container
         timing_data (TimingData): timing data container
+        calc_dimensions (bool): calculate the dimensions from the process
         """
-        Memory.__init__(self, mem_config, process_data, timing_data)
+        Memory.__init__(self, mem_config, process_data, timing_data, calc_dimensions)
 
-    def write_verilog_file(self, out_file_name, is_blackbox=False):
+    def create_verilog_exporter(self, sparse=False):
         """
-        Writes the verilog content to a file
-
-        If is_blackbox, then write the port declarations only. Otherwise, write
-        the full RTL
+        Returns a Verilog exporter for the memory (of the sparse model if
+        sparse is set)
         """
+        return RAMVerilogExporter(self, sparse)
 
-        exporter = RAMVerilogExporter(self)
-        exporter.export_file(out_file_name, is_blackbox)
-
-    def write_liberty_file(self, out_file_name):
-        """Writes the Liberty content to a file"""
-
-        exporter = RAMLibertyExporter(self)
-        exporter.export_file(out_file_name)
+    def create_liberty_exporter(self, corner=None):
+        """Returns a Liberty exporter for the memory (and corner if given)"""
+        return RAMLibertyExporter(self, corner)
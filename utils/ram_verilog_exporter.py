@@ -6,9 +6,9 @@ from verilog_exporter import VerilogExporter
 class RAMVerilogExporter(VerilogExporter):
     """RAM verilog exporter"""
 
-    def __init__(self, memory):
+    def __init__(self, memory, sparse=False):
         """Initializer"""
-        VerilogExporter.__init__(self, memory)
+        VerilogExporter.__init__(self, memory, sparse)
 
     def export_module(self, out_fh):
         """Exports the verilog module to the output stream"""
@@ -19,9 +19,10 @@ class RAMVerilogExporter(VerilogExporter):
         out_fh.write("    reg [ADDR_WIDTH-1:0] addr_a_reg;\n")
         out_fh.write("    reg [ADDR_WIDTH-1:0] addr_b_reg;\n")
         out_fh.write("\n")
-        out_fh.write("    integer i;\n")
-        out_fh.write("\n")
-        out_fh.write(f"    always @(posedge {clk_pin_name}) begin\n")
+        if not self.is_fast_sim():
+            out_fh.write("    integer i;\n")
+            out_fh.write("\n")
+        out_fh.write(f"    {self.get_always_keyword()} @(posedge {clk_pin_name}) begin\n")
         self.write_always(out_fh)
         self.write_readback(out_fh)
         out_fh.write("    end\n")
@@ -32,20 +33,30 @@ class RAMVerilogExporter(VerilogExporter):
 
         suffix = rw_port_group.get_suffix()
         out_fh.write(f"        // ==== Port {suffix.upper()} write ====\n")
+        write_stmt = self.get_memory_write(
+            rw_port_group.get_address_bus_name(),
+            rw_port_group.get_data_input_bus_name(),
+        )
+        if self.is_fast_sim():
+            out_fh.write(
+                f"        if ({rw_port_group.get_write_enable_name()}) {write_stmt}\n"
+            )
+            return
         out_fh.write(
             f"        if (^{rw_port_group.get_write_enable_name()} === 1'bx || ^{rw_port_group.get_address_bus_name()} === 1'bx) begin\n"
         )
         out_fh.write(
             "            // Unknown write enable or address ? corrupt entire memory\n"
         )
-        out_fh.write("            for (i = 0; i < (1 << ADDR_WIDTH); i = i + 1)\n")
-        out_fh.write("                mem[i] <= {DATA_WIDTH{1'bx}};\n")
+        if self.use_sparse_model():
+            out_fh.write("            mem.delete();\n")
+        else:
+            out_fh.write("            for (i = 0; i < (1 << ADDR_WIDTH); i = i + 1)\n")
+            out_fh.write("                mem[i] <= {DATA_WIDTH{1'bx}};\n")
         out_fh.write(
             f"        end else if ({rw_port_group.get_write_enable_name()}) begin\n"
         )
-        out_fh.write(
-            f"            mem[{rw_port_group.get_address_bus_name()}] <= {rw_port_group.get_data_input_bus_name()};\n"
-        )
+        out_fh.write(f"            {write_stmt}\n")
         out_fh.write("        end\n")
 
     def write_readback(self, out_fh):
@@ -61,6 +72,7 @@ class RAMVerilogExporter(VerilogExporter):
         out_fh.write(
             f"        {rw_port_group.get_address_bus_name()}_reg <= {rw_port_group.get_address_bus_name()};\n"
         )
+        read_expr = self.get_memory_read(f"{rw_port_group.get_address_bus_name()}_reg")
         out_fh.write(
-            f"        {rw_port_group.get_data_output_bus_name()} <= mem[{rw_port_group.get_address_bus_name()}_reg];\n"
+            f"        {rw_port_group.get_data_output_bus_name()} <= {read_expr};\n"
         )
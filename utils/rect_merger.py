@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+
+class RectMerger:
+    """
+    Merges a list of rectangles (each is a list of four numbers: llx lly urx
+    ury) into a set of non-overlapping rectangles that cover the same area
+
+    Uses a sweep line over x. Between two consecutive x coordinates, the y
+    intervals of the rectangles that span the slab are merged (overlapping
+    or abutting intervals become one). An output rectangle stays open for as
+    long as its y interval appears in consecutive slabs, so abutting and
+    overlapping rectangles with the same y extents collapse into one.
+    Rectangles with no area are dropped.
+    """
+
+    @staticmethod
+    def merge_intervals(intervals):
+        """
+        Merges the overlapping or abutting (lo, hi) intervals and returns
+        them sorted
+        """
+
+        merged = []
+        for lo, hi in sorted(intervals):
+            if merged and lo <= merged[-1][1]:
+                if hi > merged[-1][1]:
+                    merged[-1][1] = hi
+            else:
+                merged.append([lo, hi])
+        return [(lo, hi) for lo, hi in merged]
+
+    @staticmethod
+    def merge(rects):
+        """Returns the merged rectangles sorted by llx, lly"""
+
+        rects = sorted(
+            (rect for rect in rects if rect[2] > rect[0] and rect[3] > rect[1]),
+            key=lambda rect: rect[0],
+        )
+        x_coords = sorted({x for rect in rects for x in (rect[0], rect[2])})
+        merged = []
+        # (lly, ury) -> llx of the output rectangles that are still open
+        open_rects = {}
+        active = []
+        next_rect = 0
+        for index, x_lo in enumerate(x_coords[:-1]):
+            active = [rect for rect in active if rect[2] > x_lo]
+            while next_rect < len(rects) and rects[next_rect][0] <= x_lo:
+                active.append(rects[next_rect])
+                next_rect += 1
+            intervals = RectMerger.merge_intervals(
+                (rect[1], rect[3]) for rect in active
+            )
+            current = set(intervals)
+            for interval in list(open_rects):
+                if interval not in current:
+                    start = open_rects.pop(interval)
+                    merged.append([start, interval[0], x_lo, interval[1]])
+            for interval in intervals:
+                if interval not in open_rects:
+                    open_rects[interval] = x_lo
+        for interval, start in open_rects.items():
+            merged.append([start, interval[0], x_coords[-1], interval[1]])
+        merged.sort(key=lambda rect: (rect[0], rect[1]))
+        return merged
@@ -20,19 +20,13 @@ class RegFile(Memory):
 
         Memory.__init__(self, mem_config, process_data, timing_data)
 
-    def write_verilog_file(self, out_file_name, is_blackbox=False):
+    def create_verilog_exporter(self, sparse=False):
         """
-        Writes the verilog content to a file
-
-        If is_blackbox, then write the port declarations only. Otherwise, write
-        the full RTL
+        Returns a Verilog exporter for the memory (of the sparse model if
+        sparse is set)
         """
+        return RegFileVerilogExporter(self, sparse)
 
-        exporter = RegFileVerilogExporter(self)
-        exporter.export_file(out_file_name, is_blackbox)
-
-    def write_liberty_file(self, out_file_name):
-        """Writes the Liberty content to a file"""
-
-        exporter = RegFileLibertyExporter(self)
-        exporter.export_file(out_file_name)
+    def create_liberty_exporter(self, corner=None):
+        """Returns a Liberty exporter for the memory (and corner if given)"""
+        return RegFileLibertyExporter(self, corner)
@@ -6,9 +6,9 @@ from liberty_exporter import LibertyExporter
 class RegFileLibertyExporter(LibertyExporter):
     """Reg file Liberty Exporter"""
 
-    def __init__(self, memory):
+    def __init__(self, memory, corner=None):
         """Initializer"""
-        LibertyExporter.__init__(self, memory)
+        LibertyExporter.__init__(self, memory, corner)
 
     def write_cell(self, out_fh):
         """
@@ -6,9 +6,9 @@ from verilog_exporter import VerilogExporter
 class RegFileVerilogExporter(VerilogExporter):
     """Reg file verilog exporter"""
 
-    def __init__(self, memory):
+    def __init__(self, memory, sparse=False):
         """Initializer"""
-        VerilogExporter.__init__(self, memory)
+        VerilogExporter.__init__(self, memory, sparse)
 
     def export_module(self, out_fh):
         """Exports the verilog module to the output stream"""
@@ -17,20 +17,51 @@ class RegFileVerilogExporter(VerilogExporter):
         self.write_always(out_fh)
         out_fh.write("endmodule\n")
 
+    def _has_multiple_write_clocks(self):
+        """
+        Returns True if the array is written from more than one clocked
+        process, which always_ff doesn't allow
+        """
+        return len(self.get_memory().get_rw_port_groups()) > 1
+
+    def get_always_keyword(self):
+        """Returns the keyword used for the clocked processes"""
+
+        if self._has_multiple_write_clocks():
+            return "always"
+        return VerilogExporter.get_always_keyword(self)
+
+    def write_memory_array(self, out_fh):
+        """
+        Writes the memory array declaration. Verilator reports MULTIDRIVEN on
+        the declaration, so the warning is only turned off around it
+        """
+
+        multidriven = self.is_fast_sim() and self._has_multiple_write_clocks()
+        if multidriven:
+            out_fh.write("    // Each port writes the array from its own clock domain\n")
+            out_fh.write("    // verilator lint_off MULTIDRIVEN\n")
+        VerilogExporter.write_memory_array(self, out_fh)
+        if multidriven:
+            out_fh.write("    // verilator lint_on MULTIDRIVEN\n")
+
     def write_rw_port_always(self, rw_port_group, out_fh):
         """Writes the always @ section for the port group"""
 
         suffix = rw_port_group.get_suffix()
         clk_pin_name = rw_port_group.get_clock_name()
         out_fh.write(f"    // Synchronous Port {suffix.upper()}\n")
-        out_fh.write(f"     always @(posedge {clk_pin_name}) begin\n")
+        out_fh.write(f"     {self.get_always_keyword()} @(posedge {clk_pin_name}) begin\n")
         out_fh.write(f"        if ({rw_port_group.get_write_enable_name()}) begin\n")
-        out_fh.write(
-            f"            mem[{rw_port_group.get_address_bus_name()}] <= {rw_port_group.get_data_input_bus_name()};\n"
+        write_stmt = self.get_memory_write(
+            rw_port_group.get_address_bus_name(),
+            rw_port_group.get_data_input_bus_name(),
         )
+        out_fh.write(f"            {write_stmt}\n")
         out_fh.write("        end\n")
+        read_expr = self.get_memory_read(rw_port_group.get_address_bus_name())
         out_fh.write(
-            f"        {rw_port_group.get_data_output_bus_name()} <= mem[{rw_port_group.get_address_bus_name()}];  // Read occurs after write (read-after-write OK)\n"
+            f"        {rw_port_group.get_data_output_bus_name()} <= {read_expr};  // Read occurs after write (read-after-write OK)\n"
         )
         out_fh.write("    end\n")
         out_fh.write("\n")
@@ -2,27 +2,76 @@
 
 import os
 import json
-from pathlib import Path
+import time
+from profiler import Profiler
+from hashing_writer import HashingWriter
+from sram_stream import SramStream
 
 
 class RunUtils:
     @staticmethod
     def get_config(config_file):
-        """Load the JSON configuration file"""
+        """
+        Load the JSON configuration file
+
+        If the config has a "srams_file" (a JSON Lines file, relative to the
+        config) instead of a "srams" list, "srams" is set to a SramStream that
+        reads the entries lazily
+        """
 
         with open(config_file, "r") as fid:
             raw = [line.strip() for line in fid if not line.strip().startswith("#")]
         json_data = json.loads("\n".join(raw))
+        srams_file = json_data.get("srams_file")
+        if srams_file:
+            if "srams" in json_data:
+                raise Exception(
+                    f"{config_file} has both srams and srams_file ({srams_file})"
+                )
+            srams_file = os.path.join(
+                os.path.dirname(os.path.abspath(config_file)),
+                os.path.expanduser(srams_file),
+            )
+            json_data["srams"] = SramStream(srams_file)
         return json_data
 
+    @staticmethod
+    def get_config_files(config_file, json_data):
+        """
+        Returns the config file and its srams_file, if it has one (see
+        get_config)
+        """
+
+        config_files = [config_file]
+        if isinstance(json_data.get("srams"), SramStream):
+            config_files.append(json_data["srams"].get_file_name())
+        return config_files
+
+    @staticmethod
+    def get_config_hash(file_names):
+        """
+        Returns the SHA-256 hex digest of the contents of the files that
+        configure a run, which the manifest records so that the partial
+        manifests of different configs aren't merged (see Manifest.merge)
+        """
+
+        import hashlib
+
+        sha256 = hashlib.sha256()
+        for file_name in file_names:
+            with open(file_name, "rb") as in_fh:
+                sha256.update(in_fh.read())
+        return sha256.hexdigest()
+
     @staticmethod
     def ensure_results_dir(output_dir, memory_name):
         """Ensures that the results directory exists"""
 
-        p = str(Path(output_dir).expanduser().resolve(strict=False))
+        p = os.path.realpath(os.path.expanduser(output_dir))
         results_dir = os.sep.join([p, memory_name])
         if not os.path.exists(results_dir):
-            os.makedirs(results_dir)
+            # Can be called by several writer threads (see WritePipeline)
+            os.makedirs(results_dir, exist_ok=True)
         return results_dir
 
     @staticmethod
@@ -40,27 +89,251 @@ class RunUtils:
         return (lib_file_name, lef_file_name, verilog_file_name, sv_blackbox_file_name)
 
     @staticmethod
-    def write_memory(memory, output_dir):
-        """Generates the output file names and then writes the files"""
+    def get_corner_lib_file_name(lib_file_name, corner):
+        """Returns the Liberty file name for the corner: <name>_<corner>.lib"""
+
+        (base_name, ext) = os.path.splitext(lib_file_name)
+        return f"{base_name}_{corner.get_name()}{ext}"
+
+    @staticmethod
+    def get_sparse_model_file_name(verilog_file_name):
+        """
+        Returns the sparse SystemVerilog model file name (see
+        VerilogOptions): <name>_sparse.sv
+        """
+
+        (base_name, _) = os.path.splitext(verilog_file_name)
+        return base_name + "_sparse.sv"
+
+    @staticmethod
+    def write_memory(memory, output_dir, manifest=None, index=0):
+        """
+        Generates the output file names, writes the files and returns a
+        record of each file written (see write_all). If a manifest is given,
+        the memory (at the index in the macro list) and its files are added
+        to it
+        """
 
         (lib_file_name, lef_file_name, verilog_file_name, sv_blackbox_file_name) = (
             RunUtils.get_output_file_names(memory.get_name(), output_dir)
         )
-        RunUtils.write_all(
+        file_records = RunUtils.write_all(
             memory,
             lib_file_name,
             lef_file_name,
             verilog_file_name,
             sv_blackbox_file_name,
         )
+        if manifest is not None:
+            manifest.add_memory(memory, index, file_records)
+        return file_records
+
+    @staticmethod
+    def write_file(memory, view, file_name, write_fn):
+        """
+        Calls write_fn, which writes the view of the memory to the file and
+        returns its size and SHA-256, and returns the record of the file:
+        view, path, size, sha256 and the time it took in seconds
+        """
+
+        start = time.perf_counter()
+        with Profiler.active_stage(memory.get_name(), view, file_name):
+            (num_bytes, sha256) = write_fn()
+        return {
+            "view": view,
+            "path": file_name,
+            "size": num_bytes,
+            "sha256": sha256,
+            "time_s": round(time.perf_counter() - start, 6),
+        }
 
     @staticmethod
     def write_all(
         memory, lib_file_name, lef_file_name, verilog_file_name, sv_blackbox_file_name
     ):
-        """Writes the files"""
+        """
+        Writes the files and returns the record of each (see write_file).
+        Each corner of the process gets an additional Liberty file, all of
+        which share the same memory
+        """
+
+        file_records = [
+            RunUtils.write_file(
+                memory,
+                "liberty",
+                lib_file_name,
+                lambda: memory.write_liberty_file(lib_file_name),
+            )
+        ]
+        for corner in memory.get_process_data().get_corners():
+            corner_lib_file_name = RunUtils.get_corner_lib_file_name(
+                lib_file_name, corner
+            )
+            file_records.append(
+                RunUtils.write_file(
+                    memory,
+                    f"liberty_{corner.get_name()}",
+                    corner_lib_file_name,
+                    lambda: memory.write_liberty_file(corner_lib_file_name, corner),
+                )
+            )
+        file_records.append(
+            RunUtils.write_file(
+                memory,
+                "lef",
+                lef_file_name,
+                lambda: memory.write_lef_file(lef_file_name),
+            )
+        )
+        file_records.append(
+            RunUtils.write_file(
+                memory,
+                "verilog",
+                verilog_file_name,
+                lambda: memory.write_verilog_file(verilog_file_name),
+            )
+        )
+        file_records.append(
+            RunUtils.write_file(
+                memory,
+                "sv_blackbox",
+                sv_blackbox_file_name,
+                lambda: memory.write_verilog_file(sv_blackbox_file_name, True),
+            )
+        )
+        if memory.has_sparse_model():
+            sparse_file_name = RunUtils.get_sparse_model_file_name(verilog_file_name)
+            file_records.append(
+                RunUtils.write_file(
+                    memory,
+                    "sparse_model",
+                    sparse_file_name,
+                    lambda: memory.write_sparse_model_file(sparse_file_name),
+                )
+            )
+        Profiler.record_memory(memory)
+        return file_records
+
+    @staticmethod
+    def render_views(memory):
+        """
+        Returns a list with the view, base name and contents of each file
+        that write_all writes, without writing anything
+        """
+
+        name = memory.get_name()
+        lib_file_name = name + ".lib"
+        views = [
+            ("liberty", lib_file_name, memory.create_liberty_exporter().export_string())
+        ]
+        for corner in memory.get_process_data().get_corners():
+            corner_lib_file_name = RunUtils.get_corner_lib_file_name(
+                lib_file_name, corner
+            )
+            exporter = memory.create_liberty_exporter(corner)
+            views.append(
+                (
+                    f"liberty_{corner.get_name()}",
+                    corner_lib_file_name,
+                    exporter.export_string(),
+                )
+            )
+        views.append(
+            ("lef", name + ".lef", memory.create_lef_exporter().export_string())
+        )
+        # The verilog comes from the memory, which can override it (e.g.
+        # SinglePortSSRAM only writes the blackbox)
+        views.append(("verilog", name + ".v", memory.render_verilog()))
+        views.append(("sv_blackbox", name + ".sv", memory.render_verilog(True)))
+        if memory.has_sparse_model():
+            views.append(
+                (
+                    "sparse_model",
+                    RunUtils.get_sparse_model_file_name(name + ".v"),
+                    memory.render_sparse_model(),
+                )
+            )
+        return views
+
+    @staticmethod
+    def get_contents(memory):
+        """
+        Returns a dictionary of file name -> contents with the files that
+        write_all writes, without writing anything
+        """
+
+        return {
+            base_name: contents
+            for _, base_name, contents in RunUtils.render_views(memory)
+        }
+
+    @staticmethod
+    def write_views(name, views, placeholder, output_dir, links=None):
+        """
+        Writes the views rendered by render_views for a memory named
+        placeholder as the files of the named memory, and returns the record
+        of each file (see write_file)
+
+        The placeholder is replaced by the name in the base names and
+        contents. A view that doesn't contain the placeholder is the same for
+        every name, so it's hardlinked to the file of the first name (links
+        maps the view to the record of that file and is filled in by the
+        first call). Nothing is hardlinked if links is None. If the memory was
+        rendered under its own name, the contents are written as they are
+        """
+
+        results_dir = RunUtils.ensure_results_dir(output_dir, name)
+        file_records = []
+        for view, base_name, contents in views:
+            start = time.perf_counter()
+            file_name = os.path.join(results_dir, base_name.replace(placeholder, name))
+            is_common = links is not None and placeholder not in contents
+            with Profiler.active_stage(name, view, file_name):
+                if is_common and view in links:
+                    link_record = links[view]
+                    if os.path.lexists(file_name):
+                        os.remove(file_name)
+                    try:
+                        os.link(link_record["path"], file_name)
+                    except OSError:
+                        # e.g. across file systems (rare, so shutil is only
+                        # imported here)
+                        import shutil
+
+                        shutil.copyfile(link_record["path"], file_name)
+                    (num_bytes, sha256) = (link_record["size"], link_record["sha256"])
+                else:
+                    if placeholder != name:
+                        contents = contents.replace(placeholder, name)
+                    with HashingWriter(file_name) as out_fh:
+                        out_fh.write(contents)
+                    (num_bytes, sha256) = (out_fh.get_num_bytes(), out_fh.get_sha256())
+            file_record = {
+                "view": view,
+                "path": file_name,
+                "size": num_bytes,
+                "sha256": sha256,
+                "time_s": round(time.perf_counter() - start, 6),
+            }
+            if is_common:
+                links.setdefault(view, file_record)
+            file_records.append(file_record)
+        return file_records
+
+    @staticmethod
+    def check_geometry(memory):
+        """
+        Checks the pin, power/ground and obstruction shapes of the memory,
+        prints any violations and returns the number of violations
+        """
+
+        # The checker is only needed with --check_geometry
+        from geometry_checker import GeometryChecker
 
-        memory.write_liberty_file(lib_file_name)
-        memory.write_lef_file(lef_file_name)
-        memory.write_verilog_file(verilog_file_name)
-        memory.write_verilog_file(sv_blackbox_file_name, True)
+        with Profiler.active_stage(memory.get_name(), "check_geometry"):
+            violations = GeometryChecker(memory).check()
+        for violation in violations:
+            print(
+                f"{memory.get_name()}: {GeometryChecker.format_violation(violation)}"
+            )
+        return len(violations)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import heapq
+
+
+class ShardPlanner:
+    """
+    Splits a list of macros into shards of roughly equal cost, so that a
+    config can be spread across the nodes of a batch farm with --shard i/N
+
+    The shards are filled with the longest processing time first heuristic:
+    the macros are visited from the most to the least expensive and each one
+    goes to the shard with the lowest total cost so far. Ties are broken on
+    the macro and shard index, so every node computes the same assignment
+    from the same config.
+    """
+
+    def __init__(self, shard_index, num_shards):
+        """Initializer (the shard index is 0-based)"""
+
+        if num_shards < 1:
+            raise Exception(f"Invalid number of shards: {num_shards}")
+        if shard_index < 0 or shard_index >= num_shards:
+            raise Exception(
+                f"Invalid shard index {shard_index} (expected 0 to {num_shards - 1})"
+            )
+        self._shard_index = shard_index
+        self._num_shards = num_shards
+
+    @staticmethod
+    def from_string(shard):
+        """Returns the planner for an "i/N" string"""
+
+        (index, sep, count) = shard.partition("/")
+        try:
+            return ShardPlanner(int(index), int(count))
+        except ValueError:
+            raise Exception(f"Invalid shard {shard} (expected i/N)")
+
+    def get_shard_index(self):
+        """Returns the 0-based shard index"""
+        return self._shard_index
+
+    def get_num_shards(self):
+        """Returns the number of shards"""
+        return self._num_shards
+
+    def get_name(self):
+        """Returns the shard in the i/N form"""
+        return f"{self._shard_index}/{self._num_shards}"
+
+    @staticmethod
+    def assign(costs, num_shards):
+        """Returns the shard index of each cost"""
+
+        assignment = [0] * len(costs)
+        # (total cost, shard index) of each shard
+        loads = [(0, shard) for shard in range(num_shards)]
+        order = sorted(range(len(costs)), key=lambda index: (-costs[index], index))
+        for index in order:
+            (load, shard) = heapq.heappop(loads)
+            assignment[index] = shard
+            heapq.heappush(loads, (load + costs[index], shard))
+        return assignment
+
+    def select(self, costs):
+        """Returns the indices (in order) of the macros in this shard"""
+
+        assignment = self.assign(costs, self._num_shards)
+        return [
+            index
+            for index, shard in enumerate(assignment)
+            if shard == self._shard_index
+        ]
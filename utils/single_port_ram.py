@@ -45,25 +45,22 @@ class SinglePortRAM(RAM):
         self.add_misc_port("ce_in")
         self.create_ports()
 
-    def get_num_pins(self):
-        """Returns the total number of logical pins"""
+    @staticmethod
+    def count_pins(width, depth):
+        """Returns the total number of logical pins for the width and depth"""
         # rd_out (#bits) + wd_in (#bits) + addr_in (#addr_width) + we_in/ce_in/clk
-        return (2 * self.get_width()) + self.get_addr_width() + 3
+        return (2 * width) + Memory.calc_addr_width(depth) + 3
 
-    def write_verilog_file(self, out_file_name, is_blackbox=False):
+    def create_verilog_exporter(self, sparse=False):
         """
-        Writes a verilog file
-
-        If is_blackbox is set, it writes just the port declarations and a
-        blackbox pragma. Otherwise, it writes the full RTL.
+        Returns the single port RAM Verilog exporter (of the sparse model if
+        sparse is set)
         """
-        exporter = SinglePortRAMVerilogExporter(self)
-        exporter.export_file(out_file_name, is_blackbox)
+        return SinglePortRAMVerilogExporter(self, sparse)
 
-    def write_liberty_file(self, out_file_name):
-        """Writes a Liberty file"""
-        exporter = SinglePortRAMLibertyExporter(self)
-        exporter.export_file(out_file_name)
+    def create_liberty_exporter(self, corner=None):
+        """Returns the single port RAM Liberty exporter (for the corner if given)"""
+        return SinglePortRAMLibertyExporter(self, corner)
 
 
 if __name__ == "__main__":  # pragma: nocover
@@ -9,15 +9,15 @@ class SinglePortRAMLibertyExporter(RAMLibertyExporter):
     pin differences, which were kept for backward compatibility
     """
 
-    def __init__(self, memory):
+    def __init__(self, memory, corner=None):
         """Initializer"""
-        RAMLibertyExporter.__init__(self, memory)
+        RAMLibertyExporter.__init__(self, memory, corner)
 
     def write_cell(self, out_fh):
         """Writes the Liberty cell"""
 
         name = self._memory.get_name()
-        timing_data = self._memory.get_timing_data()
+        timing_data = self.get_timing_data()
         rw_port_group = self._memory.get_rw_port_groups()[0]
         clk_pin_name = rw_port_group.get_clock_name()
         addr_bus_name = rw_port_group.get_address_bus_name()
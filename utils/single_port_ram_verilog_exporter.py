@@ -9,9 +9,9 @@ class SinglePortRAMVerilogExporter(VerilogExporter):
     compatibility
     """
 
-    def __init__(self, memory):
+    def __init__(self, memory, sparse=False):
         """Initializer"""
-        VerilogExporter.__init__(self, memory)
+        VerilogExporter.__init__(self, memory, sparse)
 
     def _get_names(self):
         mem = self.get_memory()
@@ -31,10 +31,11 @@ class SinglePortRAMVerilogExporter(VerilogExporter):
         (addr_bus, din_bus, dout_bus, we_pin, clk_pin, ce_pin) = self._get_names()
         out_fh.write(f"module {mem.get_name()}\n")
         self.write_module_ports(out_fh)
-        out_fh.write("   reg    [BITS-1:0]        mem [0:WORD_DEPTH-1];\n")
-        out_fh.write("\n")
-        out_fh.write("   integer j;\n")
-        out_fh.write("\n")
+        self.write_memory_array(out_fh)
+        if self.is_fast_sim():
+            self.write_fast_sim_always(out_fh)
+            out_fh.write("endmodule\n")
+            return
         out_fh.write(f"   always @(posedge {clk_pin})\n")
         out_fh.write("   begin\n")
         out_fh.write(f"      if ({ce_pin})\n")
@@ -46,11 +47,7 @@ class SinglePortRAMVerilogExporter(VerilogExporter):
         out_fh.write(f"             ((^{we_pin} === 1'bx) || (^{addr_bus} === 1'bx))\n")
         out_fh.write("            )\n")
         out_fh.write("         begin\n")
-        out_fh.write(
-            "            // WEN or ADDR is unknown, so corrupt entire array (using unsynthesizeable for loop)\n"
-        )
-        out_fh.write("            for (j = 0; j < WORD_DEPTH; j = j + 1)\n")
-        out_fh.write("               mem[j] <= 'x;\n")
+        self.write_corrupt_memory(out_fh)
         out_fh.write(
             f'            $display("warning: {ce_pin}=1, {we_pin} is %b, {addr_bus} = %x in '
             + mem.get_name()
@@ -59,12 +56,10 @@ class SinglePortRAMVerilogExporter(VerilogExporter):
         out_fh.write("         end\n")
         out_fh.write(f"         else if ({we_pin})\n")
         out_fh.write("         begin\n")
-        out_fh.write(
-            f"            mem[{addr_bus}] <= {din_bus};\n"
-        )
+        self.write_memory_write(out_fh)
         out_fh.write("         end\n")
         out_fh.write("         // read\n")
-        out_fh.write(f"         {dout_bus} <= mem[{addr_bus}];\n")
+        self.write_memory_read(out_fh)
         out_fh.write("      end\n")
         out_fh.write("      else\n")
         out_fh.write("      begin\n")
@@ -76,6 +71,117 @@ class SinglePortRAMVerilogExporter(VerilogExporter):
         self.write_timing_check(out_fh)
         out_fh.write("endmodule\n")
 
+    def write_fast_sim_always(self, out_fh):
+        """
+        Writes the clocked process of the fast-sim model. The output holds its
+        value while the chip enable is low instead of going to X
+        """
+
+        (addr_bus, din_bus, dout_bus, we_pin, clk_pin, ce_pin) = self._get_names()
+        out_fh.write(f"   always_ff @(posedge {clk_pin})\n")
+        out_fh.write("   begin\n")
+        out_fh.write(f"      if ({ce_pin})\n")
+        out_fh.write("      begin\n")
+        out_fh.write(f"         if ({we_pin})\n")
+        out_fh.write(f"            mem[{addr_bus}] <= {din_bus};\n")
+        out_fh.write(f"         {dout_bus} <= mem[{addr_bus}];\n")
+        out_fh.write("      end\n")
+        out_fh.write("   end\n")
+        out_fh.write("\n")
+
+    def _is_generation_style(self):
+        """
+        Returns True if the array is corrupted with a generation counter. The
+        sparse model doesn't need it since deleting the associative array is
+        already O(1)
+        """
+
+        verilog_options = self.get_memory().get_verilog_options()
+        return (
+            verilog_options.get_x_corruption_style() == "generation"
+            and not self.use_sparse_model()
+            and not self.is_fast_sim()
+        )
+
+    def write_memory_array(self, out_fh):
+        """Writes the memory array declaration"""
+
+        if self.use_sparse_model():
+            out_fh.write(
+                "   // Sparse (SystemVerilog associative) array: only written words are allocated\n"
+            )
+            out_fh.write("   reg    [BITS-1:0]        mem [int];\n")
+            out_fh.write("\n")
+            return
+        out_fh.write("   reg    [BITS-1:0]        mem [0:WORD_DEPTH-1];\n")
+        out_fh.write("\n")
+        if self.is_fast_sim():
+            return
+        if self._is_generation_style():
+            out_fh.write(
+                "   // Generation of the last write to each word. An unknown WEN or ADDR\n"
+            )
+            out_fh.write(
+                "   // advances cur_gen, so words written before it read back as X\n"
+            )
+            out_fh.write("   reg    [31:0]            mem_gen [0:WORD_DEPTH-1];\n")
+            out_fh.write("   reg    [31:0]            cur_gen;\n")
+            out_fh.write("   integer g;\n")
+            out_fh.write("\n")
+            out_fh.write(
+                "   // Every word starts in the first generation, so words preloaded\n"
+            )
+            out_fh.write(
+                "   // without a write (e.g. with $readmemh) read back like the loop style\n"
+            )
+            out_fh.write("   initial begin\n")
+            out_fh.write("      cur_gen = 0;\n")
+            out_fh.write("      for (g = 0; g < WORD_DEPTH; g = g + 1)\n")
+            out_fh.write("         mem_gen[g] = 0;\n")
+            out_fh.write("   end\n")
+        else:
+            out_fh.write("   integer j;\n")
+        out_fh.write("\n")
+
+    def write_corrupt_memory(self, out_fh):
+        """Writes the statements that corrupt the entire array"""
+
+        if self.use_sparse_model():
+            out_fh.write(
+                "            // WEN or ADDR is unknown, so corrupt entire array (by deleting all words)\n"
+            )
+            out_fh.write("            mem.delete();\n")
+        elif self._is_generation_style():
+            out_fh.write(
+                "            // WEN or ADDR is unknown, so corrupt entire array (by starting a new generation)\n"
+            )
+            out_fh.write("            cur_gen <= cur_gen + 1;\n")
+        else:
+            out_fh.write(
+                "            // WEN or ADDR is unknown, so corrupt entire array (using unsynthesizeable for loop)\n"
+            )
+            out_fh.write("            for (j = 0; j < WORD_DEPTH; j = j + 1)\n")
+            out_fh.write("               mem[j] <= 'x;\n")
+
+    def write_memory_write(self, out_fh):
+        """Writes the statements that write a word"""
+
+        (addr_bus, din_bus, dout_bus, we_pin, clk_pin, ce_pin) = self._get_names()
+        out_fh.write(f"            {self.get_memory_write(addr_bus, din_bus)}\n")
+        if self._is_generation_style():
+            out_fh.write(f"            mem_gen[{addr_bus}] <= cur_gen;\n")
+
+    def write_memory_read(self, out_fh):
+        """Writes the statement that reads a word"""
+
+        (addr_bus, din_bus, dout_bus, we_pin, clk_pin, ce_pin) = self._get_names()
+        if self._is_generation_style():
+            out_fh.write(
+                f"         {dout_bus} <= (mem_gen[{addr_bus}] === cur_gen) ? mem[{addr_bus}] : 'x;\n"
+            )
+        else:
+            out_fh.write(f"         {dout_bus} <= {self.get_memory_read(addr_bus)};\n")
+
     def write_module_ports(self, out_fh):
         """Writes the module port declarations"""
 
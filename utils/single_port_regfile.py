@@ -31,10 +31,11 @@ class SinglePortRegFile(RegFile):
         self.add_rw_port_group(RWPortGroup("a"))
         self.create_ports()
 
-    def get_num_pins(self):
-        """Returns the total number of logical pins"""
+    @staticmethod
+    def count_pins(width, depth):
+        """Returns the total number of logical pins for the width and depth"""
         # din (#bits) + dout (#bits) + addr (#addr_width) + we/clk
-        return (2 * self.get_width()) + self.get_addr_width() + 2
+        return (2 * width) + Memory.calc_addr_width(depth) + 2
 
 
 if __name__ == "__main__":  # pragma: nocover
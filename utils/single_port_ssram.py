@@ -15,8 +15,8 @@ class SinglePortSSRAM(RAM):
         # num pins has to be set prior to the super init since the super init
         # calls get_num_pins
         self._num_pins = num_pins
-        process_data.set_calc_dimensions(False)
-        RAM.__init__(self, mem_config, process_data, timing_data)
+        # The dimensions come from the physical data file
+        RAM.__init__(self, mem_config, process_data, timing_data, False)
 
     def get_num_pins(self):
         return self._num_pins
@@ -32,4 +32,17 @@ class SinglePortSSRAM(RAM):
         if not is_blackbox:
             print("Warning: non-blackbox verilog not supported for spreadsheet input")
             is_blackbox = True
-        RAM.write_verilog_file(self, out_file_name, True)
+        return RAM.write_verilog_file(self, out_file_name, True)
+
+    def render_verilog(self, is_blackbox=False):
+        """
+        Returns the verilog content as a string, which is always the
+        blackbox (see write_verilog_file)
+        """
+        if not is_blackbox:
+            print("Warning: non-blackbox verilog not supported for spreadsheet input")
+        return RAM.render_verilog(self, True)
+
+    def has_sparse_model(self):
+        """Returns False since only the blackbox verilog is written"""
+        return False
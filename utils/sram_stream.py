@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+import json
+
+
+class SramStream:
+    """
+    Lazily read srams[] entries from a JSON Lines file, one JSON object per
+    line, for configs with too many macros to load at once
+
+    A config points to the file with "srams_file" instead of listing the
+    entries in "srams" (see RunUtils.get_config). Blank lines and lines that
+    start with # are skipped. The file is read again each time the stream is
+    iterated, so the entries can be visited by several passes (validation,
+    shard costs, generation) while only one entry is held at a time.
+    """
+
+    def __init__(self, file_name):
+        """Initializer"""
+        self._file_name = file_name
+
+    def get_file_name(self):
+        """Returns the JSON Lines file name"""
+        return self._file_name
+
+    def __iter__(self):
+        """Yields each srams[] entry"""
+
+        with open(self._file_name, "r") as in_fh:
+            for line_number, line in enumerate(in_fh, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as ex:
+                    raise Exception(
+                        f"{self._file_name}:{line_number}: invalid JSON: {ex}"
+                    )
+
+    def __repr__(self):
+        return f"SramStream({self._file_name!r})"
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+import itertools
+
+
+class SramSweep:
+    """
+    Re-iterable view of srams[] entries (a list or a SramStream) in which
+    sweep entries are expanded into one entry per combination of values
+
+    A value of a sweep entry (any key but the name) can be a list of values
+    or a range:
+
+        {"range": [start, stop]}                    - start, start + 1 ... stop
+        {"range": [start, stop], "step": n}         - start, start + n ... stop
+        {"range": [start, stop], "scale": "pow2"}   - start, 2 x start ... stop
+
+    The combinations are generated in the order of the keys, with the last
+    key changing fastest, and the name is a str.format template of the
+    values, for example:
+
+        {"name": "fakeram_{depth}x{width}", "width": [8, 16, 32, 64],
+         "depth": {"range": [64, 4096], "scale": "pow2"}, "banks": [1, 2]}
+
+    The entries are expanded as they're iterated, so a compact spec can
+    describe thousands of macros without building the full list.
+    """
+
+    scales = ("linear", "pow2")
+
+    def __init__(self, srams):
+        """Initializer"""
+        self._srams = srams
+
+    def get_srams(self):
+        """Returns the srams[] entries before expansion"""
+        return self._srams
+
+    def __iter__(self):
+        """Yields the srams[] entries with the sweeps expanded"""
+
+        for sram_data in self._srams:
+            if self.is_sweep(sram_data):
+                yield from self.expand(sram_data)
+            else:
+                yield sram_data
+
+    @staticmethod
+    def is_range(value):
+        """Returns True if the value is a range"""
+        return isinstance(value, dict) and "range" in value
+
+    @staticmethod
+    def is_sweep(sram_data):
+        """Returns True if a value of the srams[] entry is a list or a range"""
+
+        return isinstance(sram_data, dict) and any(
+            isinstance(value, list) or SramSweep.is_range(value)
+            for key, value in sram_data.items()
+            if key != "name"
+        )
+
+    @staticmethod
+    def get_range_values(name, key, value):
+        """Returns the values of a range"""
+
+        try:
+            (start, stop) = value["range"]
+        except (TypeError, ValueError):
+            raise Exception(f"Invalid {key} range of {name}: expected [start, stop]")
+        scale = value.get("scale", "linear")
+        if scale not in SramSweep.scales:
+            raise Exception(
+                "Invalid {} scale of {}: {} (expected one of {})".format(
+                    key, name, scale, ", ".join(SramSweep.scales)
+                )
+            )
+        values = []
+        if scale == "pow2":
+            if start <= 0:
+                raise Exception(f"Invalid {key} range of {name}: pow2 from {start}")
+            while start <= stop:
+                values.append(start)
+                start *= 2
+        else:
+            step = value.get("step", 1)
+            if step <= 0:
+                raise Exception(f"Invalid {key} step of {name}: {step}")
+            while start <= stop:
+                values.append(start)
+                start += step
+        if not values:
+            raise Exception(f"Empty {key} range of {name}: {value['range']}")
+        return values
+
+    @staticmethod
+    def expand(sram_data):
+        """Yields the srams[] entries of a sweep entry"""
+
+        name = str(sram_data.get("name"))
+        keys = []
+        value_lists = []
+        for key, value in sram_data.items():
+            if key == "name":
+                continue
+            if SramSweep.is_range(value):
+                value = SramSweep.get_range_values(name, key, value)
+            elif not isinstance(value, list):
+                value = [value]
+            elif not value:
+                raise Exception(f"Empty {key} list of {name}")
+            keys.append(key)
+            value_lists.append(value)
+        for values in itertools.product(*value_lists):
+            entry = dict(zip(keys, values))
+            try:
+                entry_name = name.format_map(entry)
+            except (KeyError, IndexError, ValueError) as ex:
+                raise Exception(f"Invalid name template {name}: {ex!r}")
+            yield {"name": entry_name, **entry}
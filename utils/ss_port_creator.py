@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 from port import Port
+from ss_port_organizer import SSPortOrganizer
 
 
 class SSPortCreator:
@@ -13,8 +14,11 @@ class SSPortCreator:
         self._mem = mem
         self._pin_type_map = pin_type_map
 
-    def get_direction(self, pin_name):
-        base_name = pin_name.split("[")[0]
+    def get_direction(self, base_name):
+        """
+        Returns the (pin type, direction) pair for the pin with the given base
+        name (i.e. the bus name for bus pins)
+        """
         if base_name in self._pin_type_map:
             pin_type = self._pin_type_map[base_name]
             if pin_type in ["power", "ground"]:
@@ -34,7 +38,8 @@ class SSPortCreator:
                     port.add_rect(rect)
             else:
                 port.add_rect(rect_data)
-            (pin_type, direction) = self.get_direction(pin_name)
+            (base_name, _) = SSPortOrganizer.get_parsed_name(pin_data)
+            (pin_type, direction) = self.get_direction(base_name)
             port.set_direction(direction)
             if pin_type in ["power", "ground"]:
                 self._mem.add_pg_port(port)
@@ -2,16 +2,18 @@
 
 import re
 import sys
+from pin_type_classifier import PinTypeClassifier
 
 
 class SSPortOrganizer:
+    _bus_name_re = re.compile(r"^(\S+)\[(\d+)\]")
+
     def __init__(self, pin_type_map):
         self._rw_groups = {}
         self._misc_busses = []
         self._misc_ports = []
         self._port_dict = {}
-        self._bus_name_re = re.compile(r"^(\S+)\[(\d+)\]")
-        self._pin_type_map = pin_type_map
+        self._classifier = PinTypeClassifier(pin_type_map)
 
     def get_rw_groups(self):
         return self._rw_groups
@@ -22,25 +24,46 @@ class SSPortOrganizer:
     def get_misc_ports(self):
         return self._misc_ports
 
+    @staticmethod
+    def parse_pin_name(pin_name):
+        """
+        Splits a pin name into a (base name, bit index) pair. The bit index is
+        None for scalar pins (e.g. "addr[3]" -> ("addr", 3), "clk" -> ("clk",
+        None))
+        """
+
+        result = SSPortOrganizer._bus_name_re.match(pin_name)
+        if result:
+            return (result.group(1), int(result.group(2)))
+        return (pin_name, None)
+
+    @staticmethod
+    def get_parsed_name(pin_data):
+        """
+        Returns the (base name, bit index) pair stored on the pin record,
+        parsing the pin name if the record doesn't have it yet
+        """
+
+        if "base_name" not in pin_data:
+            (pin_data["base_name"], pin_data["bit"]) = SSPortOrganizer.parse_pin_name(
+                pin_data["name"]
+            )
+        return (pin_data["base_name"], pin_data["bit"])
+
     def _consolidate_ports(self, macro_data):
+        # bus name -> list of bit indices, used to compute the bus ranges in a
+        # single pass once all of the pins have been seen
+        bus_bits = {}
         for pin_name, pin_data in macro_data["pin_data"].items():
-            result = self._bus_name_re.match(pin_name)
-            if result:
-                bus_name = result.group(1)
-                bit_num = int(result.group(2))
-                if bus_name in self._port_dict:
-                    self._port_dict[bus_name]["lsb"] = min(
-                        bit_num, self._port_dict[bus_name]["lsb"]
-                    )
-                    self._port_dict[bus_name]["msb"] = max(
-                        bit_num, self._port_dict[bus_name]["msb"]
-                    )
+            (base_name, bit_num) = self.get_parsed_name(pin_data)
+            if bit_num is not None:
+                if base_name in bus_bits:
+                    bus_bits[base_name].append(bit_num)
                 else:
-                    self._port_dict[bus_name] = {
-                        "name": bus_name,
-                        "msb": bit_num,
-                        "lsb": bit_num,
-                        "type": self.classify_pin(bus_name),
+                    bus_bits[base_name] = [bit_num]
+                    self._port_dict[base_name] = {
+                        "name": base_name,
+                        "type": self.classify_pin(base_name),
                     }
             else:
                 if pin_name in self._port_dict:  # pragma: no cover
@@ -51,19 +74,20 @@ class SSPortOrganizer:
                 if pin_type and pin_type.endswith("_bus"):
                     pin_type = None
                 self._port_dict[pin_name] = {"name": pin_name, "type": pin_type}
+        for bus_name, bits in bus_bits.items():
+            self._port_dict[bus_name]["msb"] = max(bits)
+            self._port_dict[bus_name]["lsb"] = min(bits)
 
     def classify_pin(self, pin_name):
         """
         Returns the pin classification to help identify whether the pin or bus
         is the address, data in, data out, write enable, clock or power pin or
         bus
+
+        An exact match in the pin type map wins, otherwise the longest
+        matching prefix is used
         """
-        if pin_name in self._pin_type_map:
-            return self._pin_type_map[pin_name]
-        for prefix, pin_type in self._pin_type_map.items():
-            if pin_name.startswith(prefix):
-                return pin_type
-        return None
+        return self._classifier.classify(pin_name)
 
     def organize_ports(self, macro_data):
         self._consolidate_ports(macro_data)
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 
+from nldm_model import NLDMModel
+from immutable_object import ImmutableObject
 
-class TimingData:
-    """Class to hold timing-related data used in Liberty file generation"""
+
+class TimingData(ImmutableObject):
+    """
+    Class to hold timing-related data used in Liberty file generation. It's
+    immutable once initialized (see get_derated for a changed copy)
+    """
 
     def __init__(self, json_data=None):
         """
@@ -64,10 +70,74 @@ class TimingData:
         # arbitrary (100x driver)
         self.max_load = 100 * self.min_driver_in_cap
 
+        # Optional NLDM table sizes and model coefficients (see NLDMModel). The
+        # defaults give 2x2 tables with the same value in every entry
+        self._nldm_data = dict((json_data or {}).get("nldm", {}))
+        nldm_data = dict(self._nldm_data)
+        table_size = nldm_data.pop("size", 2)
+        if isinstance(table_size, int):
+            table_size = [table_size, table_size]
+        (self.num_slew_indices, self.num_load_indices) = [
+            int(size) for size in table_size
+        ]
+        if min(self.num_slew_indices, self.num_load_indices) < 2:
+            raise Exception(f"NLDM table size must be at least 2: {table_size}")
+        self.delay_slew_sensitivity = float(
+            nldm_data.pop("delay_slew_sensitivity", 0.0)
+        )
+        self.drive_resistance_kohm = float(nldm_data.pop("drive_resistance_kohm", 0.0))
+        self.constraint_slew_sensitivity = float(
+            nldm_data.pop("constraint_slew_sensitivity", 0.0)
+        )
+        self.power_slew_sensitivity = float(
+            nldm_data.pop("power_slew_sensitivity", 0.0)
+        )
+        if nldm_data:
+            raise Exception(f"Unsupported nldm keys: {', '.join(sorted(nldm_data))}")
+
         # input pin transition with between 1xfo4 and 100xfo4
-        self.slew_indices = "%.3f, %.3f" % (self.min_slew, self.max_slew)
+        self.slew_index_values = self.get_index_values(
+            self.min_slew, self.max_slew, self.num_slew_indices
+        )
+        self.slew_indices = ", ".join("%.3f" % val for val in self.slew_index_values)
         # output capacitance table between a 1x and 32x inverter
-        self.load_indices = "%.3f, %.3f" % (self.min_load, self.max_load)
+        self.load_index_values = self.get_index_values(
+            self.min_load, self.max_load, self.num_load_indices
+        )
+        self.load_indices = ", ".join("%.3f" % val for val in self.load_index_values)
+
+        # The model only caches the formatted tables, which is safe to share
+        # between threads since a table is always formatted the same way
+        self._nldm_model = NLDMModel(self)
+        self.freeze()
+
+    @staticmethod
+    def get_index_values(min_val, max_val, num_indices):
+        """
+        Returns num_indices evenly spaced values from min_val to max_val
+        (both are exact)
+        """
+
+        fractions = [index / (num_indices - 1) for index in range(num_indices)]
+        return [(1 - fraction) * min_val + fraction * max_val for fraction in fractions]
+
+    def get_derated(self, delay_derate, leakage_derate, power_derate):
+        """Returns a new TimingData with the derated delays, leakage and power"""
+
+        json_data = {name: getattr(self, name) for name in self._asap7_defaults}
+        for name in ["t_setup_ns", "t_hold_ns", "access_time_ns", "cycle_time_ns"]:
+            json_data[name] *= delay_derate
+        json_data["standby_leakage_per_bank_mW"] *= leakage_derate
+        json_data["pin_dynamic_power_mW"] *= power_derate
+        json_data["nldm"] = dict(self._nldm_data)
+        json_data["nldm"]["drive_resistance_kohm"] = (
+            self.drive_resistance_kohm * delay_derate
+        )
+        return TimingData(json_data)
+
+    def get_default_names(self):
+        """Returns the names of the values that can be set in the JSON data"""
+        return list(self._asap7_defaults)
 
     def get_setup_time(self):
         """Returns the setup time in ns"""
@@ -146,3 +216,39 @@ class TimingData:
     def get_load_indices_str(self):
         """Returns the load indices string"""
         return self.load_indices
+
+    def get_slew_index_values(self):
+        """Returns the slew index values"""
+        return self.slew_index_values
+
+    def get_load_index_values(self):
+        """Returns the load index values"""
+        return self.load_index_values
+
+    def get_num_slew_indices(self):
+        """Returns the number of slew indices of the NLDM tables"""
+        return self.num_slew_indices
+
+    def get_num_load_indices(self):
+        """Returns the number of load indices of the NLDM tables"""
+        return self.num_load_indices
+
+    def get_delay_slew_sensitivity(self):
+        """Returns the delay sensitivity to the input slew (ns/ns)"""
+        return self.delay_slew_sensitivity
+
+    def get_drive_resistance_kohm(self):
+        """Returns the output drive resistance in kohm (ns/pF)"""
+        return self.drive_resistance_kohm
+
+    def get_constraint_slew_sensitivity(self):
+        """Returns the setup/hold sensitivity to the pin slews (ns/ns)"""
+        return self.constraint_slew_sensitivity
+
+    def get_power_slew_sensitivity(self):
+        """Returns the internal power sensitivity to the input slew (1/ns)"""
+        return self.power_slew_sensitivity
+
+    def get_nldm_model(self):
+        """Returns the NLDM table model"""
+        return self._nldm_model
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+import math
+
+from timing_data import TimingData
+
+
+class TimingModel:
+    """
+    Analytical model that scales the timing data per macro
+
+    The "timing_model" section of the config maps a TimingData value name
+    (e.g. access_time_ns) to the coefficients of a linear model over the
+    features of the macro:
+
+        const - 1
+        width - width in bits
+        depth - number of words
+        log2_depth - log2 of the number of words
+        banks - number of banks
+        column_mux - column mux factor of the process
+        bits - width x depth
+
+    For example, "access_time_ns": {"const": 0.1, "log2_depth": 0.012} gives
+    0.1 + 0.012 * log2(depth). Values without a model keep the value from the
+    config (or the default).
+
+    The coefficients are parsed once into a table with a row per feature
+    and a column per value, and evaluate() goes over the macros in a single
+    pass, skipping the features whose row is all zero.
+    """
+
+    features = ["const", "width", "depth", "log2_depth", "banks", "column_mux", "bits"]
+
+    def __init__(self, json_data=None):
+        """Initializer reads the model coefficients from the config"""
+
+        model_data = (json_data or {}).get("timing_model", {})
+        self._value_names = sorted(model_data)
+        # coefficient table: one row per feature, one column per value
+        self._coefficients = [
+            [0.0] * len(self._value_names) for feature in self.features
+        ]
+        default_names = TimingData().get_default_names()
+        for col, value_name in enumerate(self._value_names):
+            if value_name not in default_names:
+                raise Exception(f"Unsupported timing_model value: {value_name}")
+            for feature, coefficient in model_data[value_name].items():
+                if feature not in self.features:
+                    raise Exception(
+                        "Unsupported timing_model feature for {}: {} (expected one of {})".format(
+                            value_name, feature, ", ".join(self.features)
+                        )
+                    )
+                self._coefficients[self.features.index(feature)][col] = float(
+                    coefficient
+                )
+
+    def is_empty(self):
+        """Returns True if no values are modeled"""
+        return not self._value_names
+
+    def get_value_names(self):
+        """Returns the names of the modeled values"""
+        return self._value_names
+
+    @staticmethod
+    def get_features(mem_config, column_mux):
+        """Returns the feature row of the memory configuration"""
+
+        width = mem_config.get_width_in_bits()
+        depth = mem_config.get_depth()
+        return [
+            1.0,
+            width,
+            depth,
+            math.log2(depth),
+            mem_config.get_num_banks(),
+            column_mux,
+            width * depth,
+        ]
+
+    def evaluate(self, mem_configs, column_mux):
+        """
+        Returns a list with a {value name: value} dict for each memory
+        configuration
+        """
+
+        feature_rows = [
+            self.get_features(mem_config, column_mux) for mem_config in mem_configs
+        ]
+        # Only multiply by the features that have a nonzero coefficient
+        used = [
+            index
+            for index, coefficients in enumerate(self._coefficients)
+            if any(coefficients)
+        ]
+        results = []
+        for mem_config, row in zip(mem_configs, feature_rows):
+            values = [0.0] * len(self._value_names)
+            for index in used:
+                feature = row[index]
+                for col, coefficient in enumerate(self._coefficients[index]):
+                    values[col] += feature * coefficient
+            for value_name, value in zip(self._value_names, values):
+                # 0 is a valid value, e.g. for a hold time
+                if value < 0:
+                    raise Exception(
+                        "timing_model gives {} = {} for {}".format(
+                            value_name, value, mem_config.get_name()
+                        )
+                    )
+            results.append(dict(zip(self._value_names, values)))
+        return results
+
+    def create_timing_data(self, json_data, mem_configs, column_mux):
+        """
+        Returns a list with the TimingData of each memory configuration. If
+        nothing is modeled, all of them share one TimingData
+        """
+
+        if self.is_empty():
+            timing_data = TimingData(json_data)
+            return [timing_data] * len(mem_configs)
+        timing_data_list = []
+        for values in self.evaluate(mem_configs, column_mux):
+            macro_data = dict(json_data or {})
+            macro_data.update(values)
+            timing_data_list.append(TimingData(macro_data))
+        return timing_data_list
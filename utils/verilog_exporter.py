@@ -11,21 +11,26 @@ class VerilogExporter(Exporter):
     definition when using Verific. yosys-slang doesn't require the definition.
     """
 
-    def __init__(self, memory):
-        """Initializer"""
+    def __init__(self, memory, sparse=False):
+        """
+        Initializer. If sparse is set, the memory array is a SystemVerilog
+        associative array (see VerilogOptions), which is only written to the
+        separate sparse model file since it isn't Verilog-2005
+        """
 
         Exporter.__init__(self, memory)
+        self._sparse = sparse
 
     def export_file(self, file_name, is_blackbox=False):
         """
-        Exports the verilog content to a file.
+        Exports the verilog content to a file and returns its size in bytes
+        and SHA-256 hex digest.
 
         If is_blackbox, only write the port definitions. Otherwise, write the
         full RTL
         """
 
-        with open(file_name, "w") as out_fh:
-            self.export(out_fh, is_blackbox)
+        return Exporter.export_file(self, file_name, is_blackbox)
 
     def export(self, out_fh, is_blackbox=False):
         """
@@ -40,6 +45,42 @@ class VerilogExporter(Exporter):
             self.export_module(out_fh)
 
     # -------------- Utilities --------------
+    def is_fast_sim(self):
+        """Returns True if the lean fast-sim model should be written"""
+        return self.get_memory().get_verilog_options().is_fast_sim()
+
+    def get_always_keyword(self):
+        """Returns the keyword used for the clocked processes"""
+        return "always_ff" if self.is_fast_sim() else "always"
+
+    def use_sparse_model(self):
+        """
+        Returns True if the memory array is a SystemVerilog associative array
+        (see the initializer)
+        """
+        return self._sparse
+
+    def get_memory_write(self, addr_name, data_name):
+        """
+        Returns the statement that writes a word. Writes to an unknown address
+        are ignored, which the sparse model has to check explicitly since an
+        unknown address would be converted to 0 for the int index
+        """
+
+        if self.use_sparse_model():
+            return f"if (^{addr_name} !== 1'bx) mem[{addr_name}] <= {data_name};"
+        return f"mem[{addr_name}] <= {data_name};"
+
+    def get_memory_read(self, addr_name):
+        """
+        Returns the expression that reads a word. The sparse model reads X for
+        an unknown address or a word that hasn't been written
+        """
+
+        if self.use_sparse_model():
+            return f"((^{addr_name} === 1'bx) || !mem.exists({addr_name})) ? 'x : mem[{addr_name}]"
+        return f"mem[{addr_name}]"
+
     def write_module_header(self, out_fh):
         """Writes the module header"""
 
@@ -58,10 +99,22 @@ class VerilogExporter(Exporter):
             self.write_rw_port_defn_set(rw_port_group, out_fh)
         self.write_misc_defn_set(mem, out_fh)
         out_fh.write("\n")
+        self.write_memory_array(out_fh)
+
+    def write_memory_array(self, out_fh):
+        """Writes the memory array declaration"""
+
+        mem = self.get_memory()
         out_fh.write(
             f"    // Memory array: {mem.get_depth()} words of {mem.get_width()} bits\n"
         )
-        out_fh.write("    reg [DATA_WIDTH-1:0] mem [0:(1 << ADDR_WIDTH)-1];\n")
+        if self.use_sparse_model():
+            out_fh.write(
+                "    // Sparse (SystemVerilog associative) array: only written words are allocated\n"
+            )
+            out_fh.write("    reg [DATA_WIDTH-1:0] mem [int];\n")
+        else:
+            out_fh.write("    reg [DATA_WIDTH-1:0] mem [0:(1 << ADDR_WIDTH)-1];\n")
         out_fh.write("\n")
 
     def write_always(self, out_fh):
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+
+class VerilogOptions:
+    """
+    Class to hold the options that control the generated Verilog model
+
+    x_corruption_style - how the single port RAM model corrupts the array
+                         when the write enable or address is unknown:
+                             loop - writes X into every word (O(depth) per
+                                    event)
+                             generation - advances a generation counter and
+                                          reads words written before the
+                                          event as X (O(1) per event)
+    sparse_model_threshold_bits - memories with at least this many bits
+                                  (depth x width) also get a SystemVerilog
+                                  model backed by an associative array,
+                                  <name>_sparse.sv, so the simulator only
+                                  allocates the words that are written. The
+                                  <name>.v model stays Verilog-2005. 0
+                                  (default) disables it
+    verilog_flavor - the style of the whole model:
+                         default - four-state model with X corruption and
+                                   timing check placeholders
+                         fast-sim - lean model for cycle-based simulators
+                                    such as Verilator: always_ff processes,
+                                    no X corruption, no X reads and no
+                                    specify block. The sparse model isn't
+                                    used with it
+    """
+
+    x_corruption_styles = ["loop", "generation"]
+    verilog_flavors = ["default", "fast-sim"]
+
+    def __init__(self, json_data=None):
+        """
+        Initializer sets the options if they are defined in the JSON data
+        passed in. Otherwise, the defaults are used
+        """
+
+        json_data = json_data or {}
+        self._x_corruption_style = str(json_data.get("x_corruption_style", "loop"))
+        if self._x_corruption_style not in self.x_corruption_styles:
+            raise Exception(
+                "Unsupported x_corruption_style: {} (expected one of {})".format(
+                    self._x_corruption_style, ", ".join(self.x_corruption_styles)
+                )
+            )
+        self._sparse_model_threshold_bits = int(
+            json_data.get("sparse_model_threshold_bits", 0)
+        )
+        self._verilog_flavor = str(json_data.get("verilog_flavor", "default"))
+        if self._verilog_flavor not in self.verilog_flavors:
+            raise Exception(
+                "Unsupported verilog_flavor: {} (expected one of {})".format(
+                    self._verilog_flavor, ", ".join(self.verilog_flavors)
+                )
+            )
+
+    def get_x_corruption_style(self):
+        """Returns the X corruption style"""
+        return self._x_corruption_style
+
+    def get_sparse_model_threshold_bits(self):
+        """Returns the sparse model threshold in bits (0 if disabled)"""
+        return self._sparse_model_threshold_bits
+
+    def use_sparse_model(self, depth, width_in_bits):
+        """Returns True if the memory should use the sparse model"""
+
+        if self.is_fast_sim():
+            return False
+        threshold = self._sparse_model_threshold_bits
+        return threshold > 0 and depth * width_in_bits >= threshold
+
+    def get_verilog_flavor(self):
+        """Returns the Verilog model flavor"""
+        return self._verilog_flavor
+
+    def is_fast_sim(self):
+        """Returns True if the lean fast-sim model should be written"""
+        return self._verilog_flavor == "fast-sim"
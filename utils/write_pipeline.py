@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import collections
+
+from profiler import Profiler
+
+
+class WritePipeline:
+    """
+    Runs the write stage of the generation on a small pool of writer
+    threads, so that writing the files of a memory overlaps with creating
+    and rendering the next ones (see BatchRunner.run)
+
+    Each write is a function that returns a result. At most max_pending
+    writes are queued or running at once: submitting another one first waits
+    for the oldest to finish, which keeps the rendered contents held in
+    memory bounded. The results are returned in the order the writes were
+    submitted. With no writer threads, each write is done when it's
+    submitted.
+
+    The number of writes pending when each one is submitted is recorded as
+    the depth of the queue (see Profiler.record_queue_depth).
+    """
+
+    def __init__(self, num_writers=2, max_pending=None, queue_name="write"):
+        """Initializer"""
+
+        self._num_writers = max(0, num_writers)
+        self._max_pending = max_pending or 2 * max(1, self._num_writers)
+        self._queue_name = queue_name
+        self._pending = collections.deque()
+        self._executor = None
+
+    def __enter__(self):
+        if self._num_writers:
+            # Imported here, like the executors of BatchRunner.run
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._num_writers, thread_name_prefix="writer"
+            )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(exc_type is not None)
+
+    def get_num_writers(self):
+        """Returns the number of writer threads"""
+        return self._num_writers
+
+    def get_max_pending(self):
+        """Returns the maximum number of writes queued or running at once"""
+        return self._max_pending
+
+    def submit(self, write_fn):
+        """
+        Queues write_fn and returns the results of the writes that had to
+        finish to make room for it, in order
+        """
+
+        Profiler.record_queue_depth(self._queue_name, len(self._pending))
+        if self._executor is None:
+            return [write_fn()]
+        results = []
+        while len(self._pending) >= self._max_pending:
+            results.append(self._pending.popleft().result())
+        self._pending.append(self._executor.submit(write_fn))
+        return results
+
+    def drain(self):
+        """Yields the results of the pending writes, in order"""
+
+        while self._pending:
+            yield self._pending.popleft().result()
+
+    def close(self, cancel=False):
+        """
+        Stops the writer threads after the pending writes, or after the
+        running ones if cancel is set (e.g. after an error)
+        """
+
+        if cancel:
+            for future in self._pending:
+                future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None